@@ -100,6 +100,63 @@ options:
     type: str
     default: WARN
     choices: [ERROR, WARN, INFO, DEBUG]
+  auth_cache:
+    description:
+      - Whether to keep the Keystone token and service catalog in an
+        encrypted on-disk cache and reuse them in subsequent tasks instead
+        of authenticating on every task.
+      - Tokens are reused until they are about to expire and are dropped
+        when the cloud rejects them.
+      - Requires the C(cryptography) python library.
+      - The result contains C(otc_auth_cache) with C(hit) or C(miss).
+    type: bool
+    default: false
+  auth_cache_path:
+    description:
+      - Directory of the auth cache.
+      - Defaults to C(~/.cache/opentelekomcloud/auth).
+    type: path
+  auth_cache_key:
+    description:
+      - Passphrase to encrypt the auth cache entries with.
+      - If omitted, a random key is generated and stored in
+        C(~/.config/opentelekomcloud/auth_cache.key), apart from the cache
+        entries.
+    type: str
+  broker:
+    description:
+      - Whether to send all API requests through a local connection broker
+        process, which keeps HTTP connections, TLS sessions and Keystone
+        tokens alive across tasks and hosts.
+      - The broker is started by the first task using it and stops after
+        I(broker_idle_timeout) seconds without requests.
+      - Requests are sent directly when the broker is not reachable.
+    type: bool
+    default: false
+  broker_socket:
+    description:
+      - Path of the Unix socket of the connection broker.
+      - Defaults to C(otc-broker-<uid>/broker.sock) in the temporary
+        directory.
+    type: path
+  broker_idle_timeout:
+    description:
+      - Seconds without requests after which the connection broker stops.
+    type: int
+    default: 300
+  api_trace:
+    description:
+      - Whether to record every API call (method, service, URL template,
+        status, response size and latency) and the time spent in wait
+        loops.
+      - The result contains a compact C(otc_timing) summary.
+    type: bool
+    default: false
+  api_trace_file:
+    description:
+      - Path of a JSON-lines file the API call and wait loop records are
+        appended to. Enables I(api_trace).
+    type: path
 requirements:
   - python >= 3.6
   - openstacksdk >= 0.36.0
@@ -113,3 +170,77 @@ notes:
     plays. More information can be found at
     U(https://docs.openstack.org/openstacksdk/)
 '''
+
+    # Options of info modules
+    INFO = r'''
+options:
+  fields:
+    description:
+      - Attributes of the returned resources, all attributes are returned
+        by default.
+      - Only the listed attributes are read from the resources.
+    type: list
+    elements: str
+  exclude_fields:
+    description:
+      - Attributes left out of the returned resources.
+    type: list
+    elements: str
+  limit:
+    description:
+      - Number of resources requested per page.
+      - Only passed on to APIs paging with markers.
+    type: int
+  marker:
+    description:
+      - ID of the last resource of the previous page, listing starts after
+        it.
+      - APIs not paging with markers are listed from the start and the
+        resources up to the marker are skipped. The module fails if the
+        marker is not listed.
+    type: str
+  max_items:
+    description:
+      - Stop listing after this number of resources. The ID of the last
+        returned resource is returned as C(next_marker) to continue from
+        with I(marker).
+    type: int
+  output_file:
+    description:
+      - Path of a local file the listed resources are written to, one JSON
+        object per line, while they are listed. Paths ending with C(.gz)
+        are gzip compressed.
+      - The result then contains C(output_file) with C(path), C(count) and
+        C(checksum) of the file instead of the resources.
+    type: path
+'''
+
+    # Options of info modules returning a single resource or not listing
+    # resources page by page
+    PROJECTION = r'''
+options:
+  fields:
+    description:
+      - Attributes of the returned resources, all attributes are returned
+        by default.
+      - Only the listed attributes are read from the resources.
+    type: list
+    elements: str
+  exclude_fields:
+    description:
+      - Attributes left out of the returned resources.
+    type: list
+    elements: str
+'''
+
+    # Output file option of info modules not listing page by page
+    OUTPUT = r'''
+options:
+  output_file:
+    description:
+      - Path of a local file the returned resources are written to, one
+        JSON object per line. Paths ending with C(.gz) are gzip compressed.
+      - The result then contains C(output_file) with C(path), C(count) and
+        C(checksum) of the file instead of the resources.
+    type: path
+'''
@@ -0,0 +1,212 @@
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import base64
+import contextlib
+import fcntl
+import hashlib
+import os
+import tempfile
+
+try:
+    from cryptography.fernet import Fernet, InvalidToken
+    HAS_CRYPTOGRAPHY = True
+except ImportError:
+    HAS_CRYPTOGRAPHY = False
+
+from ansible.module_utils.common.text.converters import to_bytes, to_text
+
+DEFAULT_CACHE_PATH = os.path.join('~', '.cache', 'opentelekomcloud', 'auth')
+# The generated key is kept apart from the entries it encrypts
+DEFAULT_KEY_FILE = os.path.join('~', '.config', 'opentelekomcloud',
+                                'auth_cache.key')
+KEY_SIZE = 32
+# Cached tokens are not reused when they expire within this many seconds.
+DEFAULT_EXPIRY_MARGIN = 300
+
+
+def cache_id(conn):
+    """Identifier of the credentials and endpoint set of a connection."""
+    config = conn.config
+    elements = [
+        conn.session.auth.get_cache_id() or '',
+        config.name or '',
+        config.region_name or '',
+        config.config.get('interface') or '',
+    ]
+    return hashlib.sha256(to_bytes('\n'.join(elements))).hexdigest()
+
+
+class AuthCache:
+    """Encrypted on-disk cache of the Keystone authentication state.
+
+    The state returned by the keystoneauth plugin contains the token and the
+    token body, so the service catalog is cached together with the token.
+    Entries are keyed by the auth plugin cache id (auth url, user, project,
+    domain and credentials) plus the cloud name, region and interface.
+    Access to a single entry is serialized with an exclusive file lock, so
+    concurrent forks wait for the first one to authenticate and then reuse
+    its token instead of authenticating in parallel.
+
+    Args:
+        path: Directory where cache entries are stored.
+        key: Passphrase used to encrypt entries. A random key is generated
+            and stored in `key_file` if it is not provided.
+        key_file: File of the generated key, outside of the cache directory.
+        margin: Seconds before expiration when a token is considered stale.
+    """
+
+    def __init__(self, path=None, key=None, margin=DEFAULT_EXPIRY_MARGIN,
+                 key_file=None):
+        self.path = os.path.expanduser(path or DEFAULT_CACHE_PATH)
+        self.key = key
+        self.key_file = os.path.expanduser(key_file or DEFAULT_KEY_FILE)
+        self.margin = margin
+        self._cipher = None
+        self.status = None
+        self._entry = None
+        self._state = None
+
+    def load(self, conn):
+        """Install a cached auth state into the connection or authenticate.
+
+        Arguments:
+            conn {openstack.connection.Connection} -- Fresh connection.
+
+        Returns:
+            status {str} -- `hit` if a cached token was reused, `miss`
+                            otherwise.
+        """
+        self._entry = self._locate(cache_id(conn))
+        auth = conn.session.auth
+        with self._locked():
+            state = self._read()
+            if state:
+                try:
+                    auth.set_auth_state(state)
+                except (ValueError, KeyError, TypeError):
+                    auth.set_auth_state(None)
+                if (auth.auth_ref is None
+                        or auth.auth_ref.will_expire_soon(self.margin)):
+                    auth.set_auth_state(None)
+            if auth.auth_ref is not None:
+                self.status = 'hit'
+            else:
+                self.status = 'miss'
+                conn.authorize()
+                self._write(auth.get_auth_state())
+        self._state = auth.get_auth_state()
+        return self.status
+
+    def save(self, conn):
+        """Persist the auth state if it changed since `load`.
+
+        keystoneauth invalidates the token and re-authenticates once when a
+        request gets 401, in which case the new token replaces the entry.
+        """
+        if self._entry is None:
+            return
+        state = conn.session.auth.get_auth_state()
+        if state == self._state:
+            return
+        with self._locked():
+            if state:
+                self._write(state)
+            else:
+                self._remove()
+        self._state = state
+
+    def invalidate(self):
+        """Drop the cache entry, i.e. after the cached token was rejected."""
+        if self._entry is None:
+            return
+        with self._locked():
+            self._remove()
+        self._state = None
+
+    def _locate(self, entry_id):
+        os.makedirs(self.path, mode=0o700, exist_ok=True)
+        return os.path.join(self.path, entry_id)
+
+    @contextlib.contextmanager
+    def _locked(self):
+        with open(self._entry + '.lock', 'a') as lock:
+            fcntl.flock(lock, fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                fcntl.flock(lock, fcntl.LOCK_UN)
+
+    def _fernet(self):
+        if self._cipher is None:
+            if self.key:
+                secret = hashlib.sha256(to_bytes(self.key)).digest()
+            else:
+                secret = self._generated_key()
+            self._cipher = Fernet(base64.urlsafe_b64encode(secret))
+        return self._cipher
+
+    def _generated_key(self):
+        """Key of the key file, created on first use.
+
+        The key is written to a temporary file which is linked into place,
+        so concurrent forks either create the complete file or read the one
+        created by another fork, never a partially written one.
+        """
+        try:
+            return self._read_key()
+        except FileNotFoundError:
+            pass
+        directory = os.path.dirname(self.key_file)
+        os.makedirs(directory, mode=0o700, exist_ok=True)
+        fd, tmp = tempfile.mkstemp(dir=directory, prefix='.key')
+        with os.fdopen(fd, 'wb') as f:
+            f.write(os.urandom(KEY_SIZE))
+        try:
+            os.link(tmp, self.key_file)
+        except FileExistsError:
+            pass
+        finally:
+            os.remove(tmp)
+        return self._read_key()
+
+    def _read_key(self):
+        with open(self.key_file, 'rb') as f:
+            secret = f.read()
+        if len(secret) != KEY_SIZE:
+            raise ValueError('Invalid auth cache key file %s' % self.key_file)
+        return secret
+
+    def _read(self):
+        try:
+            with open(self._entry, 'rb') as f:
+                data = f.read()
+        except (IOError, OSError):
+            return None
+        try:
+            return to_text(self._fernet().decrypt(data))
+        except (InvalidToken, UnicodeDecodeError):
+            # Entry written with another key or corrupted, treat as missing
+            return None
+
+    def _write(self, state):
+        tmp = self._entry + '.tmp'
+        fd = os.open(tmp, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+        with os.fdopen(fd, 'wb') as f:
+            f.write(self._fernet().encrypt(to_bytes(state)))
+        os.rename(tmp, self._entry)
+
+    def _remove(self):
+        try:
+            os.remove(self._entry)
+        except OSError:
+            pass
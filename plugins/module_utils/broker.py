@@ -0,0 +1,484 @@
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Local connection broker sharing HTTP sessions and tokens across tasks.
+
+Ansible runs every task in a new process, so keep-alive connections and TLS
+sessions of the SDK are thrown away after each task. The broker is a small
+daemon listening on a Unix socket. Modules mount `BrokerAdapter` on the
+requests session of the SDK connection, which forwards every HTTP request to
+the broker where it is executed with a long living, pooled requests session.
+The broker also keeps Keystone auth states in memory (see
+`BrokerAuthCache`), so tasks and forks reuse tokens and the service catalog.
+
+The broker is started on demand by the first module using it and exits after
+being idle for `idle_timeout` seconds. Messages are JSON documents prefixed
+with their length as a 4 byte big-endian integer. Requests with streamed
+bodies or responses are not forwarded but sent directly.
+"""
+
+import base64
+import contextlib
+import fcntl
+import json
+import os
+import socket
+import socketserver
+import struct
+import tempfile
+import threading
+import time
+
+from http import cookiejar
+
+import requests
+from requests.adapters import BaseAdapter, HTTPAdapter
+from requests.structures import CaseInsensitiveDict
+from requests.utils import get_encoding_from_headers
+
+from ansible_collections.opentelekomcloud.cloud.plugins.module_utils.auth_cache import (
+    AuthCache
+)
+
+DEFAULT_IDLE_TIMEOUT = 300
+# Seconds to wait for a freshly spawned broker to accept connections
+SPAWN_TIMEOUT = 10
+POOL_SIZE = 32
+# Seconds a client waits for the lock of an auth cache entry
+LOCK_TIMEOUT = 60
+# Methods which may be sent again if the broker went away before answering
+IDEMPOTENT_METHODS = frozenset(['GET', 'HEAD', 'OPTIONS'])
+
+_HEADER = struct.Struct('!I')
+
+
+def default_socket_path():
+    return os.path.join(
+        tempfile.gettempdir(), 'otc-broker-%d' % os.getuid(), 'broker.sock')
+
+
+class BrokerError(OSError):
+    """The broker is not reachable or returned a malformed answer."""
+
+
+class BrokerDisconnected(BrokerError):
+    """The broker went away after a message was sent to it.
+
+    The operation may or may not have been executed.
+    """
+
+
+class _NoCookies(cookiejar.DefaultCookiePolicy):
+    """Cookie policy of the shared session, which serves many tenants."""
+
+    def set_ok(self, cookie, request):
+        return False
+
+    def return_ok(self, cookie, request):
+        return False
+
+
+def _send(sock, message):
+    data = json.dumps(message).encode('utf-8')
+    sock.sendall(_HEADER.pack(len(data)) + data)
+
+
+def _recv_exact(sock, size):
+    chunks = []
+    while size:
+        chunk = sock.recv(min(size, 1 << 20))
+        if not chunk:
+            raise BrokerError('Connection closed by peer')
+        chunks.append(chunk)
+        size -= len(chunk)
+    return b''.join(chunks)
+
+
+def _recv(sock):
+    size, = _HEADER.unpack(_recv_exact(sock, _HEADER.size))
+    return json.loads(_recv_exact(sock, size).decode('utf-8'))
+
+
+class _Handler(socketserver.BaseRequestHandler):
+
+    def handle(self):
+        server = self.server
+        held = set()
+        server.touch(1)
+        try:
+            while True:
+                try:
+                    message = _recv(self.request)
+                except (BrokerError, OSError, ValueError):
+                    break
+                server.touch()
+                op = message.get('op')
+                try:
+                    if op == 'request':
+                        answer = server.forward(message)
+                    elif op == 'acquire':
+                        if server.lock(message['id']).acquire(
+                                timeout=LOCK_TIMEOUT):
+                            held.add(message['id'])
+                            answer = {}
+                        else:
+                            answer = {'error': 'BrokerError',
+                                      'msg': 'Timeout waiting for lock of %s'
+                                             % message['id']}
+                    elif op == 'release':
+                        if message['id'] in held:
+                            held.discard(message['id'])
+                            server.lock(message['id']).release()
+                        answer = {}
+                    elif op == 'get_auth':
+                        answer = {'state': server.auth.get(message['id'])}
+                    elif op == 'put_auth':
+                        if message.get('state'):
+                            server.auth[message['id']] = message['state']
+                        else:
+                            server.auth.pop(message['id'], None)
+                        answer = {}
+                    elif op == 'ping':
+                        answer = {'pid': os.getpid()}
+                    else:
+                        answer = {'error': 'BrokerError',
+                                  'msg': 'Unknown operation %s' % op}
+                except requests.RequestException as e:
+                    answer = {'error': type(e).__name__, 'msg': str(e)}
+                except Exception as e:
+                    # Keep serving the client, i.e. after a malformed message
+                    answer = {'error': 'BrokerError',
+                              'msg': '%s: %s' % (type(e).__name__, e)}
+                _send(self.request, answer)
+        finally:
+            # Locks of a client that went away must not block others
+            for entry_id in held:
+                server.lock(entry_id).release()
+            server.touch(-1)
+
+
+class BrokerServer(socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
+    """Unix socket server executing HTTP requests with a pooled session.
+
+    Args:
+        path: Path of the Unix socket.
+        idle_timeout: Seconds without clients after which the server stops.
+    """
+
+    daemon_threads = True
+
+    def __init__(self, path, idle_timeout=DEFAULT_IDLE_TIMEOUT):
+        self.path = path
+        self.idle_timeout = idle_timeout
+        self.auth = {}
+        self.session = requests.Session()
+        # Cookies of one client must never be sent with requests of another
+        self.session.cookies.set_policy(_NoCookies())
+        adapter = HTTPAdapter(pool_connections=POOL_SIZE,
+                              pool_maxsize=POOL_SIZE)
+        self.session.mount('https://', adapter)
+        self.session.mount('http://', adapter)
+        self._locks = {}
+        self._state_lock = threading.Lock()
+        self._clients = 0
+        self._last_activity = time.monotonic()
+        old_umask = os.umask(0o177)
+        try:
+            socketserver.UnixStreamServer.__init__(self, path, _Handler)
+        finally:
+            os.umask(old_umask)
+
+    def touch(self, clients=0):
+        with self._state_lock:
+            self._clients += clients
+            self._last_activity = time.monotonic()
+
+    def lock(self, entry_id):
+        with self._state_lock:
+            return self._locks.setdefault(entry_id, threading.Lock())
+
+    def forward(self, message):
+        cert = message.get('cert')
+        timeout = message.get('timeout')
+        response = self.session.request(
+            message['method'], message['url'],
+            headers=message.get('headers'),
+            data=base64.b64decode(message['body'])
+            if message.get('body') else None,
+            timeout=tuple(timeout) if isinstance(timeout, list) else timeout,
+            verify=message.get('verify', True),
+            cert=tuple(cert) if isinstance(cert, list) else cert,
+            allow_redirects=False)
+        # The body is already decoded, so the headers have to match it
+        headers = dict(response.headers)
+        for name in ('Content-Encoding', 'Transfer-Encoding'):
+            headers.pop(name, None)
+        if 'Content-Length' in headers:
+            headers['Content-Length'] = str(len(response.content))
+        return {
+            'status': response.status_code,
+            'reason': response.reason,
+            'url': response.url,
+            'headers': headers,
+            'body': base64.b64encode(response.content).decode('ascii'),
+        }
+
+    def _watchdog(self):
+        while True:
+            time.sleep(min(5, self.idle_timeout))
+            with self._state_lock:
+                idle = time.monotonic() - self._last_activity
+                if self._clients == 0 and idle >= self.idle_timeout:
+                    break
+        self.shutdown()
+
+    def serve(self):
+        """Serve until the server was idle for `idle_timeout`."""
+        threading.Thread(target=self._watchdog, daemon=True).start()
+        try:
+            self.serve_forever(poll_interval=0.5)
+        finally:
+            self.server_close()
+            try:
+                os.remove(self.path)
+            except OSError:
+                pass
+
+
+def _daemonize(path, idle_timeout):
+    """Start the broker in a detached grandchild process."""
+    pid = os.fork()
+    if pid:
+        os.waitpid(pid, 0)
+        return
+    try:
+        os.setsid()
+        if os.fork():
+            os._exit(0)
+        # Ansible waits for the module output pipes to be closed
+        devnull = os.open(os.devnull, os.O_RDWR)
+        for fd in (0, 1, 2):
+            os.dup2(devnull, fd)
+        os.chdir('/')
+        server = BrokerServer(path, idle_timeout)
+        server.serve()
+    finally:
+        os._exit(0)
+
+
+class BrokerClient:
+    """Client side of the broker, one socket connection per thread.
+
+    Args:
+        path: Path of the broker Unix socket.
+        idle_timeout: Idle timeout of a broker started by `ensure_running`.
+    """
+
+    def __init__(self, path=None, idle_timeout=DEFAULT_IDLE_TIMEOUT):
+        self.path = os.path.expanduser(path or default_socket_path())
+        self.idle_timeout = idle_timeout
+        self._local = threading.local()
+
+    def _connect(self):
+        sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        try:
+            sock.connect(self.path)
+        except OSError:
+            sock.close()
+            raise
+        return sock
+
+    def call(self, op, idempotent=True, **kwargs):
+        """Send an operation to the broker and return its answer.
+
+        The operation is sent again on a new connection if the previous
+        connection failed before the operation was sent completely. If the
+        broker went away after that, it is only sent again if it is
+        `idempotent`, otherwise BrokerDisconnected is raised.
+        """
+        kwargs['op'] = op
+        sock = getattr(self._local, 'sock', None)
+        for attempt in (0, 1):
+            sent = False
+            try:
+                if sock is None:
+                    sock = self._local.sock = self._connect()
+                _send(sock, kwargs)
+                sent = True
+                return _recv(sock)
+            except (OSError, ValueError) as e:
+                self.close()
+                sock = None
+                if sent and not idempotent:
+                    raise BrokerDisconnected(str(e))
+                if attempt:
+                    raise BrokerError(str(e))
+
+    def close(self):
+        sock = getattr(self._local, 'sock', None)
+        if sock is not None:
+            self._local.sock = None
+            sock.close()
+
+    def ensure_running(self):
+        """Start the broker unless it is already listening."""
+        try:
+            self.call('ping')
+            return
+        except BrokerError:
+            pass
+        directory = os.path.dirname(self.path)
+        os.makedirs(directory, mode=0o700, exist_ok=True)
+        with open(self.path + '.lock', 'a') as lock:
+            fcntl.flock(lock, fcntl.LOCK_EX)
+            try:
+                try:
+                    self.call('ping')
+                    return
+                except BrokerError:
+                    pass
+                # A stale socket of a killed broker prevents binding
+                if os.path.exists(self.path):
+                    os.remove(self.path)
+                _daemonize(self.path, self.idle_timeout)
+                deadline = time.monotonic() + SPAWN_TIMEOUT
+                while True:
+                    try:
+                        self.call('ping')
+                        return
+                    except BrokerError:
+                        if time.monotonic() > deadline:
+                            raise
+                        time.sleep(0.05)
+            finally:
+                fcntl.flock(lock, fcntl.LOCK_UN)
+
+
+class BrokerAdapter(BaseAdapter):
+    """requests transport adapter forwarding requests to the broker.
+
+    Requests are sent directly when the broker is not reachable, so a broker
+    stopping due to its idle timeout never fails a task. A request which
+    reached the broker is never sent a second time unless its method is
+    idempotent. Streamed requests and requests with a body other than bytes
+    or text (i.e. files or memory views) are sent directly, since the
+    broker buffers bodies.
+    """
+
+    _errors = {
+        'ConnectTimeout': requests.exceptions.ConnectTimeout,
+        'ReadTimeout': requests.exceptions.ReadTimeout,
+        'Timeout': requests.exceptions.Timeout,
+        'SSLError': requests.exceptions.SSLError,
+        'ProxyError': requests.exceptions.ProxyError,
+        'ConnectionError': requests.exceptions.ConnectionError,
+    }
+
+    def __init__(self, client):
+        super(BrokerAdapter, self).__init__()
+        self.client = client
+        self._direct = None
+
+    def _send_direct(self, request, stream, timeout, verify, cert, proxies):
+        if self._direct is None:
+            self._direct = HTTPAdapter()
+        return self._direct.send(
+            request, stream=stream, timeout=timeout, verify=verify,
+            cert=cert, proxies=proxies)
+
+    def send(self, request, stream=False, timeout=None, verify=True,
+             cert=None, proxies=None):
+        body = request.body
+        if stream or not (body is None or isinstance(body, (bytes, str))):
+            return self._send_direct(request, stream, timeout, verify, cert,
+                                     proxies)
+        if isinstance(body, str):
+            body = body.encode('utf-8')
+        try:
+            answer = self.client.call(
+                'request', idempotent=request.method in IDEMPOTENT_METHODS,
+                method=request.method, url=request.url,
+                headers=dict(request.headers),
+                body=base64.b64encode(body).decode('ascii') if body else None,
+                timeout=list(timeout) if isinstance(timeout, tuple)
+                else timeout,
+                verify=verify, cert=cert)
+        except BrokerDisconnected as e:
+            # The request may have been executed already
+            raise requests.exceptions.ConnectionError(
+                'Connection broker went away: %s' % e, request=request)
+        except BrokerError:
+            return self._send_direct(request, stream, timeout, verify, cert,
+                                     proxies)
+        if 'error' in answer:
+            error = self._errors.get(
+                answer['error'], requests.exceptions.RequestException)
+            raise error(answer['msg'], request=request)
+        return self.build_response(request, answer)
+
+    def build_response(self, request, answer):
+        response = requests.Response()
+        response.status_code = answer['status']
+        response.reason = answer['reason']
+        response.headers = CaseInsensitiveDict(answer['headers'])
+        response.encoding = get_encoding_from_headers(response.headers)
+        response.url = answer['url']
+        response.request = request
+        response.connection = self
+        response._content = base64.b64decode(answer['body'])
+        response._content_consumed = True
+        return response
+
+    def close(self):
+        self.client.close()
+        if self._direct is not None:
+            self._direct.close()
+
+
+class BrokerAuthCache(AuthCache):
+    """AuthCache keeping the auth states in the broker memory."""
+
+    def __init__(self, client, margin=None):
+        super(BrokerAuthCache, self).__init__()
+        if margin is not None:
+            self.margin = margin
+        self.client = client
+
+    def _locate(self, entry_id):
+        return entry_id
+
+    @contextlib.contextmanager
+    def _locked(self):
+        answer = self.client.call('acquire', id=self._entry)
+        if 'error' in answer:
+            raise BrokerError(answer['msg'])
+        try:
+            yield
+        finally:
+            self.client.call('release', id=self._entry)
+
+    def _read(self):
+        return self.client.call('get_auth', id=self._entry).get('state')
+
+    def _write(self, state):
+        self.client.call('put_auth', id=self._entry, state=state)
+
+    def _remove(self):
+        self.client.call('put_auth', id=self._entry, state=None)
+
+
+def attach(conn, client):
+    """Route all HTTP requests of the connection through the broker."""
+    adapter = BrokerAdapter(client)
+    conn.session.session.mount('https://', adapter)
+    conn.session.session.mount('http://', adapter)
+    return adapter
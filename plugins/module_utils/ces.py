@@ -0,0 +1,321 @@
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Time windows, merging and rollups of Cloud Eye metric data.
+
+Cloud Eye returns a limited number of datapoints per query, long ranges are
+split into windows which are queried independently. The datapoints of all
+windows are merged by timestamp and can be rolled up into fixed intervals.
+Series can be cached on disk, so repeated queries only fetch datapoints
+newer than the cached ones.
+"""
+
+import bisect
+import hashlib
+import json
+import math
+import os
+import sys
+import time
+
+from array import array
+
+# Datapoints returned by a single query
+MAX_DATAPOINTS = 3000
+# Seconds between raw datapoints (period 1)
+RAW_INTERVAL = 60
+
+ROLLUPS = ('min', 'max', 'avg', 'p95')
+
+DEFAULT_CACHE_PATH = os.path.join('~', '.cache', 'opentelekomcloud', 'ces')
+# Seconds cached datapoints are kept
+DEFAULT_CACHE_TTL = 30 * 86400
+_CACHE_VERSION = 1
+
+# Keys of the value of a datapoint per filter, as returned by the API and
+# as named by the SDK resource
+_VALUE_KEYS = {
+    'average': ('average',),
+    'max': ('max', 'maximum'),
+    'min': ('min', 'minimum'),
+    'sum': ('sum', 'sumspec'),
+    'variance': ('variance',),
+}
+
+
+def split_range(time_from, time_to, period, window=None):
+    """Split a time range into windows of at most MAX_DATAPOINTS points.
+
+    Arguments:
+        time_from {int} -- Start in milliseconds.
+        time_to {int} -- End in milliseconds.
+        period {int} -- Granularity in seconds, 1 for raw data.
+        window {int} -- Window length in seconds, computed by default.
+
+    Returns:
+        list of (from, to) tuples in milliseconds covering the range.
+    """
+    if not window:
+        window = MAX_DATAPOINTS * (RAW_INTERVAL if period == 1 else period)
+    step = window * 1000
+    windows = []
+    start = time_from
+    while start < time_to:
+        end = min(start + step, time_to)
+        windows.append((start, end))
+        start = end
+    return windows or [(time_from, time_to)]
+
+
+def merge_datapoints(*chunks):
+    """Datapoints of all chunks in time order, one per timestamp."""
+    merged = {}
+    for chunk in chunks:
+        for point in chunk or []:
+            merged[point['timestamp']] = point
+    return [merged[timestamp] for timestamp in sorted(merged)]
+
+
+def point_value(point, filter_name):
+    """Value of a datapoint for the rollup method of the query."""
+    for key in _VALUE_KEYS.get(filter_name, (filter_name,)):
+        if point.get(key) is not None:
+            return point[key]
+    return None
+
+
+def _percentile(values, percent):
+    """Nearest-rank percentile of sorted values."""
+    rank = int(math.ceil(percent / 100.0 * len(values)))
+    return values[max(rank, 1) - 1]
+
+
+def rollup(datapoints, filter_name, stats, interval=None, time_from=None):
+    """Roll datapoints up into intervals.
+
+    The values of an interval are collected into a compact float array
+    and sorted once, min, max and percentiles are then read by index.
+
+    Arguments:
+        datapoints {list} -- Datapoints in time order.
+        filter_name {str} -- Rollup method of the query, i.e. `average`.
+        stats {list} -- Statistics out of ROLLUPS.
+        interval {int} -- Interval length in seconds, the whole range is
+                          rolled up into one interval by default.
+        time_from {int} -- Start of the first interval in milliseconds,
+                           the first datapoint by default.
+
+    Returns:
+        list of dicts with `timestamp`, `count` and the statistics.
+    """
+    buckets = []
+    current = None
+    start = time_from
+    if start is None and datapoints:
+        start = datapoints[0]['timestamp']
+    for point in datapoints:
+        value = point_value(point, filter_name)
+        if value is None:
+            continue
+        bucket = start
+        if interval:
+            step = interval * 1000
+            bucket += (point['timestamp'] - start) // step * step
+        if current is None or bucket != current[0]:
+            current = (bucket, array('d'))
+            buckets.append(current)
+        current[1].append(value)
+
+    result = []
+    for timestamp, values in buckets:
+        values = sorted(values)
+        entry = dict(timestamp=timestamp, count=len(values))
+        if 'min' in stats:
+            entry['min'] = values[0]
+        if 'max' in stats:
+            entry['max'] = values[-1]
+        if 'avg' in stats:
+            entry['avg'] = math.fsum(values) / len(values)
+        if 'p95' in stats:
+            entry['p95'] = _percentile(values, 95)
+        result.append(entry)
+    return result
+
+
+class CachedSeries:
+    """Datapoints of one series held in compact arrays.
+
+    Timestamps and values are kept in two parallel arrays of 8 byte
+    integers and floats instead of a dict per datapoint. `start` is the
+    beginning of the cached range, the newest timestamp is the high-water
+    mark up to which data has been fetched. The cached range is contiguous,
+    datapoints fetched for a range not touching it replace it.
+    """
+
+    def __init__(self, metric=None, value_key=None, unit=None, start=None,
+                 timestamps=None, values=None):
+        self.metric = metric
+        self.value_key = value_key
+        self.unit = unit
+        self.start = start
+        self.timestamps = timestamps if timestamps is not None else array('q')
+        self.values = values if values is not None else array('d')
+
+    def __len__(self):
+        return len(self.timestamps)
+
+    def missing(self, time_from, time_to):
+        """Ranges of a query which are not cached.
+
+        The newest cached datapoint is fetched again, its period may not
+        have been complete when it was cached.
+
+        Returns:
+            list of (from, to) tuples in milliseconds.
+        """
+        if not self.timestamps:
+            return [(time_from, time_to)]
+        high_water = self.timestamps[-1]
+        if time_to <= self.start or time_from > high_water:
+            return [(time_from, time_to)]
+        ranges = []
+        if time_from < self.start:
+            ranges.append((time_from, self.start))
+        if time_to > high_water:
+            ranges.append((max(time_from, high_water), time_to))
+        return ranges
+
+    def update(self, metric, datapoints, filter_name, time_from, time_to):
+        """Add datapoints fetched from `time_from` to `time_to`."""
+        if metric is not None:
+            self.metric = metric
+        if (not self.timestamps or time_from > self.timestamps[-1]
+                or time_to < self.start):
+            # The gap to the cached range has never been fetched
+            self.timestamps = array('q')
+            self.values = array('d')
+            self.start = None
+        merged = dict(zip(self.timestamps, self.values))
+        for point in datapoints:
+            for key in _VALUE_KEYS.get(filter_name, (filter_name,)):
+                if point.get(key) is not None:
+                    merged[point['timestamp']] = point[key]
+                    self.value_key = key
+                    self.unit = point.get('unit') or self.unit
+                    break
+        timestamps = sorted(merged)
+        self.timestamps = array('q', timestamps)
+        self.values = array('d', (merged[ts] for ts in timestamps))
+        if self.start is None or time_from < self.start:
+            self.start = time_from
+
+    def evict(self, before):
+        """Drop datapoints older than `before` milliseconds."""
+        keep = bisect.bisect_left(self.timestamps, before)
+        if keep:
+            del self.timestamps[:keep]
+            del self.values[:keep]
+        if self.start is not None and self.start < before:
+            self.start = before
+
+    def datapoints(self, time_from, time_to):
+        """Cached datapoints within a range in time order."""
+        first = bisect.bisect_left(self.timestamps, time_from)
+        last = bisect.bisect_right(self.timestamps, time_to)
+        points = []
+        for i in range(first, last):
+            point = {'timestamp': self.timestamps[i],
+                     self.value_key: self.values[i]}
+            if self.unit is not None:
+                point['unit'] = self.unit
+            points.append(point)
+        return points
+
+
+class MetricCache:
+    """On-disk cache of metric data series.
+
+    Every series is stored in its own file, named by the hash of the
+    namespace, metric name, dimensions, period and filter. The file starts
+    with a JSON header line followed by the raw timestamp and value arrays.
+    Datapoints older than `ttl` are dropped when a series is loaded, files
+    of series which have not been queried within `ttl` are removed by
+    `prune`.
+
+    Args:
+        path: Directory where series are stored.
+        ttl: Seconds datapoints are kept.
+        now: Callable returning the current time in milliseconds.
+    """
+
+    def __init__(self, path=None, ttl=DEFAULT_CACHE_TTL, now=None):
+        self.path = os.path.expanduser(path or DEFAULT_CACHE_PATH)
+        self.ttl = ttl
+        self.now = now or (lambda: int(time.time() * 1000))
+
+    def _locate(self, key):
+        return os.path.join(
+            self.path, hashlib.sha256(key.encode('utf-8')).hexdigest())
+
+    def load(self, key):
+        """Cached series of a key, empty if it is not cached."""
+        try:
+            with open(self._locate(key), 'rb') as f:
+                header = json.loads(f.readline().decode('utf-8'))
+                if (header.get('version') != _CACHE_VERSION
+                        or header.get('key') != key
+                        or header.get('byteorder') != sys.byteorder):
+                    return CachedSeries()
+                timestamps = array('q')
+                timestamps.fromfile(f, header['count'])
+                values = array('d')
+                values.fromfile(f, header['count'])
+        except (OSError, ValueError, KeyError, EOFError):
+            return CachedSeries()
+        series = CachedSeries(header['metric'], header['value_key'],
+                              header['unit'], header['start'],
+                              timestamps, values)
+        series.evict(self.now() - self.ttl * 1000)
+        return series
+
+    def save(self, key, series):
+        """Write a series, the previous file is replaced atomically."""
+        if not series:
+            return
+        os.makedirs(self.path, mode=0o700, exist_ok=True)
+        path = self._locate(key)
+        tmp = '%s.%d.tmp' % (path, os.getpid())
+        header = dict(version=_CACHE_VERSION, key=key,
+                      byteorder=sys.byteorder, count=len(series),
+                      metric=series.metric, value_key=series.value_key,
+                      unit=series.unit, start=series.start)
+        with open(tmp, 'wb') as f:
+            f.write(json.dumps(header, sort_keys=True).encode('utf-8'))
+            f.write(b'\n')
+            series.timestamps.tofile(f)
+            series.values.tofile(f)
+        os.replace(tmp, path)
+
+    def prune(self):
+        """Remove series which have not been written within `ttl`."""
+        expired = self.now() / 1000.0 - self.ttl
+        try:
+            names = os.listdir(self.path)
+        except OSError:
+            return
+        for name in names:
+            path = os.path.join(self.path, name)
+            try:
+                if os.path.getmtime(path) < expired:
+                    os.remove(path)
+            except OSError:
+                pass
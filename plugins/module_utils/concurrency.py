@@ -0,0 +1,119 @@
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Bounded concurrent execution of independent API calls.
+
+The SDK connection is safe to share between threads, so modules applying
+many independent changes run them in a small thread pool instead of one
+after another. Errors are collected per item instead of aborting the run,
+modules decide themselves whether to retry or fail.
+"""
+
+import collections
+import random
+import threading
+import time
+
+from concurrent.futures import ThreadPoolExecutor
+
+DEFAULT_WORKERS = 4
+# Retries of calls rejected while a resource is busy
+DEFAULT_RETRIES = 5
+RETRY_DELAY = 1
+RETRY_BACKOFF = 2
+
+Outcome = collections.namedtuple(
+    'Outcome', ['item', 'result', 'error', 'duration'])
+
+
+def _timed(func, item):
+    start = time.monotonic()
+    try:
+        return Outcome(item, func(item), None, time.monotonic() - start)
+    except Exception as e:
+        return Outcome(item, None, e, time.monotonic() - start)
+
+
+class RateLimiter:
+    """Spread calls of many threads to at most `rate` calls per second."""
+
+    def __init__(self, rate):
+        self.interval = 1.0 / rate if rate else 0
+        self._next = 0
+        self._lock = threading.Lock()
+
+    def wait(self):
+        if not self.interval:
+            return
+        with self._lock:
+            now = time.monotonic()
+            start = max(now, self._next)
+            self._next = start + self.interval
+        if start > now:
+            time.sleep(start - now)
+
+
+def run_all(func, items, workers=DEFAULT_WORKERS, rate=None):
+    """Call `func` for every item with at most `workers` threads.
+
+    Arguments:
+        func {callable} -- Gets an item.
+        items {iterable} -- Items to process.
+        workers {int} -- Maximum number of concurrent calls.
+        rate {float} -- Maximum number of calls started per second.
+
+    Returns:
+        list of `Outcome` in the order of `items`.
+    """
+    items = list(items)
+    if rate:
+        limiter = RateLimiter(rate)
+        limited = func
+
+        def func(item):
+            limiter.wait()
+            return limited(item)
+
+    if workers <= 1 or len(items) <= 1:
+        return [_timed(func, item) for item in items]
+    with ThreadPoolExecutor(max_workers=min(workers, len(items))) as pool:
+        return list(pool.map(lambda item: _timed(func, item), items))
+
+
+def retry(func, retry_on, retries=DEFAULT_RETRIES, delay=RETRY_DELAY,
+          backoff=RETRY_BACKOFF, sleep=time.sleep):
+    """Call `func`, retrying with exponential backoff and jitter.
+
+    Arguments:
+        func {callable} -- Called without arguments.
+        retry_on {callable} -- Gets the exception, True if the call should
+                               be retried, i.e. on 409 Conflict.
+        retries {int} -- Maximum number of retries.
+        delay {float} -- Seconds to wait before the first retry.
+        backoff {float} -- Factor the delay grows by with every retry.
+
+    Returns:
+        The result of `func`.
+    """
+    for attempt in range(retries + 1):
+        try:
+            return func()
+        except Exception as e:
+            if attempt == retries or not retry_on(e):
+                raise
+        sleep(delay * backoff ** attempt * random.uniform(0.8, 1.2))
+
+
+def is_conflict(error):
+    """True for 409 Conflict, returned while a resource is pending update.
+    """
+    return getattr(error, 'status_code', None) == 409
@@ -0,0 +1,96 @@
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Incremental JSON lines output of large results.
+
+Info modules listing many resources write every resource to a local file
+as soon as it is listed instead of collecting all of them for the module
+result, so memory stays constant and the controller only gets the path,
+count and checksum of the file.
+"""
+
+import gzip
+import hashlib
+import json
+import os
+
+
+class _HashingFile:
+    """Binary file computing the checksum of the written bytes."""
+
+    def __init__(self, path):
+        self._file = open(path, 'wb')
+        self.hash = hashlib.sha256()
+
+    def write(self, data):
+        self.hash.update(data)
+        return self._file.write(data)
+
+    def flush(self):
+        self._file.flush()
+
+    def close(self):
+        self._file.close()
+
+
+class JsonLinesWriter:
+    """List-like sink writing appended items as JSON lines.
+
+    The file is written next to `path` and moved into place by `close`,
+    a failed run leaves an existing file untouched. Paths ending with
+    `.gz` are gzip compressed.
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self.count = 0
+        self._tmp = '%s.%d.tmp' % (path, os.getpid())
+        self._raw = _HashingFile(self._tmp)
+        self._out = self._raw
+        if path.endswith('.gz'):
+            self._out = gzip.GzipFile(
+                filename='', mode='wb', fileobj=self._raw, mtime=0)
+
+    def append(self, item):
+        line = json.dumps(item, sort_keys=True, default=str) + '\n'
+        self._out.write(line.encode('utf-8'))
+        self.count += 1
+
+    def extend(self, items):
+        for item in items:
+            self.append(item)
+
+    def __len__(self):
+        return self.count
+
+    def close(self):
+        """Move the file into place.
+
+        Returns:
+            dict with `path`, `count` and `checksum` of the file.
+        """
+        if self._out is not self._raw:
+            self._out.close()
+        self._raw.close()
+        os.replace(self._tmp, self.path)
+        return dict(path=self.path, count=self.count,
+                    checksum='sha256:%s' % self._raw.hash.hexdigest())
+
+    def abort(self):
+        """Drop the partially written file."""
+        try:
+            if self._out is not self._raw:
+                self._out.close()
+            self._raw.close()
+        finally:
+            if os.path.exists(self._tmp):
+                os.remove(self._tmp)
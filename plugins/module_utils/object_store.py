@@ -0,0 +1,361 @@
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Streaming and segmented transfer of objects to and from Swift.
+
+Files larger than the segment size are uploaded as static large objects:
+the segments are uploaded concurrently into `<container>_segments` and
+referenced by a manifest. Segments are sent from a memory mapping of the
+file, the file is never read into memory. Segments which already exist
+with the same ETag are not uploaded again, so an interrupted upload
+resumes with the missing segments.
+
+The ETag of a static large object is the MD5 of the concatenated ETags of
+its segments. Local files are compared with objects by computing the same
+value over the same segment boundaries, equal files are not transferred.
+"""
+
+import contextlib
+import hashlib
+import json
+import mmap
+import os
+import threading
+
+from urllib.parse import quote
+
+from ansible_collections.opentelekomcloud.cloud.plugins.module_utils.concurrency import DEFAULT_WORKERS
+from ansible_collections.opentelekomcloud.cloud.plugins.module_utils.concurrency import run_all
+
+DEFAULT_SEGMENT_SIZE = 100 * 1024 * 1024
+# Bytes written at once while downloading
+CHUNK_SIZE = 1024 * 1024
+SEGMENTS_SUFFIX = '_segments'
+
+
+class TransferError(Exception):
+
+    def __init__(self, msg, status_code=None):
+        super(TransferError, self).__init__(msg)
+        self.status_code = status_code
+
+
+def segment_ranges(size, segment_size):
+    """(offset, length) of the segments of `size` bytes, at least one."""
+    if size <= segment_size:
+        return [(0, size)]
+    return [(offset, min(segment_size, size - offset))
+            for offset in range(0, size, segment_size)]
+
+
+def slo_etag(etags):
+    """ETag of a static large object made of segments with `etags`."""
+    return hashlib.md5(''.join(etags).encode('ascii')).hexdigest()
+
+
+def segment_etags(view, ranges):
+    return [hashlib.md5(view[offset:offset + length]).hexdigest()
+            for offset, length in ranges]
+
+
+def combined_etag(etags):
+    """ETag of a plain object for one segment, of an SLO otherwise."""
+    return etags[0] if len(etags) == 1 else slo_etag(etags)
+
+
+@contextlib.contextmanager
+def mapped(path):
+    """Read only memory view of a file."""
+    with open(path, 'rb') as f:
+        if not os.fstat(f.fileno()).st_size:
+            yield memoryview(b'')
+            return
+        mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        view = memoryview(mm)
+        try:
+            yield view
+        finally:
+            view.release()
+            try:
+                mm.close()
+            except BufferError:
+                # Slices are still referenced by the traceback of a failed
+                # request, the mapping is closed once they are released
+                pass
+
+
+def file_etag(path, ranges):
+    """ETag of a local file split at `ranges`."""
+    with mapped(path) as view:
+        return combined_etag(segment_etags(view, ranges))
+
+
+def _etag(headers):
+    return (headers.get('Etag') or '').strip('"')
+
+
+class ObjectTransfer:
+    """Upload, download and deletion of one object.
+
+    Args:
+        store: Object store proxy of the connection, or any adapter
+            with `head`, `get`, `put` and `delete` requests.
+        container: Name of the container.
+        name: Name of the object.
+        segment_size: Size of the segments of large objects in bytes.
+        workers: Number of segments transferred at the same time.
+    """
+
+    def __init__(self, store, container, name,
+                 segment_size=DEFAULT_SEGMENT_SIZE, workers=DEFAULT_WORKERS):
+        self.store = store
+        self.container = container
+        self.name = name
+        self.segment_size = segment_size
+        self.workers = workers
+        self.segment_container = container + SEGMENTS_SUFFIX
+        self.requests = 0
+        self.transferred = 0
+        self.segments = 0
+        self.reused = 0
+        self._lock = threading.Lock()
+
+    def _path(self, container, name=None):
+        path = '/' + quote(container, safe='')
+        if name is not None:
+            path += '/' + quote(name)
+        return path
+
+    def _request(self, method, path, ok=(), sent=0, **kwargs):
+        response = getattr(self.store, method)(path, raise_exc=False,
+                                               **kwargs)
+        with self._lock:
+            self.requests += 1
+            self.transferred += sent
+        if response.status_code >= 400 and response.status_code not in ok:
+            raise TransferError(
+                '%s %s failed with %d: %s' % (
+                    method.upper(), path, response.status_code,
+                    response.text),
+                response.status_code)
+        return response
+
+    def head(self):
+        """Headers of the object, None if it does not exist."""
+        response = self._request(
+            'head', self._path(self.container, self.name), ok=(404,))
+        if response.status_code == 404:
+            return None
+        return response.headers
+
+    def _is_slo(self, headers):
+        return headers.get('X-Static-Large-Object', '').lower() == 'true'
+
+    def _remote_ranges(self, headers):
+        """Segment boundaries of the object."""
+        size = int(headers.get('Content-Length') or 0)
+        if not self._is_slo(headers):
+            return [(0, size)]
+        response = self._request(
+            'get', self._path(self.container, self.name),
+            params={'multipart-manifest': 'get'})
+        ranges = []
+        offset = 0
+        for segment in response.json():
+            ranges.append((offset, segment['bytes']))
+            offset += segment['bytes']
+        return ranges
+
+    def _list(self, container, prefix):
+        """Names and ETags of the objects of a container with a prefix."""
+        params = {'format': 'json', 'prefix': prefix}
+        objects = {}
+        while True:
+            response = self._request('get', self._path(container), ok=(404,),
+                                     params=params)
+            entries = [] if response.status_code == 404 else response.json()
+            for entry in entries:
+                objects[entry['name']] = entry['hash']
+            if not entries:
+                return objects
+            params['marker'] = entries[-1]['name']
+
+    def upload(self, path, headers=None, check_mode=False):
+        """Upload a file unless the object has the same content.
+
+        Returns:
+            True if the object was (or would be) uploaded.
+        """
+        size = os.path.getsize(path)
+        ranges = segment_ranges(size, self.segment_size)
+        self.segments = len(ranges)
+        with mapped(path) as view:
+            remote = self.head()
+            if remote is not None and self._unchanged(view, size, remote):
+                return False
+            if check_mode:
+                return True
+            etags = segment_etags(view, ranges)
+            self._request('put', self._path(self.container))
+            headers = dict(headers or {})
+            if len(ranges) == 1:
+                headers['ETag'] = etags[0]
+                self._request('put', self._path(self.container, self.name),
+                              sent=size, data=view if size else b'',
+                              headers=headers)
+                if remote is not None and self._is_slo(remote):
+                    self._purge_segments(
+                        self._list(self.segment_container,
+                                   self.name + '/slo/'), set())
+            else:
+                self._upload_segments(view, size, ranges, etags, headers)
+        return True
+
+    def _unchanged(self, view, size, remote):
+        """Whether the object has the content of the file.
+
+        The ETag of a large object depends on its segment boundaries, which
+        may differ from the configured segment size.
+        """
+        if int(remote.get('Content-Length') or 0) != size:
+            return False
+        return _etag(remote) == combined_etag(
+            segment_etags(view, self._remote_ranges(remote)))
+
+    def _upload_segments(self, view, size, ranges, etags, headers):
+        # Segment names only depend on the file and segment size, so an
+        # upload of the same file finds the segments of an earlier attempt
+        prefix = '%s/slo/%d/%d/' % (self.name, size, self.segment_size)
+        existing = self._list(self.segment_container, self.name + '/slo/')
+        if not existing:
+            self._request('put', self._path(self.segment_container))
+
+        manifest = []
+        for i, (offset, length) in enumerate(ranges):
+            manifest.append(dict(
+                path='/%s/%s%08d' % (self.segment_container, prefix, i),
+                etag=etags[i], size_bytes=length))
+        missing = [i for i, segment in enumerate(manifest)
+                   if existing.get(segment['path'].split('/', 2)[2])
+                   != segment['etag']]
+        self.reused = len(manifest) - len(missing)
+
+        def put_segment(i):
+            offset, length = ranges[i]
+            self._request(
+                'put', self._path(self.segment_container,
+                                  '%s%08d' % (prefix, i)),
+                sent=length, data=view[offset:offset + length],
+                headers={'ETag': etags[i]})
+
+        outcomes = run_all(put_segment, missing, workers=self.workers)
+        errors = [str(outcome.error) for outcome in outcomes
+                  if outcome.error is not None]
+        if errors:
+            raise TransferError('Failed to upload %d of %d segments: %s' % (
+                len(errors), len(missing), '; '.join(errors)))
+
+        self._request('put', self._path(self.container, self.name),
+                      params={'multipart-manifest': 'put'},
+                      data=json.dumps(manifest), headers=headers)
+
+        self._purge_segments(existing, set(
+            segment['path'].split('/', 2)[2] for segment in manifest))
+
+    def _purge_segments(self, existing, used):
+        """Delete segments of earlier versions of the object."""
+        for name in sorted(set(existing) - used):
+            self._request('delete', self._path(self.segment_container, name),
+                          ok=(404,))
+
+    def download(self, path, check_mode=False):
+        """Download the object unless the file has the same content.
+
+        Parts of large objects are downloaded concurrently with range
+        requests and written at their offset of the file. The file is
+        replaced once its ETag has been verified.
+
+        Returns:
+            True if the file was (or would be) written.
+        """
+        remote = self.head()
+        if remote is None:
+            raise TransferError('Object %s not found in container %s' % (
+                self.name, self.container), 404)
+        size = int(remote.get('Content-Length') or 0)
+        ranges = self._remote_ranges(remote)
+        self.segments = len(ranges)
+        if (os.path.isfile(path) and os.path.getsize(path) == size
+                and file_etag(path, ranges) == _etag(remote)):
+            return False
+        if check_mode:
+            return True
+
+        tmp = '%s.%d.tmp' % (path, os.getpid())
+        try:
+            with open(tmp, 'wb') as f:
+                f.truncate(size)
+                parts = segment_ranges(size, self.segment_size)
+                outcomes = run_all(
+                    lambda part: self._get_part(f.fileno(), part,
+                                                len(parts) > 1),
+                    parts, workers=self.workers)
+            errors = [str(outcome.error) for outcome in outcomes
+                      if outcome.error is not None]
+            if errors:
+                raise TransferError('Failed to download %d of %d parts: %s'
+                                    % (len(errors), len(parts),
+                                       '; '.join(errors)))
+            if file_etag(tmp, ranges) != _etag(remote):
+                raise TransferError('Checksum of the downloaded object %s '
+                                    'does not match its ETag' % self.name)
+            os.replace(tmp, path)
+        finally:
+            if os.path.exists(tmp):
+                os.remove(tmp)
+        return True
+
+    def _get_part(self, fd, part, ranged):
+        offset, length = part
+        headers = {}
+        if ranged:
+            headers['Range'] = 'bytes=%d-%d' % (offset, offset + length - 1)
+        response = self._request(
+            'get', self._path(self.container, self.name),
+            headers=headers, stream=True)
+        received = 0
+        for chunk in response.iter_content(CHUNK_SIZE):
+            os.pwrite(fd, chunk, offset + received)
+            received += len(chunk)
+        with self._lock:
+            self.transferred += received
+        if received != length:
+            raise TransferError('Got %d of %d bytes at offset %d' % (
+                received, length, offset))
+
+    def delete(self, check_mode=False):
+        """Delete the object and the segments of a large object.
+
+        Returns:
+            True if the object was (or would be) deleted.
+        """
+        remote = self.head()
+        if remote is None:
+            return False
+        if check_mode:
+            return True
+        params = {}
+        if self._is_slo(remote):
+            params['multipart-manifest'] = 'delete'
+        self._request('delete', self._path(self.container, self.name),
+                      ok=(404,), params=params)
+        return True
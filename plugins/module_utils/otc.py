@@ -11,17 +11,20 @@
 # limitations under the License.
 
 import abc
+import functools
+import inspect
 
-try:
-    import openstack as sdk
-    import otcextensions
-    from otcextensions import sdk as otc_sdk
-    from pkg_resources import parse_version as V
-    HAS_LIBRARIES = True
-except ImportError:
-    HAS_LIBRARIES = False
-
+# openstacksdk and otcextensions are imported on first connection, so that
+# argument validation failures do not pay for importing them.
 from ansible.module_utils.basic import AnsibleModule
+from ansible.module_utils.compat.version import LooseVersion
+from ansible_collections.opentelekomcloud.cloud.plugins.module_utils import sdk_loader
+
+
+@functools.lru_cache(maxsize=None)
+def V(version):
+    """Parse a version string, results are cached."""
+    return LooseVersion(str(version))
 
 
 def openstack_full_argument_spec(**kwargs):
@@ -42,12 +45,107 @@ def openstack_full_argument_spec(**kwargs):
             aliases=['endpoint_type']),
         sdk_log_path=dict(default=None, type='str'),
         sdk_log_level=dict(
-            default='WARN', type='str', choices=['ERROR', 'WARN', 'INFO', 'DEBUG'])
+            default='WARN', type='str', choices=['ERROR', 'WARN', 'INFO', 'DEBUG']),
+        auth_cache=dict(default=False, type='bool'),
+        auth_cache_path=dict(default=None, type='path'),
+        auth_cache_key=dict(default=None, type='str', no_log=True),
+        broker=dict(default=False, type='bool'),
+        broker_socket=dict(default=None, type='path'),
+        broker_idle_timeout=dict(default=300, type='int'),
+        api_trace=dict(default=False, type='bool'),
+        api_trace_file=dict(default=None, type='path'),
     )
     spec.update(kwargs)
     return spec
 
 
+# Options of all info modules
+INFO_ARGUMENT_SPEC = dict(
+    fields=dict(default=None, type='list', elements='str'),
+    exclude_fields=dict(default=None, type='list', elements='str'),
+)
+PAGING_ARGUMENT_SPEC = dict(
+    limit=dict(default=None, type='int'),
+    marker=dict(default=None, type='str'),
+    max_items=dict(default=None, type='int'),
+)
+OUTPUT_ARGUMENT_SPEC = dict(
+    output_file=dict(default=None, type='path'),
+)
+
+# Attribute names of resource classes, read from the first to_dict()
+_RESOURCE_FIELDS = {}
+
+
+def _plain(value):
+    if hasattr(value, 'to_dict'):
+        return value.to_dict()
+    if isinstance(value, list):
+        return [_plain(item) for item in value]
+    return value
+
+
+def _resource_id(resource):
+    if hasattr(resource, 'to_dict'):
+        return getattr(resource, 'id', None)
+    return resource.get('id')
+
+
+def _accepts_query(func):
+    try:
+        parameters = inspect.signature(func).parameters.values()
+    except (TypeError, ValueError):
+        return False
+    return any(p.kind == p.VAR_KEYWORD for p in parameters)
+
+
+def _drop_value(results, value):
+    """Remove `value` from the (nested) result dictionary."""
+    for key, item in list(results.items()):
+        if item is value:
+            results.pop(key)
+        elif isinstance(item, dict):
+            _drop_value(item, value)
+
+
+def project_resource(resource, fields=None, exclude_fields=None):
+    """Dictionary of a resource with only the requested attributes.
+
+    Without `fields` and `exclude_fields` this is `to_dict()` without
+    `location`. Otherwise only the selected attributes are read, the full
+    `to_dict()` pass over all attributes is done once per resource class
+    to learn the attribute names for `exclude_fields`.
+
+    Arguments:
+        resource -- SDK resource or plain dictionary.
+        fields {list} -- Attributes to return.
+        exclude_fields {list} -- Attributes to leave out.
+
+    Raises:
+        AttributeError if a field is not an attribute of the resource.
+    """
+    if resource is None:
+        return None
+    if not hasattr(resource, 'to_dict'):
+        if fields:
+            return dict((field, resource[field]) for field in fields)
+        return dict((key, value) for key, value in resource.items()
+                    if key not in (exclude_fields or ()))
+    if not fields and not exclude_fields:
+        data = resource.to_dict()
+        data.pop('location', None)
+        return data
+    if not fields:
+        cls = type(resource)
+        if cls not in _RESOURCE_FIELDS:
+            _RESOURCE_FIELDS[cls] = [key for key in resource.to_dict()
+                                     if key != 'location']
+        fields = [key for key in _RESOURCE_FIELDS[cls]
+                  if key not in exclude_fields]
+    return dict((field, _plain(getattr(resource, field)))
+                for field in fields)
+
+
 class OTCModule:
     """Openstack Module is a base class for all Openstack Module classes.
 
@@ -73,30 +171,66 @@ class OTCModule:
             warning.
         check_versioned: helper function to check that all arguments are known
             in the current SDK version.
+        waiter: Create a shared wait/poll engine honouring `timeout`.
+        auth_cache: On-disk Keystone token and catalog cache, set when the
+            `auth_cache` parameter is enabled.
+        tracer: API call and wait loop timing collector, set when the
+            `api_trace` parameter is enabled.
         run: method that executes and shall be overriden in inherited classes.
 
     Args:
         deprecated_names: Should specify deprecated modules names for current
             module.
         argument_spec: Used for construction of Openstack common arguments.
+        info_module: Adds the `fields` and `exclude_fields` options of info
+            modules, applied by `project`, the `limit`, `marker` and
+            `max_items` options, applied by `paged`, and the `output_file`
+            option, applied by `result_list`.
+        info_paging: Unset for info modules not listing with `paged`, which
+            do not get the `limit`, `marker` and `max_items` options.
+        info_output: Unset for info modules not collecting resources with
+            `result_list`, which do not get the `output_file` option.
+        marker_paging: The listing API of an info module pages with `limit`
+            and `marker` query parameters, `paged` passes them on.
         module_kwargs: Additional arguments for Ansible Module.
     """
 
     argument_spec = {}
     module_kwargs = {}
+    info_module = False
+    info_paging = True
+    info_output = True
+    marker_paging = False
     otce_min_version = None
 
     def __init__(self):
 
+        argument_spec = self.argument_spec
+        module_kwargs = self.module_kwargs
+        if self.info_module:
+            info_spec = dict(INFO_ARGUMENT_SPEC)
+            if self.info_paging:
+                info_spec.update(PAGING_ARGUMENT_SPEC)
+            if self.info_output:
+                info_spec.update(OUTPUT_ARGUMENT_SPEC)
+            argument_spec = dict(info_spec, **argument_spec)
+            module_kwargs = dict(module_kwargs)
+            module_kwargs['mutually_exclusive'] = (
+                list(module_kwargs.get('mutually_exclusive', []))
+                + [('fields', 'exclude_fields')])
         self.ansible = AnsibleModule(
-            openstack_full_argument_spec(**self.argument_spec),
-            **self.module_kwargs)
+            openstack_full_argument_spec(**argument_spec),
+            **module_kwargs)
         self.params = self.ansible.params
         self.module_name = self.ansible._name
         self.sdk_version = None
         self.results = {'changed': False}
-        self.exit = self.exit_json = self.ansible.exit_json
-        self.fail = self.fail_json = self.ansible.fail_json
+        self.next_marker = None
+        self.output = None
+        self.auth_cache = None
+        self.tracer = None
+        self.exit = self.exit_json = self._exit_json
+        self.fail = self.fail_json = self._fail_json
         self.sdk, self.conn = self.openstack_cloud_from_module()
         self.setup_sdk_logging()
 
@@ -118,11 +252,186 @@ class OTCModule:
             self.ansible.log(
                 " ".join(['[DEBUG]', msg]))
 
+    def project(self, resource):
+        """Dictionary of a resource for the module result.
+
+        Honours the `fields` and `exclude_fields` options of info modules.
+        """
+        try:
+            return project_resource(resource, self.params.get('fields'),
+                                    self.params.get('exclude_fields'))
+        except (AttributeError, KeyError) as e:
+            self.fail_json(msg='Unknown field: %s' % e)
+
+    def paged(self, list_func, *args, **query):
+        """List resources honouring the paging options of info modules.
+
+        `limit` and `marker` are passed to listing functions taking a query
+        if the module sets `marker_paging`, unless it handles these options
+        itself. Otherwise the marker is looked up in the listing. Listing stops after `max_items`
+        resources, no further page is requested, and the ID of the last
+        resource is returned as `next_marker`.
+
+        Arguments:
+            list_func {callable} -- Listing function of the SDK proxy.
+            args, query -- Arguments of the listing function.
+        """
+        marker = self.params.get('marker')
+        own = [attr for attr in ('limit', 'marker')
+               if attr in self.argument_spec]
+        if self.marker_paging and _accepts_query(list_func):
+            for attr in ('limit', 'marker'):
+                if (self.params.get(attr) is not None and attr not in own
+                        and attr not in query):
+                    query[attr] = self.params[attr]
+            marker = None
+        resources = list_func(*args, **query)
+        if marker and 'marker' not in own:
+            resources = self._after_marker(resources, marker)
+        max_items = self.params.get('max_items')
+        if max_items:
+            resources = self._bounded(resources, max_items)
+        return resources
+
+    def _after_marker(self, resources, marker):
+        """Skip resources up to the marker for APIs which ignore it."""
+        found = False
+        for resource in resources:
+            if found:
+                yield resource
+            elif _resource_id(resource) == marker:
+                found = True
+        if not found:
+            self.fail_json(msg='Marker %s not found in the listing' % marker)
+
+    def _bounded(self, resources, max_items):
+        count = 0
+        for resource in resources:
+            yield resource
+            count += 1
+            if count >= max_items:
+                # Stop before the generator fetches the next page
+                self.next_marker = _resource_id(resource)
+                return
+
+    def result_list(self):
+        """List collecting the resources of an info module result.
+
+        With `output_file` the resources are written to the file as JSON
+        lines while they are appended, the result then gets the path, count
+        and checksum of the file instead of the resources.
+        """
+        path = self.params.get('output_file')
+        if not path:
+            return []
+        if self.output is None:
+            from ansible_collections.opentelekomcloud.cloud.plugins.module_utils.jsonlines import JsonLinesWriter
+            try:
+                self.output = JsonLinesWriter(path)
+            except (IOError, OSError) as e:
+                self.fail_json(msg='Unable to write %s: %s' % (path, e))
+        return self.output
+
+    def _exit_json(self, **kwargs):
+        if self.output is not None:
+            _drop_value(kwargs, self.output)
+            kwargs['output_file'] = self.output.close()
+            self.output = None
+        self._finalize(kwargs)
+        self.ansible.exit_json(**kwargs)
+
+    def _fail_json(self, **kwargs):
+        if self.output is not None:
+            _drop_value(kwargs, self.output)
+            self.output.abort()
+            self.output = None
+        self._finalize(kwargs)
+        self.ansible.fail_json(**kwargs)
+
+    def _finalize(self, results):
+        """Last hook before results are returned to Ansible."""
+        if self.next_marker is not None:
+            results.setdefault('next_marker', self.next_marker)
+        if self.tracer is not None:
+            results['otc_timing'] = self.tracer.summary()
+            self.tracer.close()
+            self.tracer = None
+        if self.auth_cache is not None:
+            if self.auth_cache.status:
+                results['otc_auth_cache'] = self.auth_cache.status
+            conn = getattr(self, 'conn', None)
+            if conn is not None:
+                try:
+                    self.auth_cache.save(conn)
+                except (IOError, OSError, ValueError) as e:
+                    self.log('Unable to save auth cache: %s' % e)
+
+    def setup_tracing(self, conn):
+        """Record API calls and wait loops if `api_trace` is enabled."""
+        trace_file = self.params.get('api_trace_file')
+        if not (self.params.get('api_trace') or trace_file):
+            return
+        if self.tracer is None:
+            from ansible_collections.opentelekomcloud.cloud.plugins.module_utils.tracing import Tracer
+            self.tracer = Tracer(module_name=self.module_name,
+                                 trace_file=trace_file)
+        self.tracer.attach(conn)
+        self.tracer.instrument_sdk()
+
+    def setup_broker(self, conn):
+        """Route HTTP requests of the connection through the local broker.
+
+        Returns:
+            auth_cache {BrokerAuthCache} auth state cache kept by the broker
+                                         or None if the broker is disabled or
+                                         not available.
+        """
+        if not self.params.get('broker'):
+            return None
+        from ansible_collections.opentelekomcloud.cloud.plugins.module_utils import broker
+        client = broker.BrokerClient(
+            path=self.params.get('broker_socket'),
+            idle_timeout=self.params.get('broker_idle_timeout'))
+        try:
+            client.ensure_running()
+        except (IOError, OSError) as e:
+            # Without broker the module simply talks to the cloud directly
+            self.log('Connection broker is not available: %s' % e)
+            return None
+        broker.attach(conn, client)
+        return broker.BrokerAuthCache(client)
+
+    def setup_auth_cache(self, conn):
+        """Reuse a cached Keystone token and catalog for the connection.
+
+        The token is kept by the connection broker when `broker` is enabled,
+        otherwise in an encrypted file if `auth_cache` is enabled.
+        """
+        auth_cache = self.setup_broker(conn)
+        if auth_cache is None:
+            if not self.params.get('auth_cache'):
+                return
+            from ansible_collections.opentelekomcloud.cloud.plugins.module_utils.auth_cache import (
+                AuthCache, HAS_CRYPTOGRAPHY
+            )
+            if not HAS_CRYPTOGRAPHY:
+                self.fail_json(msg='cryptography is required for auth_cache')
+            auth_cache = AuthCache(
+                path=self.params.get('auth_cache_path'),
+                key=self.params.get('auth_cache_key'))
+        self.auth_cache = auth_cache
+        try:
+            self.auth_cache.load(conn)
+        except (IOError, OSError, AttributeError, ValueError) as e:
+            # A broken cache must never prevent the module from working
+            self.log('Unable to use auth cache: %s' % e)
+            self.auth_cache = None
+
     def setup_sdk_logging(self):
         log_path = self.params.get('sdk_log_path')
         if log_path is not None:
             log_level = self.params.get('sdk_log_level')
-            sdk.enable_logging(
+            self.sdk.enable_logging(
                 debug=True if log_level == 'DEBUG' else False,
                 http_debug=True if log_level == 'DEBUG' else False,
                 path=log_path
@@ -132,8 +441,13 @@ class OTCModule:
         if self.otce_min_version:
             min_version = self.otce_min_version
 
-        if not HAS_LIBRARIES:
+        try:
+            import openstack as sdk
+            from openstack import version as sdk_version
+            import otcextensions
+        except ImportError:
             self.fail_json(msg='openstacksdk and otcextensions are required for this self')
+        self.sdk_version = sdk_version.__version__
 
         if min_version:
             min_version = max(V('0.6.9'), V(min_version))
@@ -163,7 +477,9 @@ class OTCModule:
                 if self.params['interface'] != 'public':
                     self.fail_json(msg=fail_message.format(param='interface'))
                 conn = sdk.connect(**cloud_config)
-                otc_sdk.load(conn)
+                self.setup_tracing(conn)
+                self.setup_auth_cache(conn)
+                sdk_loader.load(conn)
                 return sdk, conn
             else:
                 conn = sdk.connect(
@@ -177,7 +493,9 @@ class OTCModule:
                     api_timeout=self.params['api_timeout'],
                     interface=self.params['interface'],
                 )
-                otc_sdk.load(conn)
+                self.setup_tracing(conn)
+                self.setup_auth_cache(conn)
+                sdk_loader.load(conn)
                 return sdk, conn
         except sdk.exceptions.SDKException as e:
             # Probably a cloud configuration/login error
@@ -193,16 +511,32 @@ class OTCModule:
                                     are dropped.
         """
         versioned_result = {}
+        sdk_version = V(self.sdk_version)
         for var_name in kwargs:
             if ('min_ver' in self.argument_spec[var_name]
-                    and V(self.sdk_version) < self.argument_spec[var_name]['min_ver']):
+                    and sdk_version < V(self.argument_spec[var_name]['min_ver'])):
                 continue
             if ('max_ver' in self.argument_spec[var_name]
-                    and V(self.sdk_version) > self.argument_spec[var_name]['max_ver']):
+                    and sdk_version > V(self.argument_spec[var_name]['max_ver'])):
                 continue
             versioned_result.update({var_name: kwargs[var_name]})
         return versioned_result
 
+    def waiter(self, service=None, timeout=None, **kwargs):
+        """Create a wait engine for the module.
+
+        Arguments:
+            service {str} -- Service type selecting the poll interval.
+            timeout {int} -- Seconds to wait, `timeout` param by default.
+
+        Returns:
+            waiter {Waiter} wait engine reporting to the module tracer.
+        """
+        from ansible_collections.opentelekomcloud.cloud.plugins.module_utils.waiters import Waiter
+        if timeout is None:
+            timeout = self.params['timeout']
+        return Waiter(timeout, service=service, tracer=self.tracer, **kwargs)
+
     @abc.abstractmethod
     def run(self):
         pass
@@ -214,9 +548,12 @@ class OTCModule:
         try:
             results = self.run()
             if results and isinstance(results, dict):
-                self.ansible.exit_json(**results)
+                self.exit_json(**results)
 
         except self.sdk.exceptions.OpenStackCloudException as e:
+            if (self.auth_cache is not None
+                    and getattr(e, 'status_code', None) == 401):
+                self.auth_cache.invalidate()
             params = {
                 'msg': str(e),
                 'extra_data': {
@@ -226,4 +563,4 @@ class OTCModule:
                                         'text', 'None')
                 }
             }
-            self.ansible.fail_json(**params)
+            self.fail_json(**params)
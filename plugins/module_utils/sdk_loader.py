@@ -0,0 +1,83 @@
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Lazy registration of otcextensions services on an SDK connection.
+
+`otcextensions.sdk.load` imports and registers every OTC service proxy on
+each module start. `load` below defers the registration of every service
+until the connection attribute (i.e. `conn.cbr`) is accessed for the
+first time, so a module only pays for the services it uses.
+"""
+
+# otcextensions is imported within the functions to keep importing this
+# module cheap until a connection is established.
+
+
+class LazyServicesMixin:
+    """Connection mixin registering OTC services on first attribute access.
+    """
+
+    def __getattr__(self, name):
+        # Only called when regular lookup fails, so registered services and
+        # native SDK proxies never get here.
+        from otcextensions import sdk as otc_sdk
+        registered = self.__dict__.setdefault('_otc_registered', set())
+        if name in registered or name not in otc_sdk.OTC_SERVICES:
+            raise AttributeError(
+                "'%s' object has no attribute '%s'" % (
+                    type(self).__name__, name))
+        register_service(self, name)
+        return getattr(self, name)
+
+
+def register_service(conn, name):
+    """Register a single OTC service on the connection.
+
+    Arguments:
+        conn {openstack.connection.Connection} -- Connection.
+        name {str} -- Key of the service in `otc_sdk.OTC_SERVICES`.
+    """
+    from otcextensions import sdk as otc_sdk
+    registered = conn.__dict__.setdefault('_otc_registered', set())
+    if name in registered:
+        return
+    registered.add(name)
+    otc_sdk.register_single_service(
+        conn, name, conn.__dict__['_otc_project_id'])
+
+
+def load(conn):
+    """Prepare the connection for OTC services.
+
+    Services replacing a native SDK proxy (i.e. `dns`) are registered right
+    away, since attribute access would otherwise return the native proxy and
+    never reach the lazy loader. All other services are registered on first
+    access.
+
+    Arguments:
+        conn {openstack.connection.Connection} -- Established connection.
+    """
+    from otcextensions import sdk as otc_sdk
+    conn.authorize()
+    conn.__dict__['_otc_project_id'] = conn._get_project_info().id
+    conn.__dict__['_otc_registered'] = set()
+
+    otc_sdk.patch_openstack_resources()
+    otc_sdk.extend_instance(conn, otc_sdk._rds.RdsMixin)
+    otc_sdk.extend_instance(conn, otc_sdk._cce.CceMixin)
+    otc_sdk.extend_instance(conn, otc_sdk._dds.DdsMixin)
+    otc_sdk.extend_instance(conn, LazyServicesMixin)
+    conn.get_ak_sk = otc_sdk.get_ak_sk
+
+    for name, service in sorted(otc_sdk.OTC_SERVICES.items()):
+        if service.get('replace_system', False):
+            register_service(conn, name)
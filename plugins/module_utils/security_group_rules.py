@@ -0,0 +1,75 @@
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Comparison of security group rules.
+
+Neutron rules can not be updated, a rule either exists or not. Rules are
+turned into a canonical hashable key, so the existing and the requested
+rules of a group can be compared as sets and only the delta is applied.
+"""
+
+import ipaddress
+
+RULE_KEY = ('direction', 'ethertype', 'protocol', 'port_range_min',
+            'port_range_max', 'remote_ip_prefix', 'remote_group_id',
+            'remote_address_group_id')
+ETHERTYPES = {'ipv4': 'IPv4', 'ipv6': 'IPv6'}
+
+
+def canonical_rule(rule):
+    """Hashable form of a rule, equal for rules neutron treats as equal.
+
+    Accepts the rule as given by the user, as returned by the API or as
+    `to_dict()` of the SDK resource.
+    """
+    protocol = rule.get('protocol')
+    if protocol is not None:
+        protocol = str(protocol).lower()
+        if protocol == 'any':
+            protocol = None
+    ports = []
+    for attr in ('port_range_min', 'port_range_max'):
+        port = rule.get(attr)
+        port = None if port in (None, '', -1, '-1') else int(port)
+        ports.append(port)
+    ethertype = rule.get('ethertype') or rule.get('ether_type')
+    remote_ip_prefix = rule.get('remote_ip_prefix')
+    if remote_ip_prefix:
+        network = ipaddress.ip_network(remote_ip_prefix, strict=False)
+        remote_ip_prefix = str(network)
+        # The ethertype of a rule with a prefix defaults to its version
+        ethertype = ethertype or 'IPv%d' % network.version
+    ethertype = ETHERTYPES.get(str(ethertype or 'IPv4').lower(), ethertype)
+    return (
+        rule.get('direction') or 'ingress',
+        ethertype,
+        protocol,
+        ports[0],
+        ports[1],
+        remote_ip_prefix or None,
+        rule.get('remote_group_id') or None,
+        rule.get('remote_address_group_id') or None,
+    )
+
+
+def rule_definition(rule, security_group_id, project_id=None):
+    """Attributes for the neutron (bulk) create call of a rule."""
+    rule_def = dict(
+        (attr, value)
+        for attr, value in zip(RULE_KEY, canonical_rule(rule))
+        if value is not None)
+    rule_def['security_group_id'] = security_group_id
+    if rule.get('description') is not None:
+        rule_def['description'] = rule['description']
+    if project_id:
+        rule_def['tenant_id'] = project_id
+    return rule_def
@@ -0,0 +1,211 @@
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""API call tracing and timing of OTC modules.
+
+`Tracer` hooks the keystoneauth session of a connection and records method,
+service, URL template, status, response size and latency of every API call,
+as well as the time spent in wait/poll loops. `Tracer.summary` returns the
+compact `otc_timing` result, records are optionally appended to a JSON-lines
+file for offline analysis.
+"""
+
+import contextlib
+import functools
+import json
+import re
+import threading
+import time
+
+from urllib.parse import urlsplit
+
+# Path segments looking like IDs are replaced in URL templates
+ID_SEGMENT = re.compile(
+    r'^([0-9a-fA-F]{8}-?[0-9a-fA-F]{4}-?[0-9a-fA-F]{4}-?[0-9a-fA-F]{4}-?'
+    r'[0-9a-fA-F]{12}|[0-9a-fA-F]{16,}|\d+)$')
+# Number of slowest calls returned in the summary
+SLOWEST = 5
+
+
+def url_template(url):
+    """Strip host, query and IDs from an URL, i.e. `/v1/{id}/vpcs/{id}`."""
+    path = urlsplit(url).path
+    return '/'.join(
+        '{id}' if ID_SEGMENT.match(segment) else segment
+        for segment in path.split('/'))
+
+
+class Tracer:
+    """Collect API call and wait loop timings of a module run.
+
+    Args:
+        module_name: Name of the module, added to trace file records.
+        trace_file: Path of a JSON-lines file records are appended to.
+    """
+
+    def __init__(self, module_name=None, trace_file=None):
+        self.module_name = module_name
+        self.started = time.monotonic()
+        self.calls = 0
+        self.errors = 0
+        self.api_time = 0.0
+        self.bytes = 0
+        self.wait_time = 0.0
+        self.waits = 0
+        self.services = {}
+        self.slowest = []
+        self._lock = threading.Lock()
+        self._local = threading.local()
+        self._patched = []
+        # Line buffered, so records of parallel tasks do not interleave
+        self._file = open(trace_file, 'a', buffering=1) if trace_file else None
+
+    def attach(self, conn):
+        """Record all requests sent through the session of the connection.
+        """
+        session = conn.session
+        request = session.request
+
+        @functools.wraps(request)
+        def traced_request(url, method, **kwargs):
+            start = time.monotonic()
+            status = None
+            size = 0
+            response = None
+            try:
+                response = request(url, method, **kwargs)
+                return response
+            except Exception as e:
+                status = getattr(e, 'http_status', None)
+                raise
+            finally:
+                latency = time.monotonic() - start
+                if response is not None:
+                    status = response.status_code
+                    url = response.url or url
+                    size = response.headers.get('Content-Length')
+                    if size is None and not kwargs.get('stream'):
+                        size = len(response.content)
+                endpoint_filter = kwargs.get('endpoint_filter') or {}
+                self.record_call(
+                    method=method,
+                    service=endpoint_filter.get('service_type')
+                    or kwargs.get('microversion_service_type'),
+                    url=url_template(url),
+                    status=status,
+                    size=int(size or 0),
+                    latency=latency)
+
+        session.request = traced_request
+
+    def instrument_sdk(self):
+        """Measure time spent in the wait helpers of the SDK.
+
+        The helpers are only patched once, until `close` restores them.
+        """
+        if self._patched:
+            return
+        from openstack import resource, utils
+
+        def patch(owner, name, wrapper):
+            original = getattr(owner, name)
+            self._patched.append((owner, name, original))
+            setattr(owner, name, functools.wraps(original)(wrapper(original)))
+
+        def wait_function(original):
+            def wrapped(*args, **kwargs):
+                with self.wait(original.__name__):
+                    return original(*args, **kwargs)
+            return wrapped
+
+        def wait_generator(original):
+            def wrapped(*args, **kwargs):
+                with self.wait(original.__name__):
+                    for item in original(*args, **kwargs):
+                        yield item
+            return wrapped
+
+        patch(resource, 'wait_for_status', wait_function)
+        patch(resource, 'wait_for_delete', wait_function)
+        patch(utils, 'iterate_timeout', wait_generator)
+
+    def record_call(self, method, service, url, status, size, latency):
+        record = dict(method=method, service=service, url=url,
+                      status=status, bytes=size,
+                      latency=round(latency, 4))
+        with self._lock:
+            self.calls += 1
+            self.api_time += latency
+            self.bytes += size
+            failed = status is None or status >= 400
+            if failed:
+                self.errors += 1
+            stats = self.services.setdefault(
+                service or 'unknown', dict(calls=0, time=0.0, errors=0))
+            stats['calls'] += 1
+            stats['time'] += latency
+            stats['errors'] += int(failed)
+            self.slowest.append(record)
+            self.slowest.sort(key=lambda r: r['latency'], reverse=True)
+            del self.slowest[SLOWEST:]
+            self._write(type='call', **record)
+
+    @contextlib.contextmanager
+    def wait(self, name):
+        """Measure the time spent in a wait/poll loop.
+
+        Nested waits (i.e. `wait_for_status` using `iterate_timeout`) are
+        only counted once.
+        """
+        depth = getattr(self._local, 'depth', 0)
+        self._local.depth = depth + 1
+        start = time.monotonic()
+        try:
+            yield
+        finally:
+            self._local.depth = depth
+            if depth == 0:
+                duration = time.monotonic() - start
+                with self._lock:
+                    self.waits += 1
+                    self.wait_time += duration
+                    self._write(type='wait', name=name,
+                                duration=round(duration, 4))
+
+    def _write(self, **record):
+        if self._file is not None:
+            record['time'] = time.time()
+            record['module'] = self.module_name
+            self._file.write(json.dumps(record) + '\n')
+
+    def summary(self):
+        """Compact timing summary returned as `otc_timing`."""
+        with self._lock:
+            return dict(
+                total=round(time.monotonic() - self.started, 3),
+                api=dict(calls=self.calls, errors=self.errors,
+                         time=round(self.api_time, 3), bytes=self.bytes),
+                wait=dict(count=self.waits, time=round(self.wait_time, 3)),
+                services=dict(
+                    (name, dict(calls=s['calls'], errors=s['errors'],
+                                time=round(s['time'], 3)))
+                    for name, s in self.services.items()),
+                slowest=list(self.slowest))
+
+    def close(self):
+        """Restore patched SDK helpers and close the trace file."""
+        while self._patched:
+            owner, name, original = self._patched.pop()
+            setattr(owner, name, original)
+        if self._file is not None:
+            self._file.close()
+            self._file = None
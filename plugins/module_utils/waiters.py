@@ -0,0 +1,326 @@
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Shared wait/poll engine for OTC modules.
+
+`Waiter` polls with exponential backoff and jitter starting from a per
+service interval, and falls back to the initial interval as soon as the
+observed state changes. Single resources are fetched with conditional GETs
+when the service returns an ETag; many resources are watched with a single
+list call per poll instead of one GET per resource.
+"""
+
+import contextlib
+import random
+import time
+
+# Initial poll interval in seconds per service type
+POLL_INTERVALS = {
+    'auto_scaling': 5,
+    'cce': 10,
+    'css': 10,
+    'dds': 10,
+    'dws': 10,
+    'rds': 10,
+    'dns': 2,
+    'nat': 2,
+    'network': 2,
+    'vlb': 2,
+    'vpc': 2,
+}
+DEFAULT_INTERVAL = 2
+MAX_INTERVAL = 30
+BACKOFF = 1.5
+JITTER = 0.2
+
+
+def _normalize(status):
+    return status.lower() if isinstance(status, str) else status
+
+
+class Waiter:
+    """Poll until a condition is met, with backoff and jitter.
+
+    Args:
+        timeout: Seconds to wait before `ResourceTimeout` is raised.
+        service: Service type, selects the initial poll interval.
+        interval: Initial poll interval, overrides the service default.
+        max_interval: Upper bound for the poll interval.
+        backoff: Factor the interval grows by while nothing changes.
+        jitter: Relative random deviation applied to every interval.
+        tracer: Optional `Tracer` the time spent waiting is reported to.
+    """
+
+    def __init__(self, timeout, service=None, interval=None,
+                 max_interval=MAX_INTERVAL, backoff=BACKOFF, jitter=JITTER,
+                 tracer=None):
+        self.timeout = timeout
+        self.interval = interval or POLL_INTERVALS.get(
+            service, DEFAULT_INTERVAL)
+        self.max_interval = max(max_interval, self.interval)
+        self.backoff = backoff
+        self.jitter = jitter
+        self.tracer = tracer
+        self.polls = 0
+        self._etags = {}
+
+    # Overridden in unit tests
+    sleep = staticmethod(time.sleep)
+    clock = staticmethod(time.monotonic)
+
+    def _traced(self, name):
+        if self.tracer is None:
+            return contextlib.nullcontext()
+        return self.tracer.wait(name)
+
+    def poll(self, fetch, done, failed=None, progress=None, message=None,
+             name='poll'):
+        """Call `fetch` until `done` returns True for its result.
+
+        Arguments:
+            fetch {callable} -- Returns the current state.
+            done {callable} -- Gets the state, True finishes the wait.
+            failed {callable} -- Gets the state, returns an error message if
+                                 waiting makes no sense anymore.
+            progress {callable} -- Gets the state, returns a comparable
+                                   value. The interval is reset when it
+                                   changes.
+            message {str} -- Timeout message.
+
+        Returns:
+            The state for which `done` returned True.
+        """
+        from openstack import exceptions
+
+        deadline = self.clock() + self.timeout
+        delay = self.interval
+        last = None
+        with self._traced(name):
+            while True:
+                state = fetch()
+                self.polls += 1
+                if failed is not None:
+                    error = failed(state)
+                    if error:
+                        raise exceptions.ResourceFailure(error)
+                if done(state):
+                    return state
+                if progress is not None:
+                    current = progress(state)
+                    if self.polls > 1 and current != last:
+                        delay = self.interval
+                    last = current
+                remaining = deadline - self.clock()
+                if remaining <= 0:
+                    raise exceptions.ResourceTimeout(
+                        message or 'Timeout waiting for %s' % name)
+                spread = delay * self.jitter
+                self.sleep(min(remaining,
+                               delay + random.uniform(-spread, spread)))
+                delay = min(delay * self.backoff, self.max_interval)
+
+    def fetch(self, proxy, res):
+        """Refresh the resource, with a conditional GET if possible.
+
+        Resources overriding `fetch` are refreshed with their own method.
+        """
+        from openstack import resource
+
+        if type(res).fetch is not resource.Resource.fetch:
+            return res.fetch(proxy)
+        request = res._prepare_request(requires_id=True)
+        headers = {}
+        etag = self._etags.get(request.url)
+        if etag:
+            headers['If-None-Match'] = etag
+        response = proxy.get(
+            request.url, headers=headers, skip_cache=True,
+            microversion=res._get_microversion(proxy))
+        if response.status_code == 304:
+            return res
+        if response.headers.get('ETag'):
+            self._etags[request.url] = response.headers['ETag']
+        res._translate_response(response)
+        return res
+
+    def wait_for_status(self, proxy, res, status, failures=None,
+                        attribute='status'):
+        """Wait for the resource attribute to reach the status.
+
+        Raises `ResourceFailure` when the attribute reaches one of
+        `failures` (`ERROR` by default).
+        """
+        if _normalize(getattr(res, attribute)) == _normalize(status):
+            return res
+        failures = [_normalize(f) for f in (failures or ['ERROR'])]
+        name = '%s:%s' % (type(res).__name__, res.id)
+
+        def failed(current):
+            value = getattr(current, attribute)
+            if _normalize(value) in failures:
+                return '%s transitioned to failure state %s' % (name, value)
+
+        return self.poll(
+            fetch=lambda: self.fetch(proxy, res),
+            done=lambda current: (_normalize(getattr(current, attribute))
+                                  == _normalize(status)),
+            failed=failed,
+            progress=lambda current: getattr(current, attribute),
+            message='Timeout waiting for %s to transition to %s' % (
+                name, status),
+            name='wait_for_status')
+
+    def wait_for_delete(self, proxy, res):
+        """Wait until fetching the resource returns 404."""
+        from openstack import exceptions
+
+        def fetch():
+            try:
+                return self.fetch(proxy, res)
+            except exceptions.NotFoundException:
+                return None
+
+        return self.poll(
+            fetch=fetch,
+            done=lambda current: current is None,
+            message='Timeout waiting for %s:%s to delete' % (
+                type(res).__name__, res.id),
+            name='wait_for_delete')
+
+    def wait_for_many(self, list_resources, ids, ready, failed=None,
+                      key='id'):
+        """Watch many resources with one list call per poll.
+
+        Arguments:
+            list_resources {callable} -- Returns an iterable of resources.
+            ids {iterable} -- Keys of the resources to wait for.
+            ready {callable} -- Gets a resource, True if it is done.
+            failed {callable} -- Gets a resource, True if it failed.
+            key {str} -- Attribute identifying the resources.
+
+        Returns:
+            dict of key to resource for all resources.
+        """
+        pending = set(ids)
+
+        def fetch():
+            return dict((getattr(item, key), item)
+                        for item in list_resources()
+                        if getattr(item, key) in pending)
+
+        def broken(found):
+            if failed is None:
+                return None
+            errors = sorted(k for k, item in found.items() if failed(item))
+            if errors:
+                return 'Resources %s failed' % ', '.join(errors)
+
+        return self.poll(
+            fetch=fetch,
+            done=lambda found: (len(found) == len(pending)
+                                and all(ready(i) for i in found.values())),
+            failed=broken,
+            progress=lambda found: sorted(
+                k for k, item in found.items() if ready(item)),
+            message='Timeout waiting for %d resources' % len(pending),
+            name='wait_for_many')
+
+    def wait_for_many_deleted(self, list_resources, ids, key='id'):
+        """Wait until none of the resources is listed anymore."""
+        pending = set(ids)
+        return self.poll(
+            fetch=lambda: set(getattr(item, key) for item in list_resources()
+                              if getattr(item, key) in pending),
+            done=lambda left: not left,
+            progress=len,
+            message='Timeout waiting for %d resources to delete' % len(
+                pending),
+            name='wait_for_many_deleted')
+
+    def converge(self, list_resources, ready, failed=None, ids=None,
+                 count=None, key='id', report=None):
+        """Track many resources to a final state from one list per poll.
+
+        Unlike `wait_for_many`, failed resources do not abort the wait.
+        They are collected and the wait goes on for the others, so a single
+        broken resource neither blocks on the slowest one nor hides the
+        progress of the rest.
+
+        Arguments:
+            list_resources {callable} -- Returns an iterable of resources.
+            ready {callable} -- Gets a resource, True if it is done.
+            failed {callable} -- Gets a resource, True if it failed.
+            ids {iterable} -- Keys of the resources to track. All listed
+                              resources are tracked if not set.
+            count {int} -- Exact number of resources expected to be listed,
+                           i.e. while a group scales out or in.
+            key {str} -- Attribute identifying the resources.
+            report {callable} -- Called with `ready`, `failed` and `total`
+                                 whenever the progress changes.
+
+        Returns:
+            dict with sorted `ready` and `failed` keys and the number of
+            `polls`.
+        """
+        from openstack import exceptions
+
+        wanted = set(ids) if ids is not None else None
+        total = len(wanted) if wanted is not None else count
+        state = dict(ready=[], failed=[], listed=0)
+        reported = []
+
+        def fetch():
+            found = {}
+            listed = 0
+            for item in list_resources():
+                item_key = getattr(item, key)
+                if wanted is not None and item_key not in wanted:
+                    continue
+                listed += 1
+                # Resources still being created may not have a key yet
+                if item_key:
+                    found[item_key] = item
+            done_keys = set(k for k, item in found.items() if ready(item))
+            failed_keys = set(k for k, item in found.items()
+                              if k not in done_keys
+                              and failed is not None and failed(item))
+            state.update(ready=sorted(done_keys), failed=sorted(failed_keys),
+                         listed=listed)
+            current = (state['ready'], state['failed'])
+            if report is not None and reported != [current]:
+                reported[:] = [current]
+                report(len(done_keys), len(failed_keys),
+                       total if total is not None else listed)
+            return state
+
+        def finished(current):
+            settled = len(current['ready']) + len(current['failed'])
+            if total is None:
+                return settled == current['listed']
+            return current['listed'] == total and settled == total
+
+        try:
+            self.poll(
+                fetch=fetch,
+                done=finished,
+                progress=lambda current: (len(current['ready']),
+                                          len(current['failed']),
+                                          current['listed']),
+                name='converge')
+        except exceptions.ResourceTimeout:
+            raise exceptions.ResourceTimeout(
+                'Timeout waiting for resources: %d of %s ready, %d failed' % (
+                    len(state['ready']),
+                    total if total is not None else state['listed'],
+                    len(state['failed'])))
+        return dict(ready=state['ready'], failed=state['failed'],
+                    polls=self.polls)
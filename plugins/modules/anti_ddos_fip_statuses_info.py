@@ -16,7 +16,9 @@ DOCUMENTATION = '''
 ---
 module: anti_ddos_fip_statuses_info
 short_description: Get Anti-DDoS statuses info
-extends_documentation_fragment: opentelekomcloud.cloud.otc
+extends_documentation_fragment:
+  - opentelekomcloud.cloud.otc
+  - opentelekomcloud.cloud.otc.info
 version_added: "0.2.1"
 author: "Irina Pereiaslavskaia (@irina-pereiaslavskaia)"
 description:
@@ -73,6 +75,8 @@ from ansible_collections.opentelekomcloud.cloud.plugins.module_utils.otc import
 
 
 class AntiDDoSFIPStatusesInfoModule(OTCModule):
+    info_module = True
+
     argument_spec = dict(
         ip=dict(type='str', required=False),
         status=dict(type='str',
@@ -89,7 +93,7 @@ class AntiDDoSFIPStatusesInfoModule(OTCModule):
         ip_filter = self.params['ip']
         status_filter = self.params['status']
 
-        data = []
+        data = self.result_list()
         query = {}
 
         if ip_filter:
@@ -98,9 +102,8 @@ class AntiDDoSFIPStatusesInfoModule(OTCModule):
         if status_filter:
             query['status'] = status_filter
 
-        for raw in self.conn.anti_ddos.floating_ips(**query):
-            dt = raw.to_dict()
-            dt.pop('location')
+        for raw in self.paged(self.conn.anti_ddos.floating_ips, **query):
+            dt = self.project(raw)
             data.append(dt)
 
         self.exit(changed=False, anti_ddos_statuses=data)
@@ -16,7 +16,9 @@ DOCUMENTATION = '''
 ---
 module: anti_ddos_optional_policies_info
 short_description: Get Anti-DDoS optional defense policies info
-extends_documentation_fragment: opentelekomcloud.cloud.otc
+extends_documentation_fragment:
+  - opentelekomcloud.cloud.otc
+  - opentelekomcloud.cloud.otc.info
 version_added: "0.4.0"
 author: "Irina Pereiaslavskaia (@irina-pereiaslavskaia)"
 description:
@@ -119,6 +121,8 @@ from ansible_collections.opentelekomcloud.cloud.plugins.module_utils.otc import
 
 
 class AntiDDoSOptionalPoliciesInfoModule(OTCModule):
+    info_module = True
+
     argument_spec = dict()
     module_kwargs = dict(
         supports_check_mode=True
@@ -126,11 +130,10 @@ class AntiDDoSOptionalPoliciesInfoModule(OTCModule):
 
     def run(self):
 
-        data = []
+        data = self.result_list()
 
-        for raw in self.conn.anti_ddos.configs():
-            dt = raw.to_dict()
-            dt.pop('location')
+        for raw in self.paged(self.conn.anti_ddos.configs):
+            dt = self.project(raw)
             data.append(dt)
 
         self.exit(changed=False, anti_ddos_optional_policies_info=data)
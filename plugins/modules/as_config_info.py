@@ -15,7 +15,9 @@ DOCUMENTATION = '''
 ---
 module: as_config_info
 short_description: Get AutoScaling configs
-extends_documentation_fragment: opentelekomcloud.cloud.otc
+extends_documentation_fragment:
+  - opentelekomcloud.cloud.otc
+  - opentelekomcloud.cloud.otc.info
 version_added: "0.0.1"
 author: "Artem Goncharov (@gtema)"
 description:
@@ -62,6 +64,8 @@ from ansible_collections.opentelekomcloud.cloud.plugins.module_utils.otc import
 
 
 class AutoScalingConfigInfoModule(OTCModule):
+    info_module = True
+
     argument_spec = dict(
         name=dict(required=False),
         image_id=dict(required=False)
@@ -74,16 +78,15 @@ class AutoScalingConfigInfoModule(OTCModule):
         name_filter = self.params['name']
         image_id_filter = self.params['image_id']
 
-        data = []
+        data = self.result_list()
         # TODO: Pass filters into SDK
-        for raw in self.conn.auto_scaling.configs():
+        for raw in self.paged(self.conn.auto_scaling.configs):
             if name_filter and raw.name != name_filter:
                 continue
             if (image_id_filter
                     and raw.instance_config['image_id'] != image_id_filter):
                 continue
-            dt = raw.to_dict()
-            dt.pop('location')
+            dt = self.project(raw)
             data.append(dt)
 
         self.exit(
@@ -732,19 +732,16 @@ class ASGroupModule(OTCModule):
         return attrs
 
     def _wait_for_instances(self, as_group, timeout, desire_instance_number=0):
-        for count in self.sdk.utils.iterate_timeout(
-            timeout=timeout,
-            message="Timeout waiting for AS Instances"
-        ):
-            instances = list(self.conn.auto_scaling.instances(
-                group=as_group
-            ))
-            instances_with_id = [instance.id for instance in instances
-                                 if instance.id]
-            if (len(instances) == len(instances_with_id) == desire_instance_number):
-                for instance in instances:
-                    self.conn.auto_scaling.wait_for_instance(instance=instance)
-                return
+        def report(ready, failed, total):
+            self.debug('AS Group %s: %d of %d instances in service, %d '
+                       'failed' % (as_group.id, ready, total, failed))
+
+        return self.waiter(service='auto_scaling', timeout=timeout).converge(
+            lambda: self.conn.auto_scaling.instances(group=as_group),
+            ready=lambda instance: instance.lifecycle_state == 'INSERVICE',
+            failed=lambda instance: instance.lifecycle_state == 'ERROR',
+            count=desire_instance_number,
+            report=report)
 
     def _resume_group(self, group, wait, timeout, desire_instance_number=0):
         result_group = group
@@ -752,11 +749,17 @@ class ASGroupModule(OTCModule):
         if wait:
             try:
                 if desire_instance_number > 0:
-                    self._wait_for_instances(
+                    instances = self._wait_for_instances(
                         as_group=group,
                         timeout=timeout,
                         desire_instance_number=desire_instance_number
                     )
+                    if instances['failed']:
+                        self.fail(
+                            msg="AS Instances went to ERROR state: %s" %
+                                ", ".join(instances['failed']),
+                            instances=instances
+                        )
                 result_group = self.conn.auto_scaling.wait_for_group(
                     group=group,
                     wait=timeout
@@ -15,7 +15,9 @@ DOCUMENTATION = '''
 ---
 module: as_group_info
 short_description: Get AutoScaling groups
-extends_documentation_fragment: opentelekomcloud.cloud.otc
+extends_documentation_fragment:
+  - opentelekomcloud.cloud.otc
+  - opentelekomcloud.cloud.otc.info
 version_added: "0.0.1"
 author: "Artem Goncharov (@gtema)"
 description:
@@ -62,6 +64,8 @@ from ansible_collections.opentelekomcloud.cloud.plugins.module_utils.otc import
 
 class AutoScalingGroupInfoModule(OTCModule):
 
+    info_module = True
+
     argument_spec = dict(
         name=dict(required=False),
         status=dict(required=False, choices=[
@@ -76,16 +80,15 @@ class AutoScalingGroupInfoModule(OTCModule):
         name_filter = self.params['name']
         status_filter = self.params['status']
 
-        data = []
+        data = self.result_list()
         # TODO: Pass filters into SDK
         attrs = {}
         if name_filter:
             attrs['scaling_groups_name'] = name_filter
         if status_filter:
             attrs['scaling_group_status'] = status_filter.upper()
-        for raw in self.conn.auto_scaling.groups(**attrs):
-            dt = raw.to_dict()
-            dt.pop('location')
+        for raw in self.paged(self.conn.auto_scaling.groups, **attrs):
+            dt = self.project(raw)
             data.append(dt)
 
         self.exit_json(
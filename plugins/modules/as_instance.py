@@ -59,11 +59,44 @@ options:
       - The duration in seconds that module should wait.
     default: 200
     type: int
+  parallelism:
+    description:
+      - Number of batches of instances submitted at the same time.
+      - The module waits for the group to be in service before submitting
+        batches. AS rejects actions while the group is busy, such batches
+        are submitted again until I(timeout) is reached. Batches failing
+        for other reasons are not submitted again.
+    default: 1
+    type: int
 requirements: ["openstacksdk", "otcextensions"]
 '''
 
 RETURN = '''
-# This module does not return anything.
+chunks:
+  description: Batches of instances the action was applied to.
+  returned: when an action was applied in batches
+  type: complex
+  contains:
+    instances:
+      description: IDs of the instances of the batch.
+      type: list
+      sample: ["89af599d-a8ab-4c29-a063-0b719ed77e8e"]
+    status:
+      description: C(ok) or C(failed).
+      type: str
+      sample: "ok"
+    attempts:
+      description: Number of times the batch was submitted.
+      type: int
+      sample: 1
+    duration:
+      description: Seconds spent submitting the batch.
+      type: float
+      sample: 0.42
+    error:
+      description: Error of the last failed attempt.
+      type: str
+      sample: null
 '''
 
 EXAMPLES = '''
@@ -111,9 +144,22 @@ EXAMPLES = '''
   register: as_instances
 '''
 
+import time
+
+from ansible_collections.opentelekomcloud.cloud.plugins.module_utils.concurrency import run_all
 from ansible_collections.opentelekomcloud.cloud.plugins.module_utils.otc import OTCModule
 
 
+# Seconds between submissions of batches rejected by AS
+RETRY_INTERVAL = 5
+# Status codes of actions rejected while the group is busy
+BUSY_STATUS_CODES = (409, 429, 503)
+
+
+def _is_busy(error):
+    return getattr(error, 'status_code', None) in BUSY_STATUS_CODES
+
+
 class ASInstanceModule(OTCModule):
     argument_spec = dict(
         scaling_group=dict(type='str', required=True),
@@ -124,7 +170,8 @@ class ASInstanceModule(OTCModule):
         state=dict(type='str',
                    choices=['present', 'absent'], default='present'),
         wait=dict(type='bool', default=True),
-        timeout=dict(type='int', default=200)
+        timeout=dict(type='int', default=200),
+        parallelism=dict(type='int', default=1)
     )
     module_kwargs = dict(
         supports_check_mode=True
@@ -187,20 +234,37 @@ class ASInstanceModule(OTCModule):
             result.extend(element)
         return result
 
+    def _index(self, resources):
+        """Index resources by ID and name to resolve them without find_*.
+
+        Names shared by several resources are left out of the index, like
+        find_* they can not be resolved unambiguously.
+        """
+        index = {}
+        names = {}
+        for res in resources:
+            index[res.id] = res
+            if res.name:
+                names.setdefault(res.name, []).append(res)
+        for name, matches in names.items():
+            if len(matches) == 1:
+                index.setdefault(name, matches[0])
+        return index
+
+    def _group_instances_index(self, group):
+        return self._index(self.conn.auto_scaling.instances(group=group))
+
     def _get_instances_id_for_adding(self, group, as_instances):
         instances = []
         max_instances = self._max_number_of_instances_for_adding(group)
+        servers = self._index(self.conn.compute.servers())
+        group_instances = self._group_instances_index(group)
         for as_instance in as_instances:
-            instance_ecs = self.conn.compute.find_server(
-                name_or_id=as_instance
-            )
-            instance_as_group = self.conn.auto_scaling.find_instance(
-                group=group,
-                name_or_id=as_instance
-            )
+            instance_ecs = servers.get(as_instance)
             if (instance_ecs
                     and instance_ecs.availability_zone in group.availability_zones
-                    and not instance_as_group):
+                    and as_instance not in group_instances
+                    and instance_ecs.id not in group_instances):
                 instances.append(instance_ecs.id)
         if len(instances) <= max_instances:
             instances = self._slice_list(instances, 10)
@@ -209,11 +273,9 @@ class ASInstanceModule(OTCModule):
     def _get_instances_id_for_removing(self, group, as_instances):
         instances = []
         max_instances = self._max_number_of_instances_for_removing(group)
+        group_instances = self._group_instances_index(group)
         for as_instance in as_instances:
-            instance = self.conn.auto_scaling.find_instance(
-                group=group,
-                name_or_id=as_instance
-            )
+            instance = group_instances.get(as_instance)
             if instance and self._is_instance_in_inservice_state(instance):
                 instances.append(instance.id)
         if len(instances) <= max_instances:
@@ -223,11 +285,9 @@ class ASInstanceModule(OTCModule):
     def _get_instances_id_for_protection(self, group, as_instances):
         instances = []
         max_instances = self._max_number_of_instances_for_protecting(group)
+        group_instances = self._group_instances_index(group)
         for as_instance in as_instances:
-            instance = self.conn.auto_scaling.find_instance(
-                group=group,
-                name_or_id=as_instance
-            )
+            instance = group_instances.get(as_instance)
             if instance and self._is_instance_in_inservice_state(instance):
                 instances.append(instance.id)
         if len(instances) <= max_instances:
@@ -258,17 +318,59 @@ class ASInstanceModule(OTCModule):
     def _batch_instances_action(
             self, instances, group, timeout, action, instance_delete=False
     ):
-        for instance_group in instances:
-            self.conn.auto_scaling.batch_instance_action(
-                group=self._wait_for_group_inservice_status(
-                    as_group=group,
-                    timeout=timeout
-                ),
-                instances=instance_group,
+        chunks = [dict(instances=instance_group, status='failed', attempts=0,
+                       duration=0.0, error=None)
+                  for instance_group in instances]
+
+        def submit(chunk):
+            return self.conn.auto_scaling.batch_instance_action(
+                group=group,
+                instances=chunk['instances'],
                 action=action,
                 delete_instance=instance_delete
             )
 
+        deadline = time.monotonic() + timeout
+        workers = max(self.params['parallelism'], 1)
+        pending = chunks
+        while pending:
+            if time.monotonic() >= deadline:
+                break
+            if any(chunk['attempts'] for chunk in pending):
+                # Rejected batches are submitted again after a pause, the
+                # group may be in service while AS is still busy
+                time.sleep(min(RETRY_INTERVAL,
+                               max(deadline - time.monotonic(), 0)))
+            rejected = []
+            for i in range(0, len(pending), workers):
+                # Actions are rejected while the group is busy
+                self._wait_for_group_inservice_status(
+                    as_group=group,
+                    timeout=max(deadline - time.monotonic(), 1))
+                for outcome in run_all(submit, pending[i:i + workers],
+                                       workers=workers):
+                    chunk = outcome.item
+                    chunk['attempts'] += 1
+                    chunk['duration'] = round(
+                        chunk['duration'] + outcome.duration, 3)
+                    if outcome.error is None:
+                        chunk.update(status='ok', error=None)
+                    else:
+                        chunk['error'] = str(outcome.error)
+                        if _is_busy(outcome.error):
+                            rejected.append(chunk)
+            # Other errors, i.e. unknown instances, fail at once
+            pending = rejected
+        failed = [chunk for chunk in chunks if chunk['status'] != 'ok']
+        if failed:
+            self.fail(
+                msg='Action {0} failed for {1} of {2} batches'.format(
+                    action.upper(), len(failed), len(chunks)),
+                chunks=chunks
+            )
+        self._wait_for_group_inservice_status(as_group=group, timeout=timeout)
+        return chunks
+
     def _delete_single_instance(self, instance, delete_instance=False):
         if isinstance(instance, list):
             instance = self._join_lists(instance).pop()
@@ -277,46 +379,41 @@ class ASInstanceModule(OTCModule):
         )
 
     def _wait_for_group_inservice_status(self, as_group, timeout, interval=2):
+        # Pass the ID, a group fetched earlier may still show INSERVICE
         return self.conn.auto_scaling.wait_for_group(
-            group=as_group, interval=interval, wait=timeout
+            group=as_group.id, interval=interval, wait=timeout
         )
 
     def _wait_for_instances_inservice_status(
             self, timeout, interval, group, instances_id
     ):
-        inst_ids = self._join_lists(instances_id)
-        for count in self.sdk.utils.iterate_timeout(
-            timeout=timeout,
-            wait=interval,
-            message="Timeout waiting for instance to be in inservice state"
-        ):
-            all_instances = list(self.conn.auto_scaling.instances(group=group))
-            instances = [instance for instance in all_instances
-                         if instance.id in inst_ids]
-            for instance in instances:
-                self.conn.auto_scaling.wait_for_instance(instance)
-            return
+        def report(ready, failed, total):
+            self.debug('AS Group %s: %d of %d instances in service, %d '
+                       'failed' % (group.id, ready, total, failed))
+
+        instances = self.waiter(
+            service='auto_scaling', timeout=timeout, interval=interval
+        ).converge(
+            lambda: self.conn.auto_scaling.instances(group=group),
+            ready=self._is_instance_in_inservice_state,
+            failed=lambda instance: instance.lifecycle_state == 'ERROR',
+            ids=self._join_lists(instances_id),
+            report=report)
+        if instances['failed']:
+            self.fail(
+                msg='Instances went to ERROR state: {0}'.format(
+                    ', '.join(instances['failed'])),
+                instances=instances
+            )
+        return instances
 
     def _wait_for_delete_instances(self, group, instances_id, timeout,
                                    interval=5):
-        inst_ids = self._join_lists(instances_id)
-        for count in self.sdk.utils.iterate_timeout(
-                timeout=timeout,
-                wait=interval,
-                message="Timeout waiting for instance to be deleted"
-        ):
-            all_instances = list(
-                self.conn.auto_scaling.instances(group=group)
-            )
-            if all_instances:
-                instances = [instance for instance in all_instances
-                             if instance.id in inst_ids]
-                if not instances:
-                    return
-                else:
-                    for instance in instances:
-                        self.conn.auto_scaling.wait_for_delete_instance(instance)
-                    return
+        self.waiter(
+            service='auto_scaling', timeout=timeout, interval=interval
+        ).wait_for_many_deleted(
+            lambda: self.conn.auto_scaling.instances(group=group),
+            self._join_lists(instances_id))
 
     def run(self):
         as_group = self.params['scaling_group']
@@ -381,7 +478,7 @@ class ASInstanceModule(OTCModule):
                             msg=msg
                         )
                     else:
-                        self._batch_instances_action(
+                        chunks = self._batch_instances_action(
                             instances=instances_id,
                             group=group,
                             timeout=timeout,
@@ -396,6 +493,7 @@ class ASInstanceModule(OTCModule):
                             )
                         self.exit(
                             changed=True,
+                            chunks=chunks,
                             msg='Action {0} was done'.format(action.upper())
                         )
                 else:
@@ -410,7 +508,7 @@ class ASInstanceModule(OTCModule):
                             msg=msg
                         )
                     else:
-                        self._batch_instances_action(
+                        chunks = self._batch_instances_action(
                             instances=instances_id,
                             group=group,
                             timeout=timeout,
@@ -425,6 +523,7 @@ class ASInstanceModule(OTCModule):
                             )
                         self.exit(
                             changed=True,
+                            chunks=chunks,
                             msg='Action {0} was done'.format(action.upper())
                         )
 
@@ -459,7 +558,7 @@ class ASInstanceModule(OTCModule):
                             msg=msg
                         )
                     elif action == 'remove':
-                        self._batch_instances_action(
+                        chunks = self._batch_instances_action(
                             instances=instances_id,
                             group=group,
                             timeout=timeout,
@@ -475,6 +574,7 @@ class ASInstanceModule(OTCModule):
                             )
                         self.exit(
                             changed=True,
+                            chunks=chunks,
                             msg='Action {0} was done'.format(action.upper())
                         )
                     else:
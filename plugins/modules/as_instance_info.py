@@ -15,7 +15,9 @@ DOCUMENTATION = '''
 ---
 module: as_instance_info
 short_description: Query Instances in an AS Group.
-extends_documentation_fragment: opentelekomcloud.cloud.otc
+extends_documentation_fragment:
+  - opentelekomcloud.cloud.otc
+  - opentelekomcloud.cloud.otc.info
 version_added: "0.8.0"
 author: "Irina Pereiaslavskaia (@irina-pereiaslavskaia)"
 description:
@@ -173,6 +175,8 @@ from ansible_collections.opentelekomcloud.cloud.plugins.module_utils.otc import
 
 
 class ASInstanceInfoModule(OTCModule):
+    info_module = True
+
     argument_spec = dict(
         scaling_group=dict(type='str', required=True),
         lifecycle_state=dict(type='str', required=False,
@@ -194,7 +198,7 @@ class ASInstanceInfoModule(OTCModule):
         start_number = self.params['start_number']
         limit = self.params['limit']
 
-        data = []
+        data = self.result_list()
         query = {}
 
         try:
@@ -228,9 +232,8 @@ class ASInstanceInfoModule(OTCModule):
                 msg='Limit is out of range'
             )
 
-        for raw in self.conn.auto_scaling.instances(**query):
-            dt = raw.to_dict()
-            dt.pop('location')
+        for raw in self.paged(self.conn.auto_scaling.instances, **query):
+            dt = self.project(raw)
             data.append(dt)
 
         self.exit(
@@ -15,7 +15,9 @@ DOCUMENTATION = '''
 ---
 module: as_policy_info
 short_description: Query AS policies based on search criteria.
-extends_documentation_fragment: opentelekomcloud.cloud.otc
+extends_documentation_fragment:
+  - opentelekomcloud.cloud.otc
+  - opentelekomcloud.cloud.otc.info
 version_added: "0.6.0"
 author: "Irina Pereiaslavskaia (@irina-pereiaslavskaia)"
 description:
@@ -168,6 +170,8 @@ from ansible_collections.opentelekomcloud.cloud.plugins.module_utils.otc import
 
 
 class ASPolicyInfoModule(OTCModule):
+    info_module = True
+
     argument_spec = dict(
         scaling_group=dict(type='str', required=True),
         scaling_policy=dict(type='str', required=False),
@@ -188,7 +192,7 @@ class ASPolicyInfoModule(OTCModule):
         start_number = self.params['start_number']
         limit = self.params['limit']
 
-        data = []
+        data = self.result_list()
         query = {}
         if as_group:
             group = self.conn.auto_scaling.find_group(
@@ -231,9 +235,8 @@ class ASPolicyInfoModule(OTCModule):
                 msg='Scaling group is missing'
             )
 
-        for raw in self.conn.auto_scaling.policies(**query):
-            dt = raw.to_dict()
-            dt.pop('location')
+        for raw in self.paged(self.conn.auto_scaling.policies, **query):
+            dt = self.project(raw)
             data.append(dt)
 
         self.exit(
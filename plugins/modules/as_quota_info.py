@@ -15,7 +15,9 @@ DOCUMENTATION = '''
 ---
 module: as_quota_info
 short_description: Get information about auto scaling quotas
-extends_documentation_fragment: opentelekomcloud.cloud.otc
+extends_documentation_fragment:
+  - opentelekomcloud.cloud.otc
+  - opentelekomcloud.cloud.otc.info
 version_added: "0.8.1"
 author: "Polina Gubina (@Polina-Gubina)"
 description:
@@ -79,6 +81,8 @@ from ansible_collections.opentelekomcloud.cloud.plugins.module_utils.otc import
 
 
 class ASQuotaInfoModule(OTCModule):
+    info_module = True
+
     argument_spec = dict(
         scaling_group=dict(required=False)
     )
@@ -88,7 +92,7 @@ class ASQuotaInfoModule(OTCModule):
     )
 
     def run(self):
-        data = []
+        data = self.result_list()
 
         scaling_group_id = None
         if self.params['scaling_group']:
@@ -98,9 +102,8 @@ class ASQuotaInfoModule(OTCModule):
             except self.sdk.exceptions.ResourceNotFound:
                 self.fail_json(msg="Auto scaling group not found")
 
-        for raw in self.conn.auto_scaling.quotas(group=scaling_group_id):
-            dt = raw.to_dict()
-            dt.pop('location')
+        for raw in self.paged(self.conn.auto_scaling.quotas, group=scaling_group_id):
+            dt = self.project(raw)
             data.append(dt)
 
         self.exit_json(
@@ -15,7 +15,9 @@ DOCUMENTATION = '''
 ---
 module: availability_zone_info
 short_description: Get AZ info
-extends_documentation_fragment: opentelekomcloud.cloud.otc
+extends_documentation_fragment:
+  - opentelekomcloud.cloud.otc
+  - opentelekomcloud.cloud.otc.info
 version_added: "0.7.0"
 author: "Artem Goncharov (@gtema)"
 description:
@@ -55,6 +57,8 @@ from ansible_collections.opentelekomcloud.cloud.plugins.module_utils.otc import
 
 
 class AvailabilityZoneInfoModule(OTCModule):
+    info_module = True
+
     argument_spec = dict(
         name=dict(type='str', required=False),
         service=dict(type='str', default='compute')
@@ -65,15 +69,14 @@ class AvailabilityZoneInfoModule(OTCModule):
     )
 
     def run(self):
-        data = []
+        data = self.result_list()
 
         raw_data = []
         if self.params['service'] == 'compute':
-            raw_data = self.conn.compute.availability_zones()
+            raw_data = self.paged(self.conn.compute.availability_zones)
         if raw_data:
             for raw in raw_data:
-                dt = raw.to_dict()
-                dt.pop('location')
+                dt = self.project(raw)
                 data.append(dt)
 
         self.exit(
@@ -14,7 +14,9 @@
 DOCUMENTATION = '''
 module: cbr_backup_info
 short_description: Get cbr backup resource list
-extends_documentation_fragment: opentelekomcloud.cloud.otc
+extends_documentation_fragment:
+  - opentelekomcloud.cloud.otc
+  - opentelekomcloud.cloud.otc.info
 version_added: "0.12.4"
 author: "Gubina Polina (@Polina-Gubina)"
 description:
@@ -250,6 +252,8 @@ from ansible_collections.opentelekomcloud.cloud.plugins.module_utils.otc import
 
 
 class CBRBackupsModule(OTCModule):
+    info_module = True
+
     argument_spec = dict(
         name=dict(required=False),
         checkpoint_id=dict(required=False),
@@ -284,7 +288,7 @@ class CBRBackupsModule(OTCModule):
     )
 
     def run(self):
-        data = []
+        data = self.result_list()
         query = {}
         backup = None
 
@@ -339,9 +343,8 @@ class CBRBackupsModule(OTCModule):
                 self.fail_json(msg="Vault not found")
             query['vault_id'] = vault.id
 
-        for raw in self.conn.cbr.backups(**query):
-            dt = raw.to_dict()
-            dt.pop('location')
+        for raw in self.paged(self.conn.cbr.backups, **query):
+            dt = self.project(raw)
             data.append(dt)
 
         self.exit(
@@ -15,7 +15,9 @@ DOCUMENTATION = '''
 ---
 module: cbr_policy_info
 short_description: Get CBR policy information
-extends_documentation_fragment: opentelekomcloud.cloud.otc
+extends_documentation_fragment:
+  - opentelekomcloud.cloud.otc
+  - opentelekomcloud.cloud.otc.info
 version_added: "0.15.2"
 author: "Sidelnikov Anton (@anton-sidelnikov)"
 description:
@@ -130,17 +132,11 @@ EXAMPLES = '''
 from ansible_collections.opentelekomcloud.cloud.plugins.module_utils.otc import OTCModule
 
 
-def _to_dict(resource):
-    if resource is None:
-        return None
-    data = resource.to_dict()
-    data.pop('location', None)
-    return data
-
-
 class CBRPolicyInfoModule(OTCModule):
     otce_min_version = '0.34.2'
 
+    info_module = True
+
     argument_spec = dict(
         id=dict(type='str'),
         name=dict(type='str'),
@@ -160,7 +156,7 @@ class CBRPolicyInfoModule(OTCModule):
             policy = self.conn.cbr.find_policy(name_or_id=name_or_id)
             self.exit(
                 changed=False,
-                policy=_to_dict(policy)
+                policy=self.project(policy)
             )
 
         query = {}
@@ -172,7 +168,8 @@ class CBRPolicyInfoModule(OTCModule):
                 self.fail_json(msg='Vault %s not found' % self.params['vault'])
             query['vault_id'] = vault.id
 
-        policies = [_to_dict(policy) for policy in self.conn.cbr.policies(**query)]
+        policies = self.result_list()
+        policies.extend(self.project(policy) for policy in self.paged(self.conn.cbr.policies, **query))
         self.exit(
             changed=False,
             policies=policies
@@ -15,7 +15,9 @@ DOCUMENTATION = '''
 ---
 module: cce_cluster_cert_info
 short_description: Get Certificates of a CCE cluster
-extends_documentation_fragment: opentelekomcloud.cloud.otc
+extends_documentation_fragment:
+  - opentelekomcloud.cloud.otc
+  - opentelekomcloud.cloud.otc.projection
 version_added: "0.0.1"
 author: "Artem Goncharov (@gtema)"
 description:
@@ -59,6 +61,10 @@ from ansible_collections.opentelekomcloud.cloud.plugins.module_utils.otc import
 
 
 class CceClusterCertInfoModule(OTCModule):
+    info_module = True
+    info_paging = False
+    info_output = False
+
     argument_spec = dict(
         cluster=dict(required=True),
     )
@@ -71,10 +77,9 @@ class CceClusterCertInfoModule(OTCModule):
 
         cluster = self.conn.cce.find_cluster(cluster, ignore_missing=False)
 
-        certs = self.conn.cce.get_cluster_certificates(cluster).to_dict()
-        certs.pop('location')
-        certs.pop('id')
-        certs.pop('name')
+        certs = self.project(self.conn.cce.get_cluster_certificates(cluster))
+        certs.pop('id', None)
+        certs.pop('name', None)
 
         self.exit_json(
             changed=False,
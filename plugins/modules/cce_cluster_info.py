@@ -15,7 +15,9 @@ DOCUMENTATION = '''
 ---
 module: cce_cluster_info
 short_description: Get information about CCE clusters
-extends_documentation_fragment: opentelekomcloud.cloud.otc
+extends_documentation_fragment:
+  - opentelekomcloud.cloud.otc
+  - opentelekomcloud.cloud.otc.info
 version_added: "0.0.1"
 author: "Artem Goncharov (@gtema)"
 description:
@@ -69,6 +71,8 @@ from ansible_collections.opentelekomcloud.cloud.plugins.module_utils.otc import
 
 
 class CceClusterInfoModule(OTCModule):
+    info_module = True
+
     argument_spec = dict(
         name=dict(required=False),
         status=dict(required=False, choices=['available', 'creating',
@@ -83,16 +87,15 @@ class CceClusterInfoModule(OTCModule):
         name_filter = self.params['name']
         status_filter = self.params['status']
 
-        data = []
-        for raw in self.conn.cce.clusters():
+        data = self.result_list()
+        for raw in self.paged(self.conn.cce.clusters):
             if name_filter and raw.name != name_filter:
                 continue
             if status_filter and raw.status != status_filter.lower():
                 continue
-            dt = raw.to_dict()
-            dt.pop('location')
-            dt.pop('api_version')
-            dt.pop('kind')
+            dt = self.project(raw)
+            dt.pop('api_version', None)
+            dt.pop('kind', None)
             data.append(dt)
 
         self.exit_json(
@@ -14,7 +14,9 @@
 DOCUMENTATION = '''
 module: cce_cluster_node_info
 short_description: Get CCE node info
-extends_documentation_fragment: opentelekomcloud.cloud.otc
+extends_documentation_fragment:
+  - opentelekomcloud.cloud.otc
+  - opentelekomcloud.cloud.otc.info
 version_added: "0.4.0"
 author: "Tino Schreiber (@tischrei)"
 description:
@@ -128,6 +130,8 @@ from ansible_collections.opentelekomcloud.cloud.plugins.module_utils.otc import
 
 
 class CCEClusterNodeInfoModule(OTCModule):
+    info_module = True
+
     argument_spec = dict(
         cce_cluster=dict(required=True),
         name=dict(required=False),
@@ -140,7 +144,7 @@ class CCEClusterNodeInfoModule(OTCModule):
 
     def run(self):
 
-        data = []
+        data = self.result_list()
         query = {}
 
         cluster = self.conn.cce.find_cluster(
@@ -159,8 +163,7 @@ class CCEClusterNodeInfoModule(OTCModule):
                 cluster=cluster,
                 node=self.params['name'])
             if node:
-                node = node.to_dict()
-                node.pop('location')
+                node = self.project(node)
                 data.append(node)
             else:
                 self.exit(
@@ -168,9 +171,8 @@ class CCEClusterNodeInfoModule(OTCModule):
                     cce_cluster_nodes=[]
                 )
         else:
-            for raw in self.conn.cce.cluster_nodes(cluster=cluster):
-                dt = raw.to_dict()
-                dt.pop('location')
+            for raw in self.paged(self.conn.cce.cluster_nodes, cluster=cluster):
+                dt = self.project(raw)
                 data.append(dt)
 
         self.exit(
@@ -14,7 +14,9 @@
 DOCUMENTATION = '''
 module: cce_node_pool_info
 short_description: Get CCE node pool info
-extends_documentation_fragment: opentelekomcloud.cloud.otc
+extends_documentation_fragment:
+  - opentelekomcloud.cloud.otc
+  - opentelekomcloud.cloud.otc.info
 version_added: "0.5.0"
 author: "Tino Schreiber (@tischrei)"
 description:
@@ -161,6 +163,8 @@ from ansible_collections.opentelekomcloud.cloud.plugins.module_utils.otc import
 
 
 class CCENodePoolInfoModule(OTCModule):
+    info_module = True
+
     argument_spec = dict(
         cce_cluster=dict(required=True),
         name=dict(required=False),
@@ -173,7 +177,7 @@ class CCENodePoolInfoModule(OTCModule):
 
     def run(self):
 
-        data = []
+        data = self.result_list()
         query = {}
 
         cluster = self.conn.cce.find_cluster(
@@ -192,8 +196,7 @@ class CCENodePoolInfoModule(OTCModule):
                 cluster=cluster,
                 pool=self.params['name'])
             if pool:
-                pool = pool.to_dict()
-                pool.pop('location')
+                pool = self.project(pool)
                 data.append(pool)
             else:
                 self.exit(
@@ -201,9 +204,8 @@ class CCENodePoolInfoModule(OTCModule):
                     cce_node_pools=[]
                 )
         else:
-            for raw in self.conn.cce.node_pools(cluster=cluster):
-                dt = raw.to_dict()
-                dt.pop('location')
+            for raw in self.paged(self.conn.cce.node_pools, cluster=cluster):
+                dt = self.project(raw)
                 data.append(dt)
 
         self.exit(
@@ -14,7 +14,9 @@
 DOCUMENTATION = '''
 module: ces_alarms_info
 short_description: Get Alarms
-extends_documentation_fragment: opentelekomcloud.cloud.otc
+extends_documentation_fragment:
+  - opentelekomcloud.cloud.otc
+  - opentelekomcloud.cloud.otc.info
 version_added: "0.3.0"
 author: "Sebastian Gode (@SebastianGode)"
 description:
@@ -86,6 +88,8 @@ from ansible_collections.opentelekomcloud.cloud.plugins.module_utils.otc import
 
 
 class CesAlarmsInfoModule(OTCModule):
+    info_module = True
+
     argument_spec = dict(
         name=dict(required=False),
     )
@@ -95,7 +99,7 @@ class CesAlarmsInfoModule(OTCModule):
 
     def run(self):
 
-        data = []
+        data = self.result_list()
 
         if self.params['name']:
             alarm = self.conn.ces.find_alarm(self.params['name'])
@@ -104,9 +108,8 @@ class CesAlarmsInfoModule(OTCModule):
                 alarms=alarm
             )
 
-        for raw in self.conn.ces.alarms():
-            dt = raw.to_dict()
-            dt.pop('location')
+        for raw in self.paged(self.conn.ces.alarms):
+            dt = self.project(raw)
             data.append(dt)
 
         self.exit(
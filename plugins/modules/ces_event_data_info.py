@@ -14,7 +14,9 @@
 DOCUMENTATION = '''
 module: ces_event_data_info
 short_description: Get Event Data
-extends_documentation_fragment: opentelekomcloud.cloud.otc
+extends_documentation_fragment:
+  - opentelekomcloud.cloud.otc
+  - opentelekomcloud.cloud.otc.info
 version_added: "0.3.0"
 author: "Sebastian Gode (@SebastianGode)"
 description:
@@ -95,6 +97,8 @@ from ansible_collections.opentelekomcloud.cloud.plugins.module_utils.otc import
 
 
 class CesEventDataInfoModule(OTCModule):
+    info_module = True
+
     argument_spec = dict(
         namespace=dict(required=True),
         type=dict(required=True),
@@ -110,7 +114,7 @@ class CesEventDataInfoModule(OTCModule):
 
     def run(self):
 
-        data = []
+        data = self.result_list()
         query = {}
 
         query['namespace'] = self.params['namespace']
@@ -123,9 +127,8 @@ class CesEventDataInfoModule(OTCModule):
             if self.params['dim2']:
                 query['dim.2'] = self.params['dim2']
 
-        for raw in self.conn.ces.event_data(**query):
-            dt = raw.to_dict()
-            dt.pop('location')
+        for raw in self.paged(self.conn.ces.event_data, **query):
+            dt = self.project(raw)
             data.append(dt)
 
         self.exit(
@@ -14,22 +14,94 @@
 DOCUMENTATION = '''
 module: ces_metric_data_info
 short_description: Get Metric Data
-extends_documentation_fragment: opentelekomcloud.cloud.otc
+extends_documentation_fragment:
+  - opentelekomcloud.cloud.otc
+  - opentelekomcloud.cloud.otc.projection
+  - opentelekomcloud.cloud.otc.output
 version_added: "0.3.0"
 author: "Sebastian Gode (@SebastianGode)"
 description:
   - Get Metric Data
+  - With I(metrics) the data of many series is queried with the batch query
+    API, up to 500 series per request.
+  - Long time ranges are split into windows which are queried concurrently,
+    the datapoints are merged in time order.
 options:
   namespace:
     description:
       - Namespace of a service
+      - Required unless I(metrics) is set.
     type: str
-    required: true
   metric_name:
     description:
       - Specifies the metric name
+      - Required unless I(metrics) is set.
     type: str
-    required: true
+  metrics:
+    description:
+      - Series to query at once instead of I(namespace), I(metric_name) and
+        I(dim0).
+    type: list
+    elements: dict
+    suboptions:
+      namespace:
+        description:
+          - Namespace of a service
+        type: str
+        required: true
+      metric_name:
+        description:
+          - Specifies the metric name
+        type: str
+        required: true
+      dimensions:
+        description:
+          - Up to three monitoring dimensions in the format of I(dim0).
+        type: list
+        elements: str
+        required: true
+  parallelism:
+    description:
+      - Number of queries sent at the same time.
+    type: int
+    default: 4
+  window:
+    description:
+      - Length in seconds of the time windows a long range is split into.
+      - By default windows hold up to 3000 datapoints of I(period), raw
+        data (I(period=1)) is assumed to have one datapoint per minute.
+    type: int
+  rollup:
+    description:
+      - Statistics of the datapoints returned as C(rollup) instead of the
+        datapoints.
+    type: list
+    elements: str
+    choices: [min, max, avg, p95]
+  rollup_interval:
+    description:
+      - Length in seconds of the intervals of I(rollup), starting at
+        I(time_from). The whole range is one interval by default.
+    type: int
+  cache:
+    description:
+      - Whether to keep the queried datapoints in an on-disk cache.
+      - Repeated queries of a series only fetch the datapoints newer than
+        the cached ones and the part of the range before the cached one.
+      - Cached datapoints contain the timestamp, the value of I(filter) and
+        the unit.
+    type: bool
+    default: false
+  cache_path:
+    description:
+      - Directory of the cache.
+      - Defaults to C(~/.cache/opentelekomcloud/ces).
+    type: path
+  cache_ttl:
+    description:
+      - Seconds cached datapoints are kept.
+    type: int
+    default: 2592000
   period:
     description:
       - Specifies the monitoring granularity
@@ -53,8 +125,8 @@ options:
   dim0:
     description:
       - Specifies the first monitoring dimension
+      - Required unless I(metrics) is set.
     type: str
-    required: true
   dim1:
     description:
       - Specifies the second monitoring dimension
@@ -70,8 +142,11 @@ requirements: ["openstacksdk", "otcextensions"]
 
 RETURN = '''
 metricdata:
-    description: Dictionary of Metric Data
-    returned: changed
+    description:
+      - Dictionary of Metric Data
+      - With I(rollup) the datapoints are replaced by C(rollup), a list of
+        C(timestamp), C(count) and the requested statistics per interval.
+    returned: changed and I(metrics) is not set
     type: list
     sample: [
       {
@@ -130,6 +205,35 @@ metricdata:
         "name": null
       }
     ]
+series:
+    description:
+      - Metric data per series, keyed by namespace, metric name and
+        dimensions. Series without data are null.
+      - With I(output_file) every series is written as a line including its
+        C(key).
+    returned: changed and I(metrics) is set
+    type: dict
+    sample: {
+      "SYS.ECS/cpu_util/instance_id=6a4b7c5e-6c9d-4594-9d6b-80da84491bec": {
+        "namespace": "SYS.ECS",
+        "metric_name": "cpu_util",
+        "dimensions": [
+          {"name": "instance_id", "value": "6a4b7c5e-6c9d-4594-9d6b-80da84491bec"}
+        ],
+        "unit": "%",
+        "datapoints": [{"average": 0.5, "timestamp": 1605618024000}]
+      }
+    }
+api_calls:
+    description: Number of queries sent.
+    returned: changed
+    type: int
+    sample: 1
+cache:
+    description: Number of series found in the cache and not found.
+    returned: When I(cache) is set.
+    type: dict
+    sample: {"hit": 2, "miss": 1}
 '''
 
 EXAMPLES = '''
@@ -142,52 +246,284 @@ EXAMPLES = '''
     period: 1
     filter: average
     dim0: "instance_id,123456789-6c9d-4594-9d6b-80da84491bec"
+
+# Query CPU and memory of many instances at once
+- opentelekomcloud.cloud.ces_metric_data_info:
+    time_from: "1605617014387"
+    time_to: "1605618214387"
+    period: 300
+    filter: average
+    metrics:
+      - namespace: "SYS.ECS"
+        metric_name: "cpu_util"
+        dimensions: ["instance_id,6a4b7c5e-6c9d-4594-9d6b-80da84491bec"]
+      - namespace: "SYS.ECS"
+        metric_name: "cpu_util"
+        dimensions: ["instance_id,0b1a9f7e-2f5d-4c61-8a0e-6f0f5b7f2a64"]
+      - namespace: "AGT.ECS"
+        metric_name: "mem_usedPercent"
+        dimensions: ["instance_id,6a4b7c5e-6c9d-4594-9d6b-80da84491bec"]
+
+# Poll the last day of a metric, only new datapoints are fetched
+- opentelekomcloud.cloud.ces_metric_data_info:
+    namespace: "SYS.ECS"
+    metric_name: "cpu_util"
+    time_from: "{{ (now(utc=true).timestamp() * 1000 - 86400000) | int }}"
+    time_to: "{{ (now(utc=true).timestamp() * 1000) | int }}"
+    period: 300
+    filter: average
+    dim0: "instance_id,123456789-6c9d-4594-9d6b-80da84491bec"
+    cache: true
 '''
 
+from ansible_collections.opentelekomcloud.cloud.plugins.module_utils.ces import DEFAULT_CACHE_TTL
+from ansible_collections.opentelekomcloud.cloud.plugins.module_utils.ces import MetricCache
+from ansible_collections.opentelekomcloud.cloud.plugins.module_utils.ces import ROLLUPS
+from ansible_collections.opentelekomcloud.cloud.plugins.module_utils.ces import merge_datapoints
+from ansible_collections.opentelekomcloud.cloud.plugins.module_utils.ces import rollup
+from ansible_collections.opentelekomcloud.cloud.plugins.module_utils.ces import split_range
+from ansible_collections.opentelekomcloud.cloud.plugins.module_utils.concurrency import run_all
 from ansible_collections.opentelekomcloud.cloud.plugins.module_utils.otc import OTCModule
+from ansible_collections.opentelekomcloud.cloud.plugins.module_utils.otc import project_resource
+
+# Maximum number of series of a batch query
+BATCH_LIMIT = 500
+
+
+def _dimensions(dims):
+    """Dimensions of the batch API from the `name,value` format."""
+    result = []
+    for dim in dims:
+        name, _, value = dim.partition(',')
+        result.append(dict(name=name, value=value))
+    return result
+
+
+def _series_key(metric):
+    return '/'.join([metric['namespace'], metric['metric_name']] + [
+        '%s=%s' % (dim['name'], dim['value'])
+        for dim in metric.get('dimensions') or []])
 
 
 class CesMetricDataInfoModule(OTCModule):
+    info_module = True
+    info_paging = False
+
     argument_spec = dict(
-        namespace=dict(required=True),
-        metric_name=dict(required=True),
+        namespace=dict(required=False),
+        metric_name=dict(required=False),
+        metrics=dict(
+            required=False, type='list', elements='dict',
+            options=dict(
+                namespace=dict(required=True),
+                metric_name=dict(required=True),
+                dimensions=dict(required=True, type='list', elements='str'))),
         time_from=dict(required=True),
         time_to=dict(required=True),
         period=dict(required=True, type='int'),
         filter=dict(required=True),
-        dim0=dict(required=True),
+        dim0=dict(required=False),
         dim1=dict(required=False),
         dim2=dict(required=False),
+        parallelism=dict(required=False, type='int', default=4),
+        window=dict(required=False, type='int'),
+        rollup=dict(required=False, type='list', elements='str',
+                    choices=list(ROLLUPS)),
+        rollup_interval=dict(required=False, type='int'),
+        cache=dict(required=False, type='bool', default=False),
+        cache_path=dict(required=False, type='path'),
+        cache_ttl=dict(required=False, type='int', default=DEFAULT_CACHE_TTL),
     )
     module_kwargs = dict(
-        supports_check_mode=True
+        supports_check_mode=True,
+        mutually_exclusive=[
+            ('metrics', 'namespace'),
+            ('metrics', 'metric_name'),
+            ('metrics', 'dim0'),
+        ],
+        required_one_of=[('metrics', 'metric_name')],
+        required_together=[('namespace', 'metric_name', 'dim0')],
     )
 
+    def _finish(self, metric):
+        """Metric data of all windows, rolled up if requested."""
+        if self.params['rollup']:
+            metric['rollup'] = rollup(
+                metric.pop('datapoints'), self.params['filter'],
+                self.params['rollup'], self.params['rollup_interval'],
+                int(self.params['time_from']))
+        return self.project(metric)
+
+    def _range(self):
+        return int(self.params['time_from']), int(self.params['time_to'])
+
+    def _windows(self, ranges):
+        windows = []
+        for time_from, time_to in ranges:
+            windows.extend(split_range(time_from, time_to,
+                                       self.params['period'],
+                                       self.params['window']))
+        return windows
+
+    def _run_all(self, func, tasks):
+        outcomes = run_all(func, tasks, workers=self.params['parallelism'])
+        errors = [str(outcome.error) for outcome in outcomes
+                  if outcome.error is not None]
+        if errors:
+            self.fail_json(msg='Failed %d of %d queries: %s' % (
+                len(errors), len(tasks), '; '.join(errors)))
+        return outcomes
+
+    def _cache_key(self, metric):
+        return '%s/%s/%s' % (_series_key(metric), self.params['period'],
+                             self.params['filter'])
+
+    def _cached(self, metrics):
+        """Cached series of the metrics and the ranges still to fetch."""
+        if not self.params['cache']:
+            return None, [[self._range()] for metric in metrics]
+        self.cache = MetricCache(self.params['cache_path'],
+                                 self.params['cache_ttl'])
+        self.cache.prune()
+        series = [self.cache.load(self._cache_key(metric))
+                  for metric in metrics]
+        self.cache_stats = dict(
+            hit=sum(1 for cached in series if cached),
+            miss=sum(1 for cached in series if not cached))
+        return series, [cached.missing(*self._range()) for cached in series]
+
+    def _store(self, metric, cached, found, points, ranges):
+        """Merge fetched datapoints into the cache.
+
+        Returns:
+            The metric with the datapoints of the range, None if the series
+            has no data.
+        """
+        if ranges:
+            cached.update(found, merge_datapoints(*points),
+                          self.params['filter'], ranges[0][0], ranges[-1][1])
+        self.cache.save(self._cache_key(metric), cached)
+        if not cached:
+            return None
+        metric = dict(cached.metric or {})
+        metric['datapoints'] = cached.datapoints(*self._range())
+        return metric
+
+    def _exit(self, **result):
+        if self.params['cache']:
+            result['cache'] = self.cache_stats
+        self.exit(changed=False, **result)
+
+    def _batch_query(self, task):
+        """Query up to BATCH_LIMIT series in one time window."""
+        metrics, (time_from, time_to) = task
+        body = {
+            'metrics': metrics,
+            'from': time_from,
+            'to': time_to,
+            'period': str(self.params['period']),
+            'filter': self.params['filter'],
+        }
+        response = self.conn.ces.post('/batch-query-metric-data', json=body,
+                                      raise_exc=False)
+        self.sdk.exceptions.raise_from_response(response)
+        return response.json().get('metrics') or []
+
+    def _batch(self):
+        metrics = []
+        for metric in self.params['metrics']:
+            metrics.append(dict(
+                namespace=metric['namespace'],
+                metric_name=metric['metric_name'],
+                dimensions=_dimensions(metric['dimensions'])))
+        cached, ranges = self._cached(metrics)
+
+        # Series missing the same ranges are queried together
+        groups = {}
+        for metric, missing in zip(metrics, ranges):
+            groups.setdefault(tuple(missing), []).append(metric)
+        tasks = []
+        for missing, group in groups.items():
+            windows = self._windows(missing)
+            for i in range(0, len(group), BATCH_LIMIT):
+                tasks.extend((group[i:i + BATCH_LIMIT], window)
+                             for window in windows)
+        outcomes = self._run_all(self._batch_query, tasks)
+
+        found = dict((_series_key(metric), None) for metric in metrics)
+        points = dict((key, []) for key in found)
+        for outcome in outcomes:
+            for metric in outcome.result:
+                key = _series_key(metric)
+                points[key].append(metric.pop('datapoints', None) or [])
+                found[key] = metric
+        series = {}
+        for i, metric in enumerate(metrics):
+            key = _series_key(metric)
+            if cached is not None:
+                found[key] = self._store(metric, cached[i], found[key],
+                                         points[key], ranges[i])
+            elif found[key] is not None:
+                found[key]['datapoints'] = merge_datapoints(*points[key])
+            if found[key] is not None:
+                found[key] = self._finish(found[key])
+            series[key] = found[key]
+        if self.params['output_file']:
+            data = self.result_list()
+            data.extend(dict(metric or {}, key=key)
+                        for key, metric in series.items())
+            series = data
+        self._exit(
+            series=series,
+            api_calls=len(tasks)
+        )
+
     def run(self):
+        if self.params['metrics']:
+            self._batch()
 
-        data = []
+        data = self.result_list()
         query = {}
 
         query['namespace'] = self.params['namespace']
-        query['from'] = self.params['time_from']
-        query['to'] = self.params['time_to']
         query['metric_name'] = self.params['metric_name']
         query['period'] = self.params['period']
         query['filter'] = self.params['filter']
         query['dim.0'] = self.params['dim0']
+        dims = [self.params['dim0']]
         if self.params['dim1']:
             query['dim.1'] = self.params['dim1']
+            dims.append(self.params['dim1'])
             if self.params['dim2']:
                 query['dim.2'] = self.params['dim2']
+                dims.append(self.params['dim2'])
+        series = dict(namespace=query['namespace'],
+                      metric_name=query['metric_name'],
+                      dimensions=_dimensions(dims))
+        cached, ranges = self._cached([series])
+
+        def query_window(window):
+            return [project_resource(raw) for raw in self.conn.ces.metric_data(
+                **dict(query, **{'from': window[0], 'to': window[1]}))]
 
-        for raw in self.conn.ces.metric_data(**query):
-            dt = raw.to_dict()
-            dt.pop('location')
-            data.append(dt)
+        windows = self._windows(ranges[0])
+        metric = None
+        points = []
+        for outcome in self._run_all(query_window, windows):
+            for raw in outcome.result:
+                points.append(raw.pop('datapoints') or [])
+                metric = metric or raw
+        if cached is not None:
+            metric = self._store(series, cached[0], metric, points,
+                                 ranges[0])
+        elif metric is not None:
+            metric['datapoints'] = merge_datapoints(*points)
+        if metric is not None:
+            data.append(self._finish(metric))
 
-        self.exit(
-            changed=False,
-            metricdata=data
+        self._exit(
+            metricdata=data,
+            api_calls=len(windows)
         )
 
 
@@ -14,7 +14,9 @@
 DOCUMENTATION = '''
 module: ces_metrics_info
 short_description: Get Metrics
-extends_documentation_fragment: opentelekomcloud.cloud.otc
+extends_documentation_fragment:
+  - opentelekomcloud.cloud.otc
+  - opentelekomcloud.cloud.otc.info
 version_added: "0.3.0"
 author: "Sebastian Gode (@SebastianGode)"
 description:
@@ -111,6 +113,8 @@ from ansible_collections.opentelekomcloud.cloud.plugins.module_utils.otc import
 
 
 class CesMetricsInfoModule(OTCModule):
+    info_module = True
+
     argument_spec = dict(
         metric_name=dict(required=False),
         namespace=dict(required=False),
@@ -124,7 +128,7 @@ class CesMetricsInfoModule(OTCModule):
 
     def run(self):
 
-        data = []
+        data = self.result_list()
         query = {}
 
         if self.params['namespace']:
@@ -135,9 +139,8 @@ class CesMetricsInfoModule(OTCModule):
             query['start'] = self.params['start']
         query['order'] = self.params['order']
 
-        for raw in self.conn.ces.metrics(**query):
-            dt = raw.to_dict()
-            dt.pop('location')
+        for raw in self.paged(self.conn.ces.metrics, **query):
+            dt = self.project(raw)
             data.append(dt)
 
         self.exit(
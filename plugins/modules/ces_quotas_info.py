@@ -14,7 +14,9 @@
 DOCUMENTATION = '''
 module: ces_quotas_info
 short_description: Get ressource Quotas
-extends_documentation_fragment: opentelekomcloud.cloud.otc
+extends_documentation_fragment:
+  - opentelekomcloud.cloud.otc
+  - opentelekomcloud.cloud.otc.info
 version_added: "0.3.0"
 author: "Sebastian Gode (@SebastianGode)"
 description:
@@ -55,6 +57,8 @@ from ansible_collections.opentelekomcloud.cloud.plugins.module_utils.otc import
 
 
 class CesQuotasInfoModule(OTCModule):
+    info_module = True
+
     argument_spec = dict()
     module_kwargs = dict(
         supports_check_mode=True
@@ -62,12 +66,11 @@ class CesQuotasInfoModule(OTCModule):
 
     def run(self):
 
-        data = []
+        data = self.result_list()
         query = {}
 
-        for raw in self.conn.ces.quotas(**query):
-            dt = raw.to_dict()
-            dt.pop('location')
+        for raw in self.paged(self.conn.ces.quotas, **query):
+            dt = self.project(raw)
             data.append(dt)
 
         self.exit(
@@ -14,7 +14,9 @@
 DOCUMENTATION = '''
 module: css_cluster_info
 short_description: Get info about CSS clusters.
-extends_documentation_fragment: opentelekomcloud.cloud.otc
+extends_documentation_fragment:
+  - opentelekomcloud.cloud.otc
+  - opentelekomcloud.cloud.otc.info
 version_added: "0.9.0"
 author:
     - "Yustina Kvrivishvili (@YustinaKvr)"
@@ -186,6 +188,8 @@ from ansible_collections.opentelekomcloud.cloud.plugins.module_utils.otc import
 
 
 class CSSClusterInfoModule(OTCModule):
+    info_module = True
+
     argument_spec = dict(
         name=dict(),
         start=dict(type='int', default=1),
@@ -198,23 +202,21 @@ class CSSClusterInfoModule(OTCModule):
     otce_min_version = '0.24.1'
 
     def run(self):
-        data = []
+        data = self.result_list()
         if self.params['name']:
             raw = self.conn.css.find_cluster(
                 name_or_id=self.params['name'], ignore_missing=True
             )
             if raw:
-                dt = raw.to_dict()
-                dt.pop('location')
+                dt = self.project(raw)
                 data.append(dt)
         else:
             kwargs = {k: self.params[k]
                       for k in ['start', 'limit']
                       if self.params[k] is not None}
 
-            for raw in self.conn.css.clusters(**kwargs):
-                dt = raw.to_dict()
-                dt.pop('location')
+            for raw in self.paged(self.conn.css.clusters, **kwargs):
+                dt = self.project(raw)
                 data.append(dt)
 
         self.exit_json(changed=False, css_clusters=data)
@@ -15,7 +15,9 @@ DOCUMENTATION = '''
 ---
 module: css_snapshot_info
 short_description: Get CSS snapshot info
-extends_documentation_fragment: opentelekomcloud.cloud.otc
+extends_documentation_fragment:
+  - opentelekomcloud.cloud.otc
+  - opentelekomcloud.cloud.otc.info
 version_added: "0.9.0"
 author: "Vladimir Vshivkov (@enrrou)"
 description:
@@ -113,6 +115,8 @@ from ansible_collections.opentelekomcloud.cloud.plugins.module_utils.otc import
 
 class CssSnapshotInfoModule(OTCModule):
 
+    info_module = True
+
     argument_spec = dict(
         cluster=dict(required=False),
         name=dict(required=False)
@@ -123,7 +127,7 @@ class CssSnapshotInfoModule(OTCModule):
     )
 
     def run(self):
-        data = []
+        data = self.result_list()
 
         if self.params['cluster']:
             cluster = self.conn.css.find_cluster(
@@ -138,14 +142,12 @@ class CssSnapshotInfoModule(OTCModule):
                 cluster, self.params['name'], ignore_missing=True
             )
             if raw:
-                dt = raw.to_dict()
-                dt.pop('location')
+                dt = self.project(raw)
                 data.append(dt)
 
         else:
-            for raw in self.conn.css.snapshots(cluster):
-                dt = raw.to_dict()
-                dt.pop('location')
+            for raw in self.paged(self.conn.css.snapshots, cluster):
+                dt = self.project(raw)
                 data.append(dt)
 
         self.exit_json(
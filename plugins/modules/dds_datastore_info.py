@@ -8,7 +8,9 @@
 DOCUMENTATION = '''
 module: dds_datastore_info
 short_description: Obtain database version information about a specified type of a DB instance.
-extends_documentation_fragment: opentelekomcloud.cloud.otc
+extends_documentation_fragment:
+  - opentelekomcloud.cloud.otc
+  - opentelekomcloud.cloud.otc.info
 version_added: "0.9.0"
 author: "Yustina Kvrivishvili (@YustinaKvr)"
 description:
@@ -50,6 +52,8 @@ from ansible_collections.opentelekomcloud.cloud.plugins.module_utils.otc import
 
 
 class DDSDatastoreInfo(OTCModule):
+    info_module = True
+
     argument_spec = dict(
         datastore_name=dict(required=True)
     )
@@ -60,12 +64,11 @@ class DDSDatastoreInfo(OTCModule):
     def run(self):
         datastore_name = self.params['datastore_name']
 
-        data = []
-        for raw in self.conn.dds.datastores(datastore_name):
-            dt = raw.to_dict()
-            dt.pop('location')
-            dt.pop('id')
-            dt.pop('name')
+        data = self.result_list()
+        for raw in self.paged(self.conn.dds.datastores, datastore_name):
+            dt = self.project(raw)
+            dt.pop('id', None)
+            dt.pop('name', None)
             data.append(dt)
 
         self.exit(
@@ -8,7 +8,9 @@
 DOCUMENTATION = '''
 module: dds_flavor_info
 short_description: Obtain flavor type information about a specified region and DB type.
-extends_documentation_fragment: opentelekomcloud.cloud.otc
+extends_documentation_fragment:
+  - opentelekomcloud.cloud.otc
+  - opentelekomcloud.cloud.otc.info
 version_added: "0.9.0"
 author: "Yustina Kvrivishvili (@YustinaKvr)"
 description:
@@ -71,6 +73,8 @@ from ansible_collections.opentelekomcloud.cloud.plugins.module_utils.otc import
 
 
 class DDSFlavorInfo(OTCModule):
+    info_module = True
+
     argument_spec = dict(
         region=dict(required=True),
         engine_name=dict(default='DDS-Community'),
@@ -83,10 +87,9 @@ class DDSFlavorInfo(OTCModule):
         region = self.params['region']
         engine_name = self.params['engine_name']
 
-        data = []
-        for raw in self.conn.dds.flavors(region=region, engine_name=engine_name):
-            dt = raw.to_dict()
-            dt.pop('location')
+        data = self.result_list()
+        for raw in self.paged(self.conn.dds.flavors, region=region, engine_name=engine_name):
+            dt = self.project(raw)
             data.append(dt)
 
         self.exit(
@@ -8,7 +8,9 @@
 DOCUMENTATION = '''
 module: dds_instance_info
 short_description: Obtain information about a specified DB instance.
-extends_documentation_fragment: opentelekomcloud.cloud.otc
+extends_documentation_fragment:
+  - opentelekomcloud.cloud.otc
+  - opentelekomcloud.cloud.otc.info
 version_added: "0.9.0"
 author: "Yustina Kvrivishvili (@YustinaKvr)"
 description:
@@ -256,6 +258,8 @@ from ansible_collections.opentelekomcloud.cloud.plugins.module_utils.otc import
 
 
 class DDSInstanceInfo(OTCModule):
+    info_module = True
+
     argument_spec = dict(
         instance=dict(),
         mode=dict(choices=['sharding', 'replicaset']),
@@ -269,7 +273,7 @@ class DDSInstanceInfo(OTCModule):
 
     def run(self):
 
-        data = []
+        data = self.result_list()
         query = {}
 
         instance = self.params['instance']
@@ -299,9 +303,8 @@ class DDSInstanceInfo(OTCModule):
             if subnet:
                 query['subnet_id'] = subnet.id
 
-        for raw in self.conn.dds.instances(**query):
-            dt = raw.to_dict()
-            dt.pop('location')
+        for raw in self.paged(self.conn.dds.instances, **query):
+            dt = self.project(raw)
             data.append(dt)
 
         self.exit(
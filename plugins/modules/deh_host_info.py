@@ -14,7 +14,9 @@
 DOCUMENTATION = '''
 module: deh_host_info
 short_description: Get Dedicated host info
-extends_documentation_fragment: opentelekomcloud.cloud.otc
+extends_documentation_fragment:
+  - opentelekomcloud.cloud.otc
+  - opentelekomcloud.cloud.otc.info
 version_added: "0.1.2"
 author: "Tino Schreiber (@tischrei)"
 description:
@@ -162,6 +164,9 @@ from ansible_collections.opentelekomcloud.cloud.plugins.module_utils.otc import
 
 
 class DehHostInfoModule(OTCModule):
+    info_module = True
+    marker_paging = True
+
     argument_spec = dict(
         availability_zone=dict(required=False),
         changes_since=dict(required=False),
@@ -182,7 +187,7 @@ class DehHostInfoModule(OTCModule):
 
     def run(self):
 
-        data = []
+        data = self.result_list()
         query = {}
 
         if self.params['host']:
@@ -218,9 +223,8 @@ class DehHostInfoModule(OTCModule):
         if self.params['tags']:
             query['tags'] = self.params['tags']
 
-        for raw in self.conn.deh.hosts(**query):
-            dt = raw.to_dict()
-            dt.pop('location')
+        for raw in self.paged(self.conn.deh.hosts, **query):
+            dt = self.project(raw)
             data.append(dt)
 
         self.exit(
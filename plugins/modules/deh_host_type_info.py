@@ -14,7 +14,9 @@
 DOCUMENTATION = '''
 module: deh_host_type_info
 short_description: Get info about all available host types in a AZ
-extends_documentation_fragment: opentelekomcloud.cloud.otc
+extends_documentation_fragment:
+  - opentelekomcloud.cloud.otc
+  - opentelekomcloud.cloud.otc.info
 version_added: "0.1.2"
 author: "Tino Schreiber (@tischrei)"
 description:
@@ -85,6 +87,8 @@ from ansible_collections.opentelekomcloud.cloud.plugins.module_utils.otc import
 
 
 class DehHostTypeInfoModule(OTCModule):
+    info_module = True
+
     argument_spec = dict(
         az=dict(required=True)
     )
@@ -94,15 +98,14 @@ class DehHostTypeInfoModule(OTCModule):
 
     def run(self):
 
-        data = []
+        data = self.result_list()
         query = {}
 
         if self.params['az']:
             query['az'] = self.params['az']
 
-        for raw in self.conn.deh.host_types(**query):
-            dt = raw.to_dict()
-            dt.pop('location')
+        for raw in self.paged(self.conn.deh.host_types, **query):
+            dt = self.project(raw)
             data.append(dt)
 
         self.exit(
@@ -14,7 +14,9 @@
 DOCUMENTATION = '''
 module: deh_server_info
 short_description: Get info about ECSs on a Dedicated host
-extends_documentation_fragment: opentelekomcloud.cloud.otc
+extends_documentation_fragment:
+  - opentelekomcloud.cloud.otc
+  - opentelekomcloud.cloud.otc.info
 version_added: "0.1.2"
 author: "Tino Schreiber (@tischrei)"
 description:
@@ -119,6 +121,8 @@ from ansible_collections.opentelekomcloud.cloud.plugins.module_utils.otc import
 
 
 class DehServerInfoModule(OTCModule):
+    info_module = True
+
     argument_spec = dict(
         dedicated_host=dict(required=True)
     )
@@ -128,7 +132,7 @@ class DehServerInfoModule(OTCModule):
 
     def run(self):
 
-        data = []
+        data = self.result_list()
         query = {}
 
         if self.params['dedicated_host']:
@@ -145,9 +149,8 @@ class DehServerInfoModule(OTCModule):
                              self.params['dedicated_host'])
                 )
 
-        for raw in self.conn.deh.servers(**query):
-            dt = raw.to_dict()
-            dt.pop('location')
+        for raw in self.paged(self.conn.deh.servers, **query):
+            dt = self.project(raw)
             data.append(dt)
 
         self.exit(
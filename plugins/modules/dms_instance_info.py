@@ -14,7 +14,9 @@
 DOCUMENTATION = '''
 module: dms_instance_info
 short_description: Get info about DMS instances
-extends_documentation_fragment: opentelekomcloud.cloud.otc
+extends_documentation_fragment:
+  - opentelekomcloud.cloud.otc
+  - opentelekomcloud.cloud.otc.info
 version_added: "0.1.2"
 author: "Sebastian Gode (@SebastianGode)"
 description:
@@ -115,6 +117,8 @@ from ansible_collections.opentelekomcloud.cloud.plugins.module_utils.otc import
 
 
 class DmsInstanceInfoModule(OTCModule):
+    info_module = True
+
     argument_spec = dict(
         engine=dict(required=False),
         name=dict(required=False),
@@ -130,7 +134,7 @@ class DmsInstanceInfoModule(OTCModule):
 
     def run(self):
 
-        data = []
+        data = self.result_list()
         query = {}
 
         if self.params['engine']:
@@ -146,9 +150,8 @@ class DmsInstanceInfoModule(OTCModule):
         if self.params['exactMatchName']:
             query['exactMatchName'] = self.params['exactMatchName']
 
-        for raw in self.conn.dms.instances(**query):
-            dt = raw.to_dict()
-            dt.pop('location')
+        for raw in self.paged(self.conn.dms.instances, **query):
+            dt = self.project(raw)
             data.append(dt)
         self.exit(
             changed=False,
@@ -14,7 +14,9 @@
 DOCUMENTATION = '''
 module: dms_instance_topic_info
 short_description: Get info about DMS instance topics
-extends_documentation_fragment: opentelekomcloud.cloud.otc
+extends_documentation_fragment:
+  - opentelekomcloud.cloud.otc
+  - opentelekomcloud.cloud.otc.info
 version_added: "0.1.2"
 author: "Sebastian Gode (@SebastianGode)"
 description:
@@ -91,6 +93,8 @@ from ansible_collections.opentelekomcloud.cloud.plugins.module_utils.otc import
 
 
 class DmsInstanceTopicInfoModule(OTCModule):
+    info_module = True
+
     argument_spec = dict(
         instance=dict(required=True),
     )
@@ -100,13 +104,12 @@ class DmsInstanceTopicInfoModule(OTCModule):
 
     def run(self):
 
-        data = []
+        data = self.result_list()
         instance = self.conn.dms.find_instance(name_or_id=self.params['instance'], ignore_missing=True)
 
         if instance:
-            for raw in self.conn.dms.topics(instance):
-                dt = raw.to_dict()
-                dt.pop('location')
+            for raw in self.paged(self.conn.dms.topics, instance):
+                dt = self.project(raw)
                 data.append(dt)
             self.exit(
                 changed=False,
@@ -14,7 +14,9 @@
 DOCUMENTATION = '''
 module: dms_queue_group_info
 short_description: Get info about DMS queue groups
-extends_documentation_fragment: opentelekomcloud.cloud.otc
+extends_documentation_fragment:
+  - opentelekomcloud.cloud.otc
+  - opentelekomcloud.cloud.otc.info
 version_added: "0.1.2"
 author: "Sebastian Gode (@SebastianGode)"
 description:
@@ -64,6 +66,8 @@ from ansible_collections.opentelekomcloud.cloud.plugins.module_utils.otc import
 
 
 class DmsQueueInfoModule(OTCModule):
+    info_module = True
+
     argument_spec = dict(
         queue=dict(required=True),
         include_deadletter=dict(required=False, type='bool', default='false')
@@ -74,7 +78,7 @@ class DmsQueueInfoModule(OTCModule):
 
     def run(self):
 
-        data = []
+        data = self.result_list()
         query = {}
 
         queue = self.conn.dms.find_queue(
@@ -83,9 +87,8 @@ class DmsQueueInfoModule(OTCModule):
         if self.params['include_deadletter']:
             query['include_deadletter'] = self.params['include_deadletter']
         if queue:
-            for raw in self.conn.dms.groups(queue.id, **query):
-                dt = raw.to_dict()
-                dt.pop('location')
+            for raw in self.paged(self.conn.dms.groups, queue.id, **query):
+                dt = self.project(raw)
                 data.append(dt)
             self.exit(
                 changed=False,
@@ -14,7 +14,9 @@
 DOCUMENTATION = '''
 module: dms_queue_info
 short_description: Get info about DMS queues
-extends_documentation_fragment: opentelekomcloud.cloud.otc
+extends_documentation_fragment:
+  - opentelekomcloud.cloud.otc
+  - opentelekomcloud.cloud.otc.info
 version_added: "0.1.2"
 author: "Sebastian Gode (@SebastianGode)"
 description:
@@ -58,6 +60,8 @@ from ansible_collections.opentelekomcloud.cloud.plugins.module_utils.otc import
 
 
 class DmsQueueInfoModule(OTCModule):
+    info_module = True
+
     argument_spec = dict(
         queue=dict(required=False)
     )
@@ -67,15 +71,14 @@ class DmsQueueInfoModule(OTCModule):
 
     def run(self):
 
-        data = []
+        data = self.result_list()
 
         if self.params['queue']:
             queue = self.conn.dms.find_queue(
                 name_or_id=self.params['queue']
             )
             if queue:
-                dt = queue.to_dict()
-                dt.pop('location')
+                dt = self.project(queue)
                 data.append(dt)
             else:
                 self.exit(
@@ -85,9 +88,8 @@ class DmsQueueInfoModule(OTCModule):
                              self.params['queue'])
                 )
         else:
-            for raw in self.conn.dms.queues():
-                dt = raw.to_dict()
-                dt.pop('location')
+            for raw in self.paged(self.conn.dms.queues):
+                dt = self.project(raw)
                 data.append(dt)
 
         self.exit(
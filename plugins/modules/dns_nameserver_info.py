@@ -14,7 +14,9 @@
 DOCUMENTATION = '''
 module: dns_nameserver_info
 short_description: Get info about DNS nameservers.
-extends_documentation_fragment: opentelekomcloud.cloud.otc
+extends_documentation_fragment:
+  - opentelekomcloud.cloud.otc
+  - opentelekomcloud.cloud.otc.info
 version_added: "0.12.2"
 author: "Anton Sidelnikov (@anton-sidelnikov)"
 description:
@@ -60,6 +62,8 @@ from ansible_collections.opentelekomcloud.cloud.plugins.module_utils.otc import
 
 class DNSNameserverInfoModule(OTCModule):
 
+    info_module = True
+
     argument_spec = dict(
         zone=dict(required=True),
     )
@@ -69,7 +73,7 @@ class DNSNameserverInfoModule(OTCModule):
 
     def run(self):
 
-        data = []
+        data = self.result_list()
         query = {}
 
         if self.params['zone']:
@@ -79,11 +83,10 @@ class DNSNameserverInfoModule(OTCModule):
             except self.sdk.exceptions.ResourceNotFound:
                 self.fail_json(msg="Zone not found")
 
-        for raw in self.conn.dns.nameservers(**query):
-            dt = raw.to_dict()
-            dt.pop('location')
-            dt.pop('name')
-            dt.pop('id')
+        for raw in self.paged(self.conn.dns.nameservers, **query):
+            dt = self.project(raw)
+            dt.pop('name', None)
+            dt.pop('id', None)
             data.append(dt)
 
         self.exit(
@@ -14,7 +14,9 @@
 DOCUMENTATION = '''
 module: dns_recordset_info
 short_description: Get info about DNS recordsets.
-extends_documentation_fragment: opentelekomcloud.cloud.otc
+extends_documentation_fragment:
+  - opentelekomcloud.cloud.otc
+  - opentelekomcloud.cloud.otc.info
 version_added: "0.8.1"
 author: "Yustina Kvrivishvili (@YustinaKvr)"
 description:
@@ -44,6 +46,16 @@ options:
       - Type of the recordsets to be queried.
     choices: [a, aaaa, mx, cname, txt, ns, srv, caa, ptr]
     type: str
+  name_prefix:
+    description:
+      - Only recordsets whose name starts with the prefix are returned.
+      - The API matches names fuzzy, the prefix is checked on the result.
+    type: str
+  limit:
+    description:
+      - Number of recordsets requested per page.
+    type: int
+    default: 500
 requirements: ["openstacksdk", "otcextensions"]
 '''
 
@@ -51,7 +63,7 @@ RETURN = '''
 recordset:
   description: List of dictionaries describing recordset and its metadata.
   type: complex
-  returned: On Success.
+  returned: On Success when I(output_file) is not set.
   contains:
     created_at:
       description: Timestamp when recordset had been created
@@ -81,6 +93,22 @@ recordset:
       description: Record set value.
       type: list
       sample: ["2.2.2.2", "1.1.1.1"]
+count:
+  description: Number of recordsets found.
+  type: int
+  returned: On Success.
+  sample: 2
+next_marker:
+  description: ID of the last recordset if listing stopped at I(max_items).
+  type: str
+  returned: When more recordsets may exist.
+  sample: "ff80808275f5fb9c01799efcd1307062"
+output_file:
+  description: File the recordsets were written to.
+  type: dict
+  returned: When I(output_file) is set.
+  sample: {"path": "/tmp/recordsets.jsonl", "count": 2,
+           "checksum": "sha256:6b86b273ff34fce19d6b804eff5a3f5747ada4eaa22f1d49c01e52ddb7875b4b"}
 '''
 
 EXAMPLES = '''
@@ -89,6 +117,21 @@ EXAMPLES = '''
     zone: "ff80808275f5fc0f017e886898315ee9"
     name: "ff80808275f5fc0f017e886898315ee2"
   register: recordsets
+
+# Write names and records of all A recordsets of a large zone to a file
+- opentelekomcloud.cloud.dns_recordset_info:
+    zone: "example.com."
+    type: a
+    name_prefix: "web"
+    fields: [name, records]
+    output_file: /tmp/recordsets.jsonl
+  register: recordsets
+
+# Get the first 100 recordsets and the marker of the next page
+- opentelekomcloud.cloud.dns_recordset_info:
+    zone: "example.com."
+    max_items: 100
+  register: page
 '''
 
 from ansible_collections.opentelekomcloud.cloud.plugins.module_utils.otc import OTCModule
@@ -96,6 +139,9 @@ from ansible_collections.opentelekomcloud.cloud.plugins.module_utils.otc import
 
 class DNSRecordsetInfoModule(OTCModule):
 
+    info_module = True
+    marker_paging = True
+
     argument_spec = dict(
         zone=dict(required=False),
         name=dict(required=False),
@@ -103,16 +149,23 @@ class DNSRecordsetInfoModule(OTCModule):
         status=dict(required=False, choices=['active', 'error', 'disable', 'freeze',
                                              'pending_create', 'pending_update', 'pending_delete']),
         type=dict(required=False, choices=['a', 'aaaa', 'mx', 'cname', 'txt', 'ns', 'srv', 'caa',
-                                           'ptr'])
+                                           'ptr']),
+        name_prefix=dict(required=False),
+        limit=dict(required=False, type='int', default=500)
     )
     module_kwargs = dict(
         supports_check_mode=True,
-        required_if=[('name', not None, ['zone'])]
+        required_if=[('name', not None, ['zone'])],
+        mutually_exclusive=[('name', 'name_prefix')]
     )
 
+    def _emit(self, recordsets):
+        data = self.result_list()
+        data.extend(self.project(recordset) for recordset in recordsets)
+        return dict(recordset=data, count=len(data))
+
     def run(self):
 
-        data = []
         query = {}
         recordset = None
 
@@ -130,33 +183,35 @@ class DNSRecordsetInfoModule(OTCModule):
 
                     recordset = self.conn.dns.find_recordset(
                         ignore_missing=False, **query)
-                    dt = recordset.to_dict()
-                    dt.pop('location')
-                    data.append(dt)
-
-                    self.exit(
-                        changed=False,
-                        recordset=data
-                    )
                 except self.sdk.exceptions.ResourceNotFound:
                     self.fail_json(msg="Recordset not found")
+                self.exit(
+                    changed=False,
+                    **self._emit([recordset])
+                )
         if self.params['name']:
             query['name'] = self.params['name']
+        if self.params['name_prefix']:
+            query['name'] = self.params['name_prefix']
         if self.params['tags']:
             query['tags'] = self.params['tags']
         if self.params['status']:
             query['status'] = self.params['status'].upper()
         if self.params['type']:
             query['type'] = self.params['type'].upper()
+        if self.params['limit']:
+            query['limit'] = self.params['limit']
 
-        for raw in self.conn.dns.recordsets(**query):
-            dt = raw.to_dict()
-            dt.pop('location')
-            data.append(dt)
+        # The generator requests the next page only when it is reached
+        recordsets = self.paged(self.conn.dns.recordsets, **query)
+        if self.params['name_prefix']:
+            prefix = self.params['name_prefix'].lower()
+            recordsets = (rs for rs in recordsets
+                          if rs.name.lower().startswith(prefix))
 
         self.exit(
             changed=False,
-            recordset=data
+            **self._emit(recordsets)
         )
 
 
@@ -14,7 +14,9 @@
 DOCUMENTATION = '''
 module: dns_zone_info
 short_description: Get DNS Zones info
-extends_documentation_fragment: opentelekomcloud.cloud.otc
+extends_documentation_fragment:
+  - opentelekomcloud.cloud.otc
+  - opentelekomcloud.cloud.otc.projection
 version_added: "0.13.1"
 author: "Vladimir Vshivkov (@vladimirvshivkov)"
 description:
@@ -89,6 +91,10 @@ from ansible_collections.opentelekomcloud.cloud.plugins.module_utils.otc import
 
 
 class DNSZonesInfoModule(OTCModule):
+    info_module = True
+    info_paging = False
+    info_output = False
+
     argument_spec = dict(
         name=dict(required=True),
         zone_type=dict()
@@ -104,7 +110,7 @@ class DNSZonesInfoModule(OTCModule):
         }
 
         zone = self.conn.dns.find_zone(**query)
-        self.exit(changed=True, zone=zone.to_dict())
+        self.exit(changed=False, zone=self.project(zone))
 
 
 def main():
@@ -0,0 +1,271 @@
+#!/usr/bin/python
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+DOCUMENTATION = '''
+---
+module: dns_zone_records
+short_description: Synchronize all DNS Recordsets of a zone
+extends_documentation_fragment: opentelekomcloud.cloud.otc
+version_added: "0.16.0"
+author: "Open Telekom Cloud (@opentelekomcloud)"
+description:
+  - Synchronize the recordsets of a DNS zone with a complete list of
+    recordsets.
+  - Existing recordsets are listed page by page and identified by name and
+    type. Missing recordsets are created, changed recordsets are updated and,
+    with I(purge=true), recordsets not in the list are deleted.
+  - Recordsets created by default (SOA and NS of the zone) are never
+    deleted.
+options:
+  zone:
+    description:
+      - ID or name of the zone. If name had been provided, only public zone
+        could be found. If private zone is required, only ID should be passed.
+    type: str
+    required: true
+  recordsets:
+    description:
+      - Desired recordsets of the zone.
+    type: list
+    elements: dict
+    required: true
+    suboptions:
+      name:
+        description:
+          - Name of the recordset, relative to the zone or fully qualified
+            with a trailing dot. C(@) stands for the zone itself.
+        type: str
+        required: true
+      type:
+        description:
+          - Record set type, i.e. C(A), C(CNAME) or C(TXT).
+        type: str
+        required: true
+      records:
+        description:
+          - Records of the recordset.
+        type: list
+        elements: str
+        required: true
+      ttl:
+        description:
+          - Cache duration (in second) on a local DNS server.
+        type: int
+      description:
+        description:
+          - Description of the recordset.
+        type: str
+  purge:
+    description:
+      - Whether recordsets not in I(recordsets) are deleted.
+    type: bool
+    default: true
+  page_size:
+    description:
+      - Number of recordsets fetched per page.
+    type: int
+    default: 500
+  parallelism:
+    description:
+      - Number of recordsets created, updated or deleted at the same time.
+    type: int
+    default: 4
+  rate_limit:
+    description:
+      - Maximum number of changes sent per second, 0 disables the limit.
+    type: float
+    default: 10
+requirements: ["openstacksdk", "otcextensions"]
+'''
+
+RETURN = '''
+summary:
+  description: Number of recordsets per change.
+  type: dict
+  returned: On Success.
+  sample: {"create": 2, "update": 1, "delete": 0, "unchanged": 5012}
+created:
+  description: Created recordsets as C(name type).
+  type: list
+  returned: On Success.
+  sample: ["www.example.com. A"]
+updated:
+  description: Updated recordsets as C(name type).
+  type: list
+  returned: On Success.
+  sample: ["mail.example.com. MX"]
+deleted:
+  description: Deleted recordsets as C(name type).
+  type: list
+  returned: On Success.
+  sample: ["old.example.com. CNAME"]
+'''
+
+EXAMPLES = '''
+# Synchronize the recordsets of a zone
+- opentelekomcloud.cloud.dns_zone_records:
+    zone: "example.com."
+    recordsets:
+      - name: "@"
+        type: MX
+        records: ["10 mail.example.com."]
+      - name: www
+        type: A
+        ttl: 300
+        records: ["1.1.1.1", "2.2.2.2"]
+      - name: mail.example.com.
+        type: A
+        records: ["3.3.3.3"]
+  register: zone_records
+'''
+
+from ansible_collections.opentelekomcloud.cloud.plugins.module_utils.concurrency import run_all
+from ansible_collections.opentelekomcloud.cloud.plugins.module_utils.otc import OTCModule
+
+
+def _key_str(key):
+    return '%s %s' % key
+
+
+class DNSZoneRecordsModule(OTCModule):
+    argument_spec = dict(
+        zone=dict(required=True),
+        recordsets=dict(
+            required=True, type='list', elements='dict',
+            options=dict(
+                name=dict(required=True),
+                type=dict(required=True),
+                records=dict(required=True, type='list', elements='str'),
+                ttl=dict(required=False, type='int'),
+                description=dict(required=False))),
+        purge=dict(type='bool', default=True),
+        page_size=dict(type='int', default=500),
+        parallelism=dict(type='int', default=4),
+        rate_limit=dict(type='float', default=10)
+    )
+    module_kwargs = dict(
+        supports_check_mode=True
+    )
+
+    def _fqdn(self, zone, name):
+        if name == '@':
+            return zone.name.lower()
+        if not name.endswith('.'):
+            name = '%s.%s' % (name, zone.name)
+        return name.lower()
+
+    def _updates(self, current, desired):
+        """Attributes of the existing recordset which differ."""
+        attrs = {}
+        if sorted(current.records or []) != sorted(desired['records']):
+            attrs['records'] = desired['records']
+        if desired['ttl'] is not None and current.ttl != desired['ttl']:
+            attrs['ttl'] = desired['ttl']
+        if (desired['description'] is not None
+                and current.description != desired['description']):
+            attrs['description'] = desired['description']
+        return attrs
+
+    def run(self):
+        zone = self.conn.dns.find_zone(
+            name_or_id=self.params['zone'],
+            ignore_missing=True
+        )
+        if not zone:
+            self.fail_json(msg='No Zone found with name or id: %s'
+                               % self.params['zone'])
+
+        desired = {}
+        for recordset in self.params['recordsets']:
+            key = (self._fqdn(zone, recordset['name']),
+                   recordset['type'].upper())
+            if key in desired:
+                self.fail_json(msg='Recordset %s is given more than once'
+                                   % _key_str(key))
+            desired[key] = recordset
+
+        # The generator follows the pagination links page by page
+        current = {}
+        protected = set()
+        for recordset in self.conn.dns.recordsets(
+                zone=zone, limit=self.params['page_size']):
+            key = (recordset.name.lower(), recordset.type.upper())
+            current[key] = recordset
+            if recordset.is_default:
+                protected.add(key)
+
+        to_create = sorted(key for key in desired if key not in current)
+        to_update = {}
+        for key in desired:
+            if key in current:
+                attrs = self._updates(current[key], desired[key])
+                if attrs:
+                    to_update[key] = attrs
+        to_delete = []
+        if self.params['purge']:
+            to_delete = sorted(key for key in current
+                               if key not in desired and key not in protected)
+
+        result = dict(
+            changed=bool(to_create or to_update or to_delete),
+            summary=dict(
+                create=len(to_create), update=len(to_update),
+                delete=len(to_delete),
+                unchanged=len(desired) - len(to_create) - len(to_update)),
+            created=[_key_str(key) for key in to_create],
+            updated=[_key_str(key) for key in sorted(to_update)],
+            deleted=[_key_str(key) for key in to_delete])
+        if self.ansible.check_mode or not result['changed']:
+            self.exit_json(**result)
+
+        def create(key):
+            recordset = desired[key]
+            attrs = dict(name=key[0], type=key[1],
+                         records=recordset['records'])
+            for attr in ('ttl', 'description'):
+                if recordset[attr] is not None:
+                    attrs[attr] = recordset[attr]
+            return self.conn.dns.create_recordset(zone=zone, **attrs)
+
+        def update(key):
+            return self.conn.dns.update_recordset(
+                current[key], **to_update[key])
+
+        def delete(key):
+            # The listed recordset knows its zone, no need to fetch it again
+            return self.conn.dns.delete_recordset(current[key])
+
+        actions = ([(create, key) for key in to_create]
+                   + [(update, key) for key in sorted(to_update)]
+                   + [(delete, key) for key in to_delete])
+        outcomes = run_all(
+            lambda action: action[0](action[1]), actions,
+            workers=self.params['parallelism'],
+            rate=self.params['rate_limit'])
+        errors = ['%s: %s' % (_key_str(outcome.item[1]), outcome.error)
+                  for outcome in outcomes if outcome.error is not None]
+        if errors:
+            self.fail_json(
+                msg='Failed to apply %d of %d recordset changes: %s' % (
+                    len(errors), len(actions), '; '.join(errors)),
+                **result)
+        self.exit_json(**result)
+
+
+def main():
+    module = DNSZoneRecordsModule()
+    module()
+
+
+if __name__ == '__main__':
+    main()
@@ -15,7 +15,9 @@
 DOCUMENTATION = """
 module: dws_cluster_info
 short_description: Get info about DWS clusters.
-extends_documentation_fragment: opentelekomcloud.cloud.otc
+extends_documentation_fragment:
+  - opentelekomcloud.cloud.otc
+  - opentelekomcloud.cloud.otc.info
 version_added: "0.14.4"
 author: "Attila Somogyi (@sattila1999)"
 description:
@@ -295,25 +297,25 @@ from ansible_collections.opentelekomcloud.cloud.plugins.module_utils.otc import
 
 
 class DWSClusterInfoModule(OTCModule):
+    info_module = True
+
     argument_spec = dict(name=dict())
     module_kwargs = dict(supports_check_mode=True)
 
     otce_min_version = "0.24.1"
 
     def run(self):
-        data = []
+        data = self.result_list()
         if self.params['name']:
             raw = self.conn.dws.find_cluster(
                 name_or_id=self.params['name'], ignore_missing=True
             )
             if raw:
-                dt = raw.to_dict()
-                dt.pop('location')
+                dt = self.project(raw)
                 data.append(dt)
         else:
-            for raw in self.conn.dws.clusters():
-                dt = raw.to_dict()
-                dt.pop('location')
+            for raw in self.paged(self.conn.dws.clusters):
+                dt = self.project(raw)
                 data.append(dt)
 
         self.exit_json(changed=False, dws_clusters=data)
@@ -15,7 +15,9 @@ DOCUMENTATION = '''
 ---
 module: dws_snapshot_info
 short_description: Get DWS snapshot info
-extends_documentation_fragment: opentelekomcloud.cloud.otc
+extends_documentation_fragment:
+  - opentelekomcloud.cloud.otc
+  - opentelekomcloud.cloud.otc.info
 version_added: "0.14.4"
 author: "Attila Somogyi (@sattila1999)"
 description:
@@ -75,6 +77,8 @@ from ansible_collections.opentelekomcloud.cloud.plugins.module_utils.otc import
 
 class DwsSnapshotInfoModule(OTCModule):
 
+    info_module = True
+
     argument_spec = dict(
         name=dict(required=False)
     )
@@ -84,7 +88,7 @@ class DwsSnapshotInfoModule(OTCModule):
     )
 
     def run(self):
-        data = []
+        data = self.result_list()
 
         if self.params['name']:
             # search snapshot by name or id
@@ -92,14 +96,12 @@ class DwsSnapshotInfoModule(OTCModule):
                 name_or_id=self.params['name'], ignore_missing=True
             )
             if raw:
-                dt = raw.to_dict()
-                dt.pop('location')
+                dt = self.project(raw)
                 data.append(dt)
 
         else:
-            for raw in self.conn.dws.snapshots():
-                dt = raw.to_dict()
-                dt.pop('location')
+            for raw in self.paged(self.conn.dws.snapshots):
+                dt = self.project(raw)
                 data.append(dt)
 
         self.exit_json(
@@ -14,7 +14,9 @@
 DOCUMENTATION = '''
 module: ims_image_info
 short_description: Get info about images.
-extends_documentation_fragment: opentelekomcloud.cloud.otc
+extends_documentation_fragment:
+  - opentelekomcloud.cloud.otc
+  - opentelekomcloud.cloud.otc.info
 version_added: "0.14.8"
 author: "Sebastian Gode (@SebastianGode)"
 description:
@@ -370,6 +372,9 @@ from ansible_collections.opentelekomcloud.cloud.plugins.module_utils.otc import
 
 
 class IMSImageInfoModule(OTCModule):
+    info_module = True
+    marker_paging = True
+
     argument_spec = dict(
         name=dict(required=False, type='str'),
         id=dict(required=False, type='str'),
@@ -412,7 +417,7 @@ class IMSImageInfoModule(OTCModule):
 
     def run(self):
 
-        data = []
+        data = self.result_list()
         query = {}
 
         if self.params['name'] and self.params['id']:
@@ -477,9 +482,8 @@ class IMSImageInfoModule(OTCModule):
             query['enterprise_project_id'] = self.params['enterprise_project_id']
 
         else:
-            for raw in self.conn.imsv2.images(**query):
-                dt = raw.to_dict()
-                dt.pop('location')
+            for raw in self.paged(self.conn.imsv2.images, **query):
+                dt = self.project(raw)
                 data.append(dt)
 
         self.exit(
@@ -14,7 +14,9 @@
 DOCUMENTATION = '''
 module: kms_info
 short_description: Get info about KMS keys.
-extends_documentation_fragment: opentelekomcloud.cloud.otc
+extends_documentation_fragment:
+  - opentelekomcloud.cloud.otc
+  - opentelekomcloud.cloud.otc.info
 version_added: "0.12.5"
 author: "Anton Sidelnikov (@anton-sidelnikov)"
 description:
@@ -94,6 +96,8 @@ UUID_PATTERN = re.compile(r'^[\da-f]{8}-([\da-f]{4}-){3}[\da-f]{12}$', re.IGNORE
 
 
 class KMSInfoModule(OTCModule):
+    info_module = True
+
     argument_spec = dict(
         name=dict(required=False),
         key_state=dict(required=False, no_log=False),
@@ -106,7 +110,7 @@ class KMSInfoModule(OTCModule):
 
     def run(self):
 
-        data = []
+        data = self.result_list()
         query = {}
 
         if self.params['key_state']:
@@ -116,21 +120,18 @@ class KMSInfoModule(OTCModule):
             if UUID_PATTERN.match(self.params['name']):
                 raw = self.conn.kms.get_key(self.params['name'])
                 if raw:
-                    dt = raw.to_dict()
-                    dt.pop('location')
+                    dt = self.project(raw)
                     data.append(dt)
             else:
                 raw = self.conn.kms.find_key(
                     alias=self.params['name'],
                     ignore_missing=True)
                 if raw:
-                    dt = raw.to_dict()
-                    dt.pop('location')
+                    dt = self.project(raw)
                     data.append(dt)
         else:
-            for raw in self.conn.kms.keys(**query):
-                dt = raw.to_dict()
-                dt.pop('location')
+            for raw in self.paged(self.conn.kms.keys, **query):
+                dt = self.project(raw)
                 data.append(dt)
 
         self.exit(
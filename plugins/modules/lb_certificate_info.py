@@ -15,7 +15,9 @@ DOCUMENTATION = '''
 ---
 module: lb_certificate_info
 short_description: Get elb certificate info from OpenTelekomCloud
-extends_documentation_fragment: opentelekomcloud.cloud.otc
+extends_documentation_fragment:
+  - opentelekomcloud.cloud.otc
+  - opentelekomcloud.cloud.otc.info
 version_added: "0.0.3"
 author: "Anton Sidelnikov (@anton-sidelnikov)"
 description:
@@ -78,6 +80,8 @@ from ansible_collections.opentelekomcloud.cloud.plugins.module_utils.otc import
 
 
 class LoadBalancerCertificateInfoModule(OTCModule):
+    info_module = True
+
     argument_spec = dict(
         name=dict(required=False)
     )
@@ -88,18 +92,16 @@ class LoadBalancerCertificateInfoModule(OTCModule):
     otce_min_version = '0.10.0'
 
     def run(self):
-        data = []
+        data = self.result_list()
 
         if self.params['name']:
             raw = self.conn.elb.find_certificate(name_or_id=self.params['name'], ignore_missing=True)
             if raw:
-                dt = raw.to_dict()
-                dt.pop('location')
+                dt = self.project(raw)
                 data.append(dt)
         else:
-            for raw in self.conn.elb.certificates():
-                dt = raw.to_dict()
-                dt.pop('location')
+            for raw in self.paged(self.conn.elb.certificates):
+                dt = self.project(raw)
                 data.append(dt)
 
         self.exit_json(
@@ -15,7 +15,9 @@ DOCUMENTATION = '''
 ---
 module: lb_healthmonitor_info
 short_description: Get health checks info from OpenTelekomCloud
-extends_documentation_fragment: opentelekomcloud.cloud.otc
+extends_documentation_fragment:
+  - opentelekomcloud.cloud.otc
+  - opentelekomcloud.cloud.otc.info
 version_added: "0.0.3"
 author: "Anton Sidelnikov (@anton-sidelnikov)"
 description:
@@ -144,6 +146,9 @@ from ansible_collections.opentelekomcloud.cloud.plugins.module_utils.otc import
 
 
 class LoadBalancerHealthMonitorInfoModule(OTCModule):
+    info_module = True
+    marker_paging = True
+
     argument_spec = dict(
         name=dict(required=False),
         delay=dict(required=False, type='int'),
@@ -174,7 +179,7 @@ class LoadBalancerHealthMonitorInfoModule(OTCModule):
         domain_name_filter = self.params['domain_name']
         http_method_filter = self.params['http_method']
 
-        data = []
+        data = self.result_list()
         args = {}
         if name_filter:
             args['name'] = name_filter
@@ -199,13 +204,11 @@ class LoadBalancerHealthMonitorInfoModule(OTCModule):
 
         if name_filter:
             raw = self.conn.network.find_health_monitor(name_or_id=name_filter)
-            dt = raw.to_dict()
-            dt.pop('location')
+            dt = self.project(raw)
             data.append(dt)
         else:
-            for raw in self.conn.network.health_monitors(**args):
-                dt = raw.to_dict()
-                dt.pop('location')
+            for raw in self.paged(self.conn.network.health_monitors, **args):
+                dt = self.project(raw)
                 data.append(dt)
 
         self.exit_json(
@@ -15,7 +15,9 @@ DOCUMENTATION = '''
 ---
 module: lb_member_info
 short_description: Get backend server group member info from OpenTelekomCloud
-extends_documentation_fragment: opentelekomcloud.cloud.otc
+extends_documentation_fragment:
+  - opentelekomcloud.cloud.otc
+  - opentelekomcloud.cloud.otc.info
 version_added: "0.0.3"
 author: "Anton Sidelnikov (@anton-sidelnikov)"
 description:
@@ -105,6 +107,9 @@ from ansible_collections.opentelekomcloud.cloud.plugins.module_utils.otc import
 
 
 class LoadBalancerMemberInfoModule(OTCModule):
+    info_module = True
+    marker_paging = True
+
     argument_spec = dict(
         name=dict(required=False),
         pool=dict(required=True),
@@ -128,7 +133,7 @@ class LoadBalancerMemberInfoModule(OTCModule):
         admin_state_filter = self.params['admin_state_up']
         weight_filter = self.params['weight']
 
-        data = []
+        data = self.result_list()
         args = {}
 
         if name_filter:
@@ -151,13 +156,11 @@ class LoadBalancerMemberInfoModule(OTCModule):
         pool = self.conn.network.find_pool(name_or_id=self.params['pool'])
         if self.params['name']:
             raw = self.conn.network.find_pool_member(pool=pool, name_or_id=name_filter)
-            dt = raw.to_dict()
-            dt.pop('location')
+            dt = self.project(raw)
             data.append(dt)
         else:
-            for raw in self.conn.network.pool_members(pool=pool, **args):
-                dt = raw.to_dict()
-                dt.pop('location')
+            for raw in self.paged(self.conn.network.pool_members, pool=pool, **args):
+                dt = self.project(raw)
                 data.append(dt)
 
         self.exit_json(
@@ -0,0 +1,306 @@
+#!/usr/bin/python
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+DOCUMENTATION = '''
+---
+module: lb_member_set
+short_description: Manage all members of a pool in load balancer from OpenTelekomCloud
+extends_documentation_fragment: opentelekomcloud.cloud.otc
+version_added: "0.16.0"
+author: "Open Telekom Cloud (@opentelekomcloud)"
+description:
+  - Set the complete list of members of a pool for Enhanced Load Balancer
+    from the OTC load-balancer service(ELB).
+  - Members are identified by address and protocol port. Members of the pool
+    are listed once, missing members are added, changed members are updated
+    and, with I(purge=true), members not in the list are removed.
+options:
+  pool:
+    description:
+      - Specifies the ID or Name of the backend server group.
+    type: str
+    required: true
+  members:
+    description:
+      - Desired members of the backend server group.
+    type: list
+    elements: dict
+    required: true
+    suboptions:
+      address:
+        description:
+          - Specifies the private IP address of the backend server.
+        type: str
+        required: true
+      protocol_port:
+        description:
+          - Specifies the port used by the backend server.
+        type: int
+        required: true
+      name:
+        description:
+          - Specifies the backend server name.
+        type: str
+      subnet:
+        description:
+          - Specifies the ID or Name of the subnet where the backend server
+            works.
+          - Only used when the member is added.
+        type: str
+      admin_state_up:
+        description:
+          - Specifies the administrative status of the backend server.
+        type: bool
+      weight:
+        description:
+          - Specifies the backend server weight.
+        type: int
+  subnet:
+    description:
+      - Default ID or Name of the subnet for members without C(subnet).
+    type: str
+  purge:
+    description:
+      - Whether members not in I(members) are removed from the pool.
+    type: bool
+    default: true
+  parallelism:
+    description:
+      - Number of members added, updated or removed at the same time.
+    type: int
+    default: 4
+requirements: ["openstacksdk", "otcextensions"]
+'''
+
+RETURN = '''
+added:
+  description: Members added to the pool as C(address:protocol_port).
+  type: list
+  returned: On Success.
+  sample: ["192.168.0.10:8080"]
+updated:
+  description: Members updated in the pool as C(address:protocol_port).
+  type: list
+  returned: On Success.
+  sample: ["192.168.0.11:8080"]
+removed:
+  description: Members removed from the pool as C(address:protocol_port).
+  type: list
+  returned: On Success.
+  sample: ["192.168.0.12:8080"]
+members:
+  description: Members of the pool.
+  type: complex
+  returned: On Success when not in check mode.
+  contains:
+    id:
+      description: Specifies the backend server ID.
+      type: str
+      sample: "39007a7e-ee4f-4d13-8283-b4da2e037c69"
+    name:
+      description: Specifies the backend server name.
+      type: str
+      sample: "server_test"
+    address:
+      description: Specifies the private IP address of the backend server.
+      type: str
+      sample: "192.168.0.10"
+    protocol_port:
+      description: Specifies the port used by the backend server.
+      type: int
+      sample: 8080
+    subnet_id:
+      description: Specifies the ID of the subnet where the backend server works.
+      type: str
+    admin_state_up:
+      description: Specifies the administrative status of the backend server.
+      type: bool
+    weight:
+      description: Specifies the backend server weight.
+      type: int
+'''
+
+EXAMPLES = '''
+# Set the members of a pool
+- opentelekomcloud.cloud.lb_member_set:
+    pool: "{{ pool }}"
+    subnet: "{{ subnet_name_id }}"
+    members:
+      - address: 192.168.0.10
+        protocol_port: 8080
+      - address: 192.168.0.11
+        protocol_port: 8080
+        weight: 5
+
+# Add members without removing others
+- opentelekomcloud.cloud.lb_member_set:
+    pool: "{{ pool }}"
+    subnet: "{{ subnet_name_id }}"
+    purge: false
+    members: "{{ backends | map('combine', {'protocol_port': 80}) | list }}"
+'''
+
+from ansible_collections.opentelekomcloud.cloud.plugins.module_utils.concurrency import is_conflict
+from ansible_collections.opentelekomcloud.cloud.plugins.module_utils.concurrency import retry
+from ansible_collections.opentelekomcloud.cloud.plugins.module_utils.concurrency import run_all
+from ansible_collections.opentelekomcloud.cloud.plugins.module_utils.otc import OTCModule
+from ansible_collections.opentelekomcloud.cloud.plugins.module_utils.otc import project_resource
+
+
+def _key(address, protocol_port):
+    return '%s:%s' % (address, protocol_port)
+
+
+class LoadBalancerMemberSetModule(OTCModule):
+    argument_spec = dict(
+        pool=dict(required=True, type='str'),
+        members=dict(
+            required=True, type='list', elements='dict',
+            options=dict(
+                address=dict(required=True, type='str'),
+                protocol_port=dict(required=True, type='int'),
+                name=dict(required=False, type='str'),
+                subnet=dict(required=False, type='str'),
+                admin_state_up=dict(required=False, type='bool'),
+                weight=dict(required=False, type='int'))),
+        subnet=dict(required=False, type='str'),
+        purge=dict(required=False, default=True, type='bool'),
+        parallelism=dict(required=False, default=4, type='int')
+    )
+    module_kwargs = dict(
+        supports_check_mode=True
+    )
+
+    def _updates(self, current, desired):
+        """Attributes of the existing member which differ."""
+        attrs = {}
+        if desired['name'] is not None and current.name != desired['name']:
+            attrs['name'] = desired['name']
+        if (desired['weight'] is not None
+                and current.weight != desired['weight']):
+            attrs['weight'] = desired['weight']
+        if (desired['admin_state_up'] is not None
+                and current.is_admin_state_up != desired['admin_state_up']):
+            attrs['admin_state_up'] = desired['admin_state_up']
+        return attrs
+
+    def _resolve_subnets(self, names):
+        """Find every referenced subnet once."""
+        subnets = {}
+        for name in set(names):
+            subnet = self.conn.network.find_subnet(name_or_id=name)
+            if not subnet:
+                self.fail_json(msg='Subnet %s not found' % name)
+            subnets[name] = subnet.id
+        return subnets
+
+    def run(self):
+        pool = self.conn.network.find_pool(name_or_id=self.params['pool'])
+        if not pool:
+            self.fail_json(msg='Pool %s not found' % self.params['pool'])
+
+        desired = {}
+        for member in self.params['members']:
+            key = _key(member['address'], member['protocol_port'])
+            if key in desired:
+                self.fail_json(msg='Member %s is given more than once' % key)
+            desired[key] = member
+        current = dict(
+            (_key(member.address, member.protocol_port), member)
+            for member in self.conn.network.pool_members(pool))
+
+        to_add = sorted(key for key in desired if key not in current)
+        to_update = {}
+        for key in desired:
+            if key in current:
+                attrs = self._updates(current[key], desired[key])
+                if attrs:
+                    to_update[key] = attrs
+        to_remove = []
+        if self.params['purge']:
+            to_remove = sorted(key for key in current if key not in desired)
+
+        changed = bool(to_add or to_update or to_remove)
+        result = dict(changed=changed, added=to_add,
+                      updated=sorted(to_update), removed=to_remove)
+        if self.ansible._diff:
+            after = set(desired)
+            if not self.params['purge']:
+                after |= set(current)
+            result['diff'] = dict(
+                before=''.join(key + '\n' for key in sorted(current)),
+                after=''.join(key + '\n' for key in sorted(after)))
+        if self.ansible.check_mode or not changed:
+            if not self.ansible.check_mode:
+                result['members'] = [project_resource(member)
+                                     for member in current.values()]
+            self.exit_json(**result)
+
+        subnets = self._resolve_subnets(
+            desired[key]['subnet'] or self.params['subnet']
+            for key in to_add
+            if desired[key]['subnet'] or self.params['subnet'])
+
+        def add(key):
+            member = desired[key]
+            attrs = dict(address=member['address'],
+                         protocol_port=member['protocol_port'])
+            subnet = member['subnet'] or self.params['subnet']
+            if subnet:
+                attrs['subnet_id'] = subnets[subnet]
+            for attr in ('name', 'weight', 'admin_state_up'):
+                if member[attr] is not None:
+                    attrs[attr] = member[attr]
+            return self.conn.network.create_pool_member(pool, **attrs)
+
+        def update(key):
+            return self.conn.network.update_pool_member(
+                current[key], pool, **to_update[key])
+
+        def remove(key):
+            self.conn.network.delete_pool_member(current[key], pool)
+
+        actions = ([(add, key) for key in to_add]
+                   + [(update, key) for key in sorted(to_update)]
+                   + [(remove, key) for key in to_remove])
+        outcomes = run_all(
+            lambda action: retry(lambda: action[0](action[1]), is_conflict),
+            actions, workers=self.params['parallelism'])
+
+        members = dict(current)
+        errors = []
+        for outcome in outcomes:
+            func, key = outcome.item
+            if outcome.error is not None:
+                errors.append('%s: %s' % (key, outcome.error))
+            elif func is remove:
+                members.pop(key)
+            else:
+                members[key] = outcome.result
+        result['members'] = [project_resource(member)
+                             for member in members.values()]
+        if errors:
+            self.fail_json(
+                msg='Failed to apply %d of %d member changes: %s' % (
+                    len(errors), len(actions), '; '.join(errors)),
+                **result)
+        self.exit_json(**result)
+
+
+def main():
+    module = LoadBalancerMemberSetModule()
+    module()
+
+
+if __name__ == '__main__':
+    main()
@@ -15,7 +15,9 @@ DOCUMENTATION = '''
 ---
 module: lb_pool_info
 short_description: Get load balancer backend server group info from OpenTelekomCloud
-extends_documentation_fragment: opentelekomcloud.cloud.otc
+extends_documentation_fragment:
+  - opentelekomcloud.cloud.otc
+  - opentelekomcloud.cloud.otc.info
 version_added: "0.0.3"
 author: "Anton Sidelnikov (@anton-sidelnikov)"
 description:
@@ -84,6 +86,9 @@ from ansible_collections.opentelekomcloud.cloud.plugins.module_utils.otc import
 
 
 class LoadBalancerPoolInfoModule(OTCModule):
+    info_module = True
+    marker_paging = True
+
     argument_spec = dict(
         name=dict(required=False)
     )
@@ -92,17 +97,15 @@ class LoadBalancerPoolInfoModule(OTCModule):
     )
 
     def run(self):
-        data = []
+        data = self.result_list()
 
         if self.params['name']:
             raw = self.conn.network.find_pool(name_or_id=self.params['name'])
-            dt = raw.to_dict()
-            dt.pop('location')
+            dt = self.project(raw)
             data.append(dt)
         else:
-            for raw in self.conn.network.pools():
-                dt = raw.to_dict()
-                dt.pop('location')
+            for raw in self.paged(self.conn.network.pools):
+                dt = self.project(raw)
                 data.append(dt)
 
         self.exit_json(
@@ -64,6 +64,15 @@ options:
         to the load balancer are deleted.
     type: bool
     default: 'no'
+  parallelism:
+    description:
+      - Number of resources deleted at the same time with
+        C(delete_cascade=true).
+      - Members and health monitors are deleted first, then pools and then
+        listeners. Deletions rejected while the load balancer is pending
+        update are retried.
+    type: int
+    default: 4
   wait:
     description:
       - If the module should wait for the load balancer to be created or
@@ -137,6 +146,16 @@ loadbalancer:
       description: The associated pool IDs, if any.
       type: list
       sample: [{"id": "27b78d92-cee1-4646-b831-e3b90a7fa714"}, {"id": "befc1fb5-1992-4697-bdb9-eee330989344"}]
+teardown:
+  description: Number of deleted resources and seconds spent per level.
+  returned: On success when C(state=absent) and C(delete_cascade=true)
+  type: dict
+  sample: {
+    "discover": {"count": 2, "time": 0.31},
+    "leaves": {"count": 41, "time": 2.76},
+    "pools": {"count": 2, "time": 0.52},
+    "listeners": {"count": 2, "time": 0.48}
+  }
 '''
 
 EXAMPLES = '''
@@ -172,6 +191,9 @@ EXAMPLES = '''
 
 import time
 
+from ansible_collections.opentelekomcloud.cloud.plugins.module_utils.concurrency import is_conflict
+from ansible_collections.opentelekomcloud.cloud.plugins.module_utils.concurrency import retry
+from ansible_collections.opentelekomcloud.cloud.plugins.module_utils.concurrency import run_all
 from ansible_collections.opentelekomcloud.cloud.plugins.module_utils.otc import OTCModule
 
 
@@ -184,40 +206,86 @@ class LoadBalancerModule(OTCModule):
         public_ip_address=dict(required=False, default=None, type='str'),
         auto_public_ip=dict(required=False, default=False, type='bool'),
         delete_public_ip=dict(required=False, default=False, type='bool'),
-        delete_cascade=dict(required=False, default=False, type='bool')
+        delete_cascade=dict(required=False, default=False, type='bool'),
+        parallelism=dict(required=False, default=4, type='int')
     )
     module_kwargs = dict(
         supports_check_mode=True
     )
 
-    def _wait_for_lb(self, lb, status, failures, interval=5):
+    def _wait_for_lb(self, lb, status, failures):
         """Wait for load balancer to be in a particular provisioning status."""
-        timeout = self.params['timeout']
-
-        total_sleep = 0
-        if failures is None:
-            failures = []
-
-        while total_sleep < timeout:
-            lb = self.conn.network.get_load_balancer(lb.id)
-
-            if lb:
-                return None
-            else:
-                if status == "DELETED":
-                    return None
-                else:
-                    self.fail_json(
-                        msg="Load Balancer %s transitioned to DELETED" % lb.id
-                    )
-
-            time.sleep(interval)
-            total_sleep += interval
-
-        self.fail_json(
-            msg="Timeout waiting for Load Balancer %s to transition to %s" %
-                (lb.id, status)
-        )
+        try:
+            return self.waiter(service='network').wait_for_status(
+                self.conn.network, lb, status, failures,
+                attribute='provisioning_status')
+        except self.sdk.exceptions.ResourceTimeout:
+            self.fail_json(
+                msg="Timeout waiting for Load Balancer %s to transition to %s" %
+                    (lb.id, status)
+            )
+        except self.sdk.exceptions.ResourceFailure as e:
+            self.fail_json(msg=str(e))
+
+    def _run_level(self, teardown, level, func, items):
+        """Run func for all items concurrently and record the timing."""
+        start = time.monotonic()
+        outcomes = run_all(
+            lambda item: retry(lambda: func(item), is_conflict),
+            items, workers=self.params['parallelism'])
+        teardown[level] = dict(count=len(outcomes),
+                               time=round(time.monotonic() - start, 3))
+        errors = [str(outcome.error) for outcome in outcomes
+                  if outcome.error is not None]
+        if errors:
+            self.fail_json(
+                msg="Failed to delete %d of %d %s of the load balancer: %s" %
+                    (len(errors), len(outcomes), level, "; ".join(errors)),
+                teardown=teardown)
+        return [outcome.result for outcome in outcomes]
+
+    def _delete_cascade(self, lb):
+        """Delete the resources attached to the load balancer.
+
+        The tree is torn down level by level, starting with its leaves
+        (members and health monitors), then pools and then listeners. All
+        deletions of a level run concurrently.
+        """
+        teardown = {}
+        listeners = self._run_level(
+            teardown, 'discover',
+            lambda listener: self.conn.vlb.get_listener(listener=listener),
+            lb.listener_ids or [])
+        found = teardown.pop('discover')
+        pools = self._run_level(
+            teardown, 'discover',
+            lambda pool_id: self.conn.vlb.find_pool(
+                name_or_id=pool_id, ignore_missing=False),
+            [listener.default_pool_id for listener in listeners
+             if listener.default_pool_id])
+        for key in ('count', 'time'):
+            teardown['discover'][key] += found[key]
+
+        leaves = []
+        for pool in pools:
+            for member in pool.members or []:
+                leaves.append(
+                    lambda pool=pool, member=member: self.conn.vlb.delete_member(
+                        member=member["id"], pool=pool["id"]))
+            if pool.healthmonitor_id:
+                leaves.append(
+                    lambda pool=pool: self.conn.vlb.delete_health_monitor(
+                        healthmonitor=pool.healthmonitor_id))
+        self._run_level(teardown, 'leaves', lambda delete: delete(), leaves)
+        self._run_level(
+            teardown, 'pools',
+            lambda pool: self.conn.vlb.delete_pool(pool=pool.id), pools)
+        self._run_level(
+            teardown, 'listeners',
+            lambda listener: self.conn.network.delete_listener(
+                listener=listener.id),
+            listeners)
+        return teardown
 
     def bind_floating_ip(self, lb, public_vip_address, allocate_fip):
         fip = None
@@ -356,6 +424,7 @@ class LoadBalancerModule(OTCModule):
         elif self.params['state'] == 'absent':
             changed = False
             public_vip_address = None
+            teardown = None
 
             if lb:
                 if self.ansible.check_mode:
@@ -379,39 +448,12 @@ class LoadBalancerModule(OTCModule):
                     )
 
                 if delete_cascade:
-                    if lb.listener_ids:
-                        for listener in lb.listener_ids:
-                            l_obj = self.conn.vlb.get_listener(listener=listener)
-
-                            # check for default Pool / Backend Server Group and delete
-                            if l_obj.default_pool_id:
-                                # search for backend server grp
-                                pool = self.conn.vlb.find_pool(
-                                    name_or_id=l_obj.default_pool_id,
-                                    ignore_missing=False)
-                                # get backend server grp members and delete
-                                if pool.members:
-                                    for member in pool.members:
-                                        self.conn.vlb.delete_member(
-                                            member=member["id"],
-                                            pool=pool["id"])
-
-                                # check for health monitor and delete
-                                if pool.healthmonitor_id:
-                                    healthmonitor = self.conn.vlb.find_health_monitor(
-                                        name_or_id=pool.healthmonitor_id,
-                                        ignore_missing=False)
-                                    self.conn.vlb.delete_health_monitor(
-                                        healthmonitor=healthmonitor)
-
-                                # delete backend server group
-                                self.conn.vlb.delete_pool(pool=l_obj.default_pool_id)
-
-                            # delete Listener
-                            self.conn.network.delete_listener(listener=listener["id"])
-
-                # delete LB with new V3.0 version
-                self.conn.vlb.delete_load_balancer(load_balancer=lb.id)
+                    teardown = self._delete_cascade(lb)
+
+                # delete LB with new V3.0 version, retried as it stays
+                # pending update for a moment after the last listener is gone
+                retry(lambda: self.conn.vlb.delete_load_balancer(
+                    load_balancer=lb.id), is_conflict)
                 changed = True
 
                 # delete public VIP
@@ -419,6 +461,8 @@ class LoadBalancerModule(OTCModule):
                     self.conn.network.delete_ip(public_vip_address)
                     changed = True
 
+            if teardown is not None:
+                self.exit_json(changed=changed, teardown=teardown)
             self.exit_json(changed=changed)
 
 
@@ -15,7 +15,9 @@ DOCUMENTATION = '''
 ---
 module: loadbalancer_info
 short_description: Get load balancer info
-extends_documentation_fragment: opentelekomcloud.cloud.otc
+extends_documentation_fragment:
+  - opentelekomcloud.cloud.otc
+  - opentelekomcloud.cloud.otc.info
 version_added: "0.0.1"
 author: "Artem Goncharov (@gtema)"
 description:
@@ -98,6 +100,9 @@ from ansible_collections.opentelekomcloud.cloud.plugins.module_utils.otc import
 
 
 class LoadBalancerInfoModule(OTCModule):
+    info_module = True
+    marker_paging = True
+
     argument_spec = dict(
         name=dict(required=False)
     )
@@ -107,10 +112,12 @@ class LoadBalancerInfoModule(OTCModule):
 
     def run(self):
         if self.params['name']:
-            lb = self.conn.network.find_load_balancer(
-                name_or_id=self.params['name'])
+            lb = self.project(self.conn.network.find_load_balancer(
+                name_or_id=self.params['name']))
         else:
-            lb = list(self.conn.network.load_balancers())
+            lb = self.result_list()
+            lb.extend(self.project(raw)
+                      for raw in self.paged(self.conn.network.load_balancers))
 
         self.exit_json(
             changed=False,
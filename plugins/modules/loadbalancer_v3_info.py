@@ -15,7 +15,9 @@ DOCUMENTATION = '''
 ---
 module: loadbalancer_v3_info
 short_description: Get load balancer (VLB) from OpenTelekomCloud
-extends_documentation_fragment: opentelekomcloud.cloud.otc
+extends_documentation_fragment:
+  - opentelekomcloud.cloud.otc
+  - opentelekomcloud.cloud.otc.info
 version_added: "0.14.0"
 author: "Polina Gubina (@polina-gubina)"
 description: Get info about Dedicated Load Balancer from the OTC service (VLB).
@@ -306,6 +308,9 @@ from ansible_collections.opentelekomcloud.cloud.plugins.module_utils.otc import
 
 
 class LoadbalancerV3InfoModule(OTCModule):
+    info_module = True
+    marker_paging = True
+
     argument_spec = dict(
         name_or_id=dict(required=False),
         description=dict(required=False),
@@ -335,13 +340,12 @@ class LoadbalancerV3InfoModule(OTCModule):
     )
 
     def run(self):
-        data = []
+        data = self.result_list()
 
         if self.params['name_or_id']:
             raw = self.conn.vlb.find_load_balancer(
                 name_or_id=self.params['name_or_id'])
-            dt = raw.to_dict()
-            dt.pop('location')
+            dt = self.project(raw)
             data.append(dt)
         else:
             kwargs = dict((k, self.params[k])
@@ -371,9 +375,8 @@ class LoadbalancerV3InfoModule(OTCModule):
                         msg="Vpc {0} not found".format(self.params['vpc']))
                 kwargs['vpc_id'] = vpc.id
 
-            for raw in self.conn.vlb.load_balancers(**kwargs):
-                dt = raw.to_dict()
-                dt.pop('location')
+            for raw in self.paged(self.conn.vlb.load_balancers, **kwargs):
+                dt = self.project(raw)
                 dt['ip_address'] = dt['vip_address']
                 dt['subnet_id'] = dt['vip_subnet_id']
                 dt['port_id'] = dt['vip_port_id']
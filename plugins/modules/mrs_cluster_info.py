@@ -15,7 +15,9 @@
 DOCUMENTATION = """
 module: mrs_cluster_info
 short_description: Get info about MRS clusters.
-extends_documentation_fragment: opentelekomcloud.cloud.otc
+extends_documentation_fragment:
+  - opentelekomcloud.cloud.otc
+  - opentelekomcloud.cloud.otc.info
 version_added: "0.14.4"
 author: "Attila Somogyi (@sattila1999)"
 description:
@@ -530,6 +532,8 @@ def _normalize_tags(tags):
 
 
 class MRSClusterInfoModule(OTCModule):
+    info_module = True
+
     argument_spec = dict(
         name=dict(),
         status=dict(type='str'),
@@ -541,14 +545,13 @@ class MRSClusterInfoModule(OTCModule):
     otce_min_version = '0.24.1'
 
     def run(self):
-        data = []
+        data = self.result_list()
         if self.params['name']:
             raw = self.conn.mrs.find_cluster(
                 name_or_id=self.params['name'], ignore_missing=True
             )
             if raw:
-                dt = raw.to_dict()
-                dt.pop('location')
+                dt = self.project(raw)
                 data.append(dt)
         else:
             if self.params['tags']:
@@ -557,9 +560,8 @@ class MRSClusterInfoModule(OTCModule):
                       for k in ['tags', 'status', 'limit']
                       if self.params[k] is not None}
 
-            for raw in self.conn.mrs.clusters(**kwargs):
-                dt = raw.to_dict()
-                dt.pop('location')
+            for raw in self.paged(self.conn.mrs.clusters, **kwargs):
+                dt = self.project(raw)
                 data.append(dt)
 
         self.exit_json(changed=False, mrs_clusters=data)
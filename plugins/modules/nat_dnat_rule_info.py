@@ -14,7 +14,9 @@ DOCUMENTATION = '''
 ---
 module: nat_dnat_rule_info
 short_description: Get DNAT rule details
-extends_documentation_fragment: opentelekomcloud.cloud.otc
+extends_documentation_fragment:
+  - opentelekomcloud.cloud.otc
+  - opentelekomcloud.cloud.otc.info
 version_added: "0.0.4"
 author: "Sebastian Gode (@SebastianGode)"
 description:
@@ -153,6 +155,9 @@ from ansible_collections.opentelekomcloud.cloud.plugins.module_utils.otc import
 
 
 class DNATRuleInfoModule(OTCModule):
+    info_module = True
+    marker_paging = True
+
     argument_spec = dict(
         admin_state_up=dict(required=False, type='bool'),
         created_at=dict(required=False),
@@ -172,7 +177,7 @@ class DNATRuleInfoModule(OTCModule):
     )
 
     def run(self):
-        data = []
+        data = self.result_list()
         query = {}
 
         if self.params['rule']:
@@ -245,9 +250,8 @@ class DNATRuleInfoModule(OTCModule):
         if self.params['status']:
             query['status'] = self.params['status']
 
-        for raw in self.conn.nat.dnat_rules(**query):
-            dt = raw.to_dict()
-            dt.pop('location')
+        for raw in self.paged(self.conn.nat.dnat_rules, **query):
+            dt = self.project(raw)
             data.append(dt)
 
         self.exit(
@@ -14,7 +14,9 @@
 DOCUMENTATION = '''
 module: nat_gateway_info
 short_description: Get NAT gateways
-extends_documentation_fragment: opentelekomcloud.cloud.otc
+extends_documentation_fragment:
+  - opentelekomcloud.cloud.otc
+  - opentelekomcloud.cloud.otc.info
 version_added: "0.0.4"
 author: "Tino Schreiber (@tischrei)"
 description:
@@ -134,6 +136,9 @@ from ansible_collections.opentelekomcloud.cloud.plugins.module_utils.otc import
 
 
 class NATGatewayInfoModule(OTCModule):
+    info_module = True
+    marker_paging = True
+
     argument_spec = dict(
         admin_state_up=dict(required=False, type='bool'),
         created_at=dict(required=False),
@@ -151,7 +156,7 @@ class NATGatewayInfoModule(OTCModule):
 
     def run(self):
 
-        data = []
+        data = self.result_list()
         query = {}
 
         if self.params['gateway']:
@@ -186,9 +191,8 @@ class NATGatewayInfoModule(OTCModule):
         if self.params['status']:
             query['status'] = self.params['status']
 
-        for raw in self.conn.nat.gateways(**query):
-            dt = raw.to_dict()
-            dt.pop('location')
+        for raw in self.paged(self.conn.nat.gateways, **query):
+            dt = self.project(raw)
             data.append(dt)
 
         self.exit(
@@ -14,7 +14,9 @@ DOCUMENTATION = '''
 ---
 module: nat_snat_rule_info
 short_description: Get SNAT rule details
-extends_documentation_fragment: opentelekomcloud.cloud.otc
+extends_documentation_fragment:
+  - opentelekomcloud.cloud.otc
+  - opentelekomcloud.cloud.otc.info
 version_added: "0.0.4"
 author: "Sebastian Gode (@SebastianGode)"
 description:
@@ -138,6 +140,9 @@ from ansible_collections.opentelekomcloud.cloud.plugins.module_utils.otc import
 
 
 class SNATRuleInfoModule(OTCModule):
+    info_module = True
+    marker_paging = True
+
     argument_spec = dict(
         admin_state_up=dict(required=False, type='bool'),
         cidr=dict(required=False),
@@ -156,7 +161,7 @@ class SNATRuleInfoModule(OTCModule):
 
     def run(self):
 
-        data = []
+        data = self.result_list()
         query = {}
 
         if self.params['rule']:
@@ -223,9 +228,8 @@ class SNATRuleInfoModule(OTCModule):
         if self.params['status']:
             query['status'] = self.params['status']
 
-        for raw in self.conn.nat.snat_rules(**query):
-            dt = raw.to_dict()
-            dt.pop('location')
+        for raw in self.paged(self.conn.nat.snat_rules, **query):
+            dt = self.project(raw)
             data.append(dt)
 
         self.exit(
@@ -0,0 +1,195 @@
+#!/usr/bin/python
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+DOCUMENTATION = '''
+---
+module: object
+short_description: Upload, download or delete Swift objects
+extends_documentation_fragment: opentelekomcloud.cloud.otc
+version_added: "0.16.0"
+author: "Open Telekom Cloud (@opentelekomcloud)"
+description:
+  - Upload a file to an object, download an object to a file or delete an
+    object.
+  - Files larger than I(segment_size) are uploaded as static large objects,
+    their segments are uploaded concurrently into the container
+    C(<container>_segments). Segments which already exist with the same
+    ETag are not uploaded again, so a failed upload resumes with the
+    missing segments.
+  - Large objects are downloaded concurrently in parts of I(segment_size).
+  - Nothing is transferred if the MD5 of the file matches the ETag of the
+    object.
+options:
+  container:
+    description:
+      - Name of the container. It is created on upload if it does not
+        exist.
+    type: str
+    required: true
+  name:
+    description:
+      - Name of the object.
+    type: str
+    required: true
+  src:
+    description:
+      - Local file to upload.
+    type: path
+  dest:
+    description:
+      - Local file to download the object to.
+    type: path
+  state:
+    description:
+      - Whether the object should be present or absent.
+    choices: [present, absent]
+    default: present
+    type: str
+  content_type:
+    description:
+      - Content type of the uploaded object.
+    type: str
+  segment_size:
+    description:
+      - Size in bytes of the segments of large objects and of the parts
+        downloaded concurrently.
+    type: int
+    default: 104857600
+  parallelism:
+    description:
+      - Number of segments transferred at the same time.
+    type: int
+    default: 4
+requirements: ["openstacksdk", "otcextensions"]
+'''
+
+RETURN = '''
+transfer:
+  description: Statistics of the transfer.
+  type: dict
+  returned: On Success.
+  contains:
+    segments:
+      description: Number of segments of the object.
+      type: int
+      sample: 12
+    reused_segments:
+      description: Number of segments of an earlier upload which were not
+        uploaded again.
+      type: int
+      sample: 8
+    bytes:
+      description: Number of bytes uploaded or downloaded.
+      type: int
+      sample: 419430400
+    requests:
+      description: Number of API requests sent.
+      type: int
+      sample: 9
+'''
+
+EXAMPLES = '''
+# Upload a file
+- opentelekomcloud.cloud.object:
+    container: backups
+    name: db/dump.sql.gz
+    src: /var/backups/dump.sql.gz
+
+# Download an object
+- opentelekomcloud.cloud.object:
+    container: backups
+    name: db/dump.sql.gz
+    dest: /tmp/dump.sql.gz
+
+# Upload a large image in 500MB segments, 8 at a time
+- opentelekomcloud.cloud.object:
+    container: images
+    name: disk.qcow2
+    src: /var/lib/images/disk.qcow2
+    segment_size: 524288000
+    parallelism: 8
+
+# Delete an object and its segments
+- opentelekomcloud.cloud.object:
+    container: backups
+    name: db/dump.sql.gz
+    state: absent
+'''
+
+import os
+
+from ansible_collections.opentelekomcloud.cloud.plugins.module_utils.object_store import ObjectTransfer
+from ansible_collections.opentelekomcloud.cloud.plugins.module_utils.object_store import TransferError
+from ansible_collections.opentelekomcloud.cloud.plugins.module_utils.otc import OTCModule
+
+
+class ObjectModule(OTCModule):
+    argument_spec = dict(
+        container=dict(required=True),
+        name=dict(required=True),
+        src=dict(required=False, type='path'),
+        dest=dict(required=False, type='path'),
+        state=dict(default='present', choices=['present', 'absent']),
+        content_type=dict(required=False),
+        segment_size=dict(type='int', default=104857600),
+        parallelism=dict(type='int', default=4),
+    )
+    module_kwargs = dict(
+        supports_check_mode=True,
+        mutually_exclusive=[('src', 'dest')],
+        required_if=[('state', 'present', ('src', 'dest'), True)],
+    )
+
+    def run(self):
+        if self.params['segment_size'] < 1:
+            self.fail_json(msg='segment_size must be positive')
+        src = self.params['src']
+        if self.params['state'] == 'present' and src and not os.path.isfile(src):
+            self.fail_json(msg='File not found: %s' % src)
+
+        transfer = ObjectTransfer(
+            self.conn.object_store, self.params['container'],
+            self.params['name'], segment_size=self.params['segment_size'],
+            workers=self.params['parallelism'])
+        check_mode = self.ansible.check_mode
+        try:
+            if self.params['state'] == 'absent':
+                changed = transfer.delete(check_mode=check_mode)
+            elif src:
+                headers = {}
+                if self.params['content_type']:
+                    headers['Content-Type'] = self.params['content_type']
+                changed = transfer.upload(src, headers=headers,
+                                          check_mode=check_mode)
+            else:
+                changed = transfer.download(self.params['dest'],
+                                            check_mode=check_mode)
+        except (TransferError, IOError, OSError) as e:
+            self.fail_json(msg=str(e))
+
+        self.exit_json(
+            changed=changed,
+            transfer=dict(
+                segments=transfer.segments,
+                reused_segments=transfer.reused,
+                bytes=transfer.transferred,
+                requests=transfer.requests))
+
+
+def main():
+    module = ObjectModule()
+    module()
+
+
+if __name__ == '__main__':
+    main()
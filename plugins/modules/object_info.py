@@ -15,12 +15,17 @@ DOCUMENTATION = '''
 ---
 module: object_info
 short_description: Get Swift info.
-extends_documentation_fragment: opentelekomcloud.cloud.otc
+extends_documentation_fragment:
+  - opentelekomcloud.cloud.otc
+  - opentelekomcloud.cloud.otc.info
 version_added: "0.8.0"
 author: "Anton Sidelnikov (@anton-sidelnikov)"
 description:
   - Get Swift containers,
     container object, object metadata info from the OTC.
+  - Objects of a container are listed page by page, large containers can be
+    narrowed down with I(prefix), I(delimiter), I(marker) and
+    I(end_marker) and written to I(output_file).
 options:
   container:
     description: Name of container in Swift.
@@ -28,6 +33,60 @@ options:
   object_name:
     description: Name of object in Swift.
     type: str
+  prefix:
+    description:
+      - Only objects whose name starts with the prefix are listed.
+    type: str
+  delimiter:
+    description:
+      - Objects whose name contains the delimiter after I(prefix) are
+        grouped into pseudo-directories, which are returned as C(prefixes)
+        instead of the objects.
+    type: str
+  marker:
+    description:
+      - Only objects whose name is greater than the marker are listed.
+      - Without I(container), only containers whose name is greater than
+        the marker are listed.
+    type: str
+  end_marker:
+    description:
+      - Only objects whose name is less than the end marker are listed.
+    type: str
+  limit:
+    description:
+      - Number of objects requested per page.
+      - Swift returns at most its own listing limit per page, the listing
+        goes on until a page is empty.
+    type: int
+    default: 10000
+  metadata:
+    description:
+      - Whether the metadata of every listed object is fetched with a HEAD
+        request and returned instead of the listing entry.
+    type: bool
+    default: false
+  parallelism:
+    description:
+      - Number of metadata requests sent at the same time.
+    type: int
+    default: 4
+  stats:
+    description:
+      - Whether C(stats) with the number and size of the listed objects is
+        returned.
+      - Sizes are summed up per prefix up to the next I(delimiter), C(/) by
+        default, after I(prefix).
+      - Objects in pseudo-directories of I(delimiter) are not listed and not
+        counted.
+    type: bool
+    default: false
+  return_objects:
+    description:
+      - Whether the listed objects are returned. Disable to only get
+        C(stats) of a large container.
+    type: bool
+    default: true
 requirements: ["openstacksdk", "otcextensions"]
 '''
 
@@ -95,6 +154,23 @@ swift:
           "transfer_encoding": null
         }
       ]
+    prefixes:
+      description: Pseudo-directories of the container.
+        Shows when delimiter param is not Null
+      type: list
+      sample: ["logs/2024/", "logs/2025/"]
+    stats:
+      description: Number and size of the listed objects, in total and per
+        prefix. Shows when stats param is true
+      type: dict
+      sample: {
+        "count": 3,
+        "bytes": 7340,
+        "prefixes": {
+          "logs/2024/": {"count": 2, "bytes": 7000},
+          "logs/": {"count": 1, "bytes": 340}
+        }
+      }
     metadata:
       description: Specifies the object metadata.
         Shows when container and object_name params is not Null
@@ -147,40 +223,210 @@ EXAMPLES = '''
     container: my_container
     object_name: my_object
   register: sw
+
+# List the pseudo-directories and objects of one directory
+- opentelekomcloud.cloud.object_info:
+    container: logs
+    prefix: "2024/"
+    delimiter: "/"
+  register: sw
+
+# Get the size of every month of a large log container
+- opentelekomcloud.cloud.object_info:
+    container: logs
+    prefix: "2024/"
+    stats: true
+    return_objects: false
+  register: sw
+
+# Write the metadata of the objects of a day to a file
+- opentelekomcloud.cloud.object_info:
+    container: logs
+    prefix: "2024/05/"
+    marker: "2024/05/17/"
+    end_marker: "2024/05/18/"
+    metadata: true
+    output_file: /tmp/objects.jsonl
+  register: sw
 '''
+from urllib.parse import quote
+
+from ansible_collections.opentelekomcloud.cloud.plugins.module_utils.concurrency import run_all
 from ansible_collections.opentelekomcloud.cloud.plugins.module_utils.otc import OTCModule
 
+# Objects whose metadata is fetched before the results are emitted
+METADATA_CHUNK = 256
+
+
+def _is_subdir(entry):
+    """Pseudo-directories are plain dicts, objects are SDK resources."""
+    return not hasattr(entry, 'to_dict')
+
+
+class ObjectStats:
+    """Number and size of objects in total and per prefix.
+
+    Only the counters are kept, objects are added one by one while they are
+    listed.
+    """
+
+    def __init__(self, prefix=None, delimiter='/'):
+        self.prefix = prefix or ''
+        self.delimiter = delimiter
+        self.count = 0
+        self.bytes = 0
+        self.prefixes = {}
+
+    def add(self, name, size):
+        self.count += 1
+        self.bytes += size
+        rest = name[len(self.prefix):]
+        head, found, _ = rest.partition(self.delimiter)
+        key = self.prefix + head + found if found else self.prefix
+        entry = self.prefixes.setdefault(key, dict(count=0, bytes=0))
+        entry['count'] += 1
+        entry['bytes'] += size
+
+    def to_dict(self):
+        return dict(count=self.count, bytes=self.bytes,
+                    prefixes=self.prefixes)
+
 
 class SwiftInfoModule(OTCModule):
+    info_module = True
+
     argument_spec = dict(
         container=dict(type='str', required=False),
         object_name=dict(type='str', required=False),
+        prefix=dict(type='str', required=False),
+        delimiter=dict(type='str', required=False),
+        marker=dict(type='str', required=False),
+        end_marker=dict(type='str', required=False),
+        limit=dict(type='int', required=False, default=10000),
+        metadata=dict(type='bool', required=False, default=False),
+        parallelism=dict(type='int', required=False, default=4),
+        stats=dict(type='bool', required=False, default=False),
+        return_objects=dict(type='bool', required=False, default=True),
     )
 
     module_kwargs = dict(
         supports_check_mode=True
     )
 
+    def _list_objects(self, container, **query):
+        """Listing entries of a container, page by page.
+
+        The SDK listing does not pass `delimiter` and `end_marker`, so the
+        container is listed directly. Pseudo-directories are dicts with
+        `id` and `subdir`, objects are SDK resources.
+        """
+        from openstack.object_store.v1.obj import Object
+
+        path = '/%s' % quote(container, safe='')
+        params = dict((key, value) for key, value in query.items()
+                      if value is not None)
+        params['format'] = 'json'
+        while True:
+            response = self.conn.object_store.get(path, params=params,
+                                                  raise_exc=False)
+            self.sdk.exceptions.raise_from_response(response)
+            entries = response.json() if response.content else []
+            for entry in entries:
+                if 'subdir' in entry:
+                    yield dict(id=entry['subdir'], subdir=entry['subdir'])
+                else:
+                    yield Object.existing(container=container, **entry)
+            # Swift caps the page size, a short page is not the last one
+            if not entries:
+                return
+            last = entries[-1]
+            params['marker'] = last.get('subdir') or last['name']
+
+    def _with_metadata(self, container, entries):
+        """Replace objects by their metadata, fetched concurrently."""
+        def head(entry):
+            if _is_subdir(entry):
+                return entry
+            return self.conn.object_store.get_object_metadata(
+                entry, container)
+
+        chunk = []
+        for entry in entries:
+            chunk.append(entry)
+            if len(chunk) >= METADATA_CHUNK:
+                yield from self._heads(head, chunk)
+                chunk = []
+        yield from self._heads(head, chunk)
+
+    def _heads(self, head, entries):
+        outcomes = run_all(head, entries, workers=self.params['parallelism'])
+        errors = ['%s: %s' % (outcome.item.id, outcome.error)
+                  for outcome in outcomes if outcome.error is not None]
+        if errors:
+            self.fail_json(msg='Failed to get metadata of %d objects: %s' % (
+                len(errors), '; '.join(errors)))
+        for outcome in outcomes:
+            yield outcome.result
+
+    def _objects(self, container):
+        entries = self.paged(
+            self._list_objects, container,
+            prefix=self.params['prefix'],
+            delimiter=self.params['delimiter'],
+            marker=self.params['marker'],
+            end_marker=self.params['end_marker'],
+            limit=self.params['limit'])
+        stats = None
+        if self.params['stats']:
+            stats = ObjectStats(self.params['prefix'],
+                                delimiter=self.params['delimiter'] or '/')
+            entries = self._counted(entries, stats)
+        if self.params['metadata'] and self.params['return_objects']:
+            entries = self._with_metadata(container, entries)
+
+        swift = dict()
+        if not self.params['return_objects']:
+            # Only the stats are collected while the listing is consumed
+            for entry in entries:
+                pass
+        else:
+            objects = self.result_list()
+            prefixes = []
+            for entry in entries:
+                if _is_subdir(entry):
+                    prefixes.append(entry['subdir'])
+                else:
+                    objects.append(self.project(entry))
+            swift['objects'] = objects
+            if self.params['delimiter']:
+                swift['prefixes'] = prefixes
+        if stats is not None:
+            swift['stats'] = stats.to_dict()
+        return swift
+
+    def _counted(self, entries, stats):
+        for entry in entries:
+            if not _is_subdir(entry):
+                stats.add(entry.name, entry.content_length or 0)
+            yield entry
+
     def run(self):
         container = self.params['container']
         object_name = self.params['object_name']
         if container and object_name:
-            metadata = self.conn.object_store.get_object(object_name, container)
-            metadata.pop('location')
+            metadata = self.project(
+                self.conn.object_store.get_object(object_name, container))
             self.exit(changed=False, swift=dict(metadata=metadata))
 
         if container:
-            objects = []
-            for raw in self.conn.object_store.objects(container):
-                dt = raw.to_dict()
-                dt.pop('location')
-                objects.append(dt)
-            self.exit(changed=False, swift=dict(objects=objects))
-
-        containers = []
-        for raw in self.conn.object_store.containers():
-            dt = raw.to_dict()
-            dt.pop('location')
+            self.exit(changed=False, swift=self._objects(container))
+
+        query = {}
+        if self.params['marker']:
+            query['marker'] = self.params['marker']
+        containers = self.result_list()
+        for raw in self.paged(self.conn.object_store.containers, **query):
+            dt = self.project(raw)
             containers.append(dt)
         self.exit(changed=False, swift=dict(containers=containers))
 
@@ -194,17 +194,20 @@ class RdsBackupModule(OTCModule):
 
     def _wait_for_delete(self, backup, instance, interval, wait):
         """Wait for backup to be deleted"""
-        orig_backup = backup
-        for count in self.sdk.utils.iterate_timeout(
-                timeout=wait,
-                message="Timeout waiting for backup to delete",
-                wait=interval):
-            backup = self.conn.rds.find_backup(name_or_id=backup.name,
-                                               instance=instance)
-            if backup.status.lower() == 'deleting':
-                return orig_backup
-            if backup is None:
-                return backup
+        deleting = set()
+
+        def list_backups():
+            # A backup in deleting status is as good as deleted
+            for item in self.conn.rds.backups(instance=instance):
+                if item.status and item.status.lower() == 'deleting':
+                    deleting.add(item.id)
+                    continue
+                yield item
+
+        self.waiter(service='rds', timeout=wait,
+                    interval=interval).wait_for_many_deleted(
+            list_backups, [backup.id])
+        return backup if deleting else None
 
     def run(self):
         name = self.params['name']
@@ -15,7 +15,9 @@ DOCUMENTATION = '''
 ---
 module: rds_backup_info
 short_description: Get RDS Backup info
-extends_documentation_fragment: opentelekomcloud.cloud.otc
+extends_documentation_fragment:
+  - opentelekomcloud.cloud.otc
+  - opentelekomcloud.cloud.otc.info
 version_added: "0.0.3"
 author: "Irina Pereiaslavskaia (@irina-pereiaslavskaia)"
 description:
@@ -120,6 +122,8 @@ from ansible_collections.opentelekomcloud.cloud.plugins.module_utils.otc import
 
 
 class RdsBackupInfoModule(OTCModule):
+    info_module = True
+
     argument_spec = dict(
         instance=dict(type='str',
                       required=True),
@@ -139,7 +143,7 @@ class RdsBackupInfoModule(OTCModule):
         backup_filter = self.params['backup']
         backup_type_filter = self.params['backup_type']
 
-        data = []
+        data = self.result_list()
         query = {}
         if instance_filter:
             instance = self.conn.rds.find_instance(name_or_id=instance_filter)
@@ -154,9 +158,8 @@ class RdsBackupInfoModule(OTCModule):
             self.fail(changed=False,
                       msg='RDS instance is missing')
 
-        for raw in self.conn.rds.backups(**query):
-            dt = raw.to_dict()
-            dt.pop('location')
+        for raw in self.paged(self.conn.rds.backups, **query):
+            dt = self.project(raw)
             data.append(dt)
 
         self.exit(
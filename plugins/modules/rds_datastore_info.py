@@ -15,7 +15,9 @@ DOCUMENTATION = '''
 ---
 module: rds_datastore_info
 short_description: Get supported RDS datastore versions
-extends_documentation_fragment: opentelekomcloud.cloud.otc
+extends_documentation_fragment:
+  - opentelekomcloud.cloud.otc
+  - opentelekomcloud.cloud.otc.info
 version_added: "0.0.1"
 author: "Artem Goncharov (@gtema)"
 description:
@@ -61,6 +63,8 @@ from ansible_collections.opentelekomcloud.cloud.plugins.module_utils.otc import
 
 
 class RdsDatastoreInfoModule(OTCModule):
+    info_module = True
+
     argument_spec = dict(
         name=dict(required=False),
         datastore=dict(choices=['mysql', 'postgresql', 'sqlserver'],
@@ -73,10 +77,9 @@ class RdsDatastoreInfoModule(OTCModule):
     def run(self):
         datastore = self.params['datastore']
 
-        data = []
-        for raw in self.conn.rds.datastores(database_name=datastore):
-            dt = raw.to_dict()
-            dt.pop('location')
+        data = self.result_list()
+        for raw in self.paged(self.conn.rds.datastores, database_name=datastore):
+            dt = self.project(raw)
             data.append(dt)
 
         self.exit_json(
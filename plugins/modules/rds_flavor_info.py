@@ -15,7 +15,9 @@ DOCUMENTATION = '''
 ---
 module: rds_flavor_info
 short_description: Get RDS flavor info
-extends_documentation_fragment: opentelekomcloud.cloud.otc
+extends_documentation_fragment:
+  - opentelekomcloud.cloud.otc
+  - opentelekomcloud.cloud.otc.info
 version_added: "0.0.1"
 author: "Artem Goncharov (@gtema)"
 description:
@@ -82,6 +84,8 @@ from ansible_collections.opentelekomcloud.cloud.plugins.module_utils.otc import
 
 
 class RdsFlavorModule(OTCModule):
+    info_module = True
+
     argument_spec = dict(
         name=dict(required=False),
         datastore=dict(choices=['mysql', 'postgresql', 'sqlserver']),
@@ -97,16 +101,15 @@ class RdsFlavorModule(OTCModule):
         version = self.params['version']
         instance_mode_filter = self.params['instance_mode']
 
-        data = []
-        for raw in self.conn.rds.flavors(datastore_name=datastore,
-                                         version_name=version):
+        data = self.result_list()
+        for raw in self.paged(self.conn.rds.flavors, datastore_name=datastore,
+                              version_name=version):
             if (instance_mode_filter
                     and raw.instance_mode != instance_mode_filter):
                 # Skip result
                 continue
-            dt = raw.to_dict()
-            dt.pop('location')
-            dt.pop('id')
+            dt = self.project(raw)
+            dt.pop('id', None)
             data.append(dt)
 
         self.exit_json(
@@ -15,7 +15,9 @@ DOCUMENTATION = '''
 ---
 module: rds_instance_info
 short_description: Get RDS Instance info
-extends_documentation_fragment: opentelekomcloud.cloud.otc
+extends_documentation_fragment:
+  - opentelekomcloud.cloud.otc
+  - opentelekomcloud.cloud.otc.info
 version_added: "0.0.2"
 author: "Artem Goncharov (@gtema)"
 description:
@@ -71,6 +73,8 @@ from ansible_collections.opentelekomcloud.cloud.plugins.module_utils.otc import
 
 
 class RdsInstanceInfoModule(OTCModule):
+    info_module = True
+
     argument_spec = dict(
         datastore_type=dict(type='str',
                             choices=['postgresql', 'mysql', 'sqlserver']),
@@ -85,7 +89,7 @@ class RdsInstanceInfoModule(OTCModule):
 
     def run(self):
 
-        data = []
+        data = self.result_list()
         query = {}
         ds_t = self.params['datastore_type']
         inst_type = self.params['instance_type']
@@ -131,9 +135,8 @@ class RdsInstanceInfoModule(OTCModule):
                     rds_instances=[],
                     message=('No router with name or id %s found' %
                              self.params['router']))
-        for raw in self.conn.rds.instances(**query):
-            dt = raw.to_dict()
-            dt.pop('location')
+        for raw in self.paged(self.conn.rds.instances, **query):
+            dt = self.project(raw)
             data.append(dt)
 
         self.exit(
@@ -52,7 +52,11 @@ options:
      type: bool
      default: false
      description:
-       - Deletes existing rules if true
+       - Deletes existing rules which are not in I(security_group_rules) if
+         true
+       - Rules are compared by direction, ethertype, protocol, port range and
+         remote, only missing rules are created and only surplus rules are
+         deleted.
 requirements:
     - "python >= 3.6"
     - "openstacksdk"
@@ -103,6 +107,8 @@ EXAMPLES = '''
 '''
 
 from ansible_collections.opentelekomcloud.cloud.plugins.module_utils.otc import OTCModule
+from ansible_collections.opentelekomcloud.cloud.plugins.module_utils.security_group_rules import canonical_rule
+from ansible_collections.opentelekomcloud.cloud.plugins.module_utils.security_group_rules import rule_definition
 
 
 class SecurityGroupModule(OTCModule):
@@ -135,6 +141,41 @@ class SecurityGroupModule(OTCModule):
             return True
         return False
 
+    def _rules_delta(self, secgroup):
+        """Rules to create and to delete to reach the requested rules.
+
+        Rules of the group are part of the group listing, so no additional
+        call is required to compare them.
+        """
+        existing = []
+        if secgroup:
+            existing = list(secgroup.get('security_group_rules') or [])
+        existing_keys = set(canonical_rule(rule) for rule in existing)
+        desired = {}
+        for rule in self.params['security_group_rules'] or []:
+            desired.setdefault(canonical_rule(rule), rule)
+
+        to_create = [rule for key, rule in desired.items()
+                     if key not in existing_keys]
+        to_delete = []
+        if self.params['exclusive']:
+            to_delete = [rule for rule in existing
+                         if canonical_rule(rule) not in desired]
+        return existing, to_create, to_delete
+
+    def _rule_dict(self, rule):
+        """Rule of the group listing in the form of the SDK resource."""
+        from openstack.network.v2.security_group_rule import SecurityGroupRule
+        return SecurityGroupRule.existing(**rule).to_dict()
+
+    def _create_rules(self, secgroup, rules, project_id):
+        """Create all rules with a single bulk request."""
+        data = [rule_definition(rule, secgroup['id'], project_id)
+                for rule in rules]
+        if not data:
+            return []
+        return list(self.conn.network.create_security_group_rules(data))
+
     def run(self):
 
         name = self.params['name']
@@ -142,7 +183,6 @@ class SecurityGroupModule(OTCModule):
         description = self.params['description']
         project = self.params['project']
         security_group_rules = self.params['security_group_rules']
-        exclusive = self.params['exclusive']
 
         data = []
 
@@ -160,10 +200,13 @@ class SecurityGroupModule(OTCModule):
             filters = None
 
         secgroup = self.conn.get_security_group(name, filters=filters)
-        sg_rules = None
+        existing, to_create, to_delete = self._rules_delta(secgroup)
 
         if self.ansible.check_mode:
-            self.exit(changed=self._system_state_change(secgroup))
+            changed = self._system_state_change(secgroup)
+            if state == 'present' and (to_create or to_delete):
+                changed = True
+            self.exit(changed=changed)
 
         changed = False
         if state == 'present':
@@ -174,32 +217,26 @@ class SecurityGroupModule(OTCModule):
                 secgroup = self.conn.create_security_group(name, description,
                                                            **kwargs)
                 changed = True
+                # New groups come with default rules
+                existing, to_create, to_delete = self._rules_delta(secgroup)
             else:
                 if self._needs_update(secgroup):
                     secgroup = self.conn.update_security_group(
                         secgroup['id'], description=description)
                     changed = True
 
-            if exclusive:
-                # delete security group rules if any exists
-                sg_rules = self.conn.network.security_group_rules(
-                    security_group_id=secgroup.id)
-                if sg_rules:
-                    for rule in sg_rules:
-                        self.conn.network.delete_security_group_rule(
-                            security_group_rule=rule.id)
+            for rule in to_delete:
+                self.conn.network.delete_security_group_rule(
+                    security_group_rule=rule['id'])
+            created = self._create_rules(secgroup, to_create, project_id)
+            if to_delete or created:
+                changed = True
 
             if security_group_rules is not None:
-                # create rules
-                for rule in security_group_rules:
-                    self.conn.create_security_group_rule(name, **rule)
-                sg_rules = self.conn.network.security_group_rules(
-                    security_group_id=secgroup.id)
-                # prepare sg rules data
-                for raw in sg_rules:
-                    dt = raw.to_dict()
-                    data.append(dt)
-                changed = True
+                deleted = set(rule['id'] for rule in to_delete)
+                data = [self._rule_dict(rule) for rule in existing
+                        if rule['id'] not in deleted]
+                data.extend(rule.to_dict() for rule in created)
 
             self.exit(
                 changed=changed, id=secgroup['id'],
@@ -14,7 +14,9 @@
 DOCUMENTATION = '''
 module: security_group_info
 short_description: Lists security groups
-extends_documentation_fragment: opentelekomcloud.cloud.otc
+extends_documentation_fragment:
+  - opentelekomcloud.cloud.otc
+  - opentelekomcloud.cloud.otc.info
 version_added: "0.1.2"
 author: "Tino Schreiber (@tischrei)"
 description:
@@ -113,6 +115,9 @@ from ansible_collections.opentelekomcloud.cloud.plugins.module_utils.otc import
 
 
 class SecurityGroupInfoModule(OTCModule):
+    info_module = True
+    marker_paging = True
+
     argument_spec = dict(
         description=dict(required=False),
         name=dict(required=False),
@@ -124,7 +129,7 @@ class SecurityGroupInfoModule(OTCModule):
 
     def run(self):
 
-        data = []
+        data = self.result_list()
         query = {}
 
         if self.params['name']:
@@ -146,9 +151,8 @@ class SecurityGroupInfoModule(OTCModule):
         if self.params['project_id']:
             query['project_id'] = self.params['project_id']
 
-        for raw in self.conn.network.security_groups(**query):
-            dt = raw.to_dict()
-            dt.pop('location')
+        for raw in self.paged(self.conn.network.security_groups, **query):
+            dt = self.project(raw)
             data.append(dt)
 
         self.exit(
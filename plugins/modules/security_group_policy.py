@@ -0,0 +1,333 @@
+#!/usr/bin/python
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+DOCUMENTATION = '''
+---
+module: security_group_policy
+short_description: Manage many security groups and their rules at once.
+extends_documentation_fragment: opentelekomcloud.cloud.otc
+version_added: "0.16.0"
+author: "Open Telekom Cloud (@opentelekomcloud)"
+description:
+   - Manage a policy of many security groups of a project, including rules
+     referencing other groups of the policy.
+   - All security groups and rules of the project are listed once. Missing
+     groups are created first, then the rules of all groups are updated
+     concurrently, then groups with I(state=absent) are deleted.
+options:
+   project:
+     description:
+        - Unique name or ID of the project.
+     required: false
+     type: str
+   security_groups:
+     description:
+        - Security groups of the policy.
+     required: true
+     type: list
+     elements: dict
+     suboptions:
+       name:
+         description:
+           - Name of the security group. Names must be unique in the project.
+         required: true
+         type: str
+       description:
+         description:
+           - Long description of the purpose of the security group.
+         type: str
+       state:
+         description:
+           - Should the resource be present or absent.
+         choices: [present, absent]
+         default: present
+         type: str
+       rules:
+         description:
+           - Rules of the security group, with the same attributes as
+             I(security_group_rules) of M(opentelekomcloud.cloud.security_group).
+           - C(remote_group) references another group by name or ID.
+         type: list
+         elements: dict
+   exclusive:
+     description:
+        - Deletes rules of the listed groups which are not in the policy.
+     type: bool
+     default: true
+   parallelism:
+     description:
+        - Number of security groups updated at the same time.
+     type: int
+     default: 4
+requirements:
+    - "python >= 3.6"
+    - "openstacksdk"
+    - "otcextensions"
+'''
+
+RETURN = '''
+security_groups:
+  description: Changes per security group.
+  returned: On success.
+  type: complex
+  contains:
+    name:
+      description: Name of the security group.
+      type: str
+      sample: "web"
+    id:
+      description: ID of the security group.
+      type: str
+      sample: "d90e55ba-23bd-4d97-b722-8cb6fb485d69"
+    changed:
+      description: Whether the group or its rules were changed.
+      type: bool
+    created:
+      description: Whether the group was created.
+      type: bool
+    deleted:
+      description: Whether the group was deleted.
+      type: bool
+    rules_created:
+      description: Number of created rules.
+      type: int
+      sample: 2
+    rules_deleted:
+      description: Number of deleted rules.
+      type: int
+      sample: 1
+'''
+
+EXAMPLES = '''
+# Web and database tier referencing each other
+- opentelekomcloud.cloud.security_group_policy:
+    security_groups:
+      - name: web
+        description: web servers
+        rules:
+          - direction: ingress
+            protocol: tcp
+            port_range_min: 443
+            port_range_max: 443
+            remote_ip_prefix: 0.0.0.0/0
+          - direction: egress
+            ethertype: IPv4
+      - name: db
+        rules:
+          - direction: ingress
+            protocol: tcp
+            port_range_min: 5432
+            port_range_max: 5432
+            remote_group: web
+      - name: legacy
+        state: absent
+'''
+
+from ansible_collections.opentelekomcloud.cloud.plugins.module_utils.concurrency import run_all
+from ansible_collections.opentelekomcloud.cloud.plugins.module_utils.otc import OTCModule
+from ansible_collections.opentelekomcloud.cloud.plugins.module_utils.security_group_rules import canonical_rule
+from ansible_collections.opentelekomcloud.cloud.plugins.module_utils.security_group_rules import rule_definition
+
+
+class SecurityGroupPolicyModule(OTCModule):
+
+    argument_spec = dict(
+        project=dict(default=None),
+        security_groups=dict(
+            type='list', elements='dict', required=True,
+            options=dict(
+                name=dict(required=True),
+                description=dict(default=None),
+                state=dict(default='present', choices=['absent', 'present']),
+                rules=dict(type='list', elements='dict'))),
+        exclusive=dict(type='bool', default=True),
+        parallelism=dict(type='int', default=4)
+    )
+    module_kwargs = dict(
+        supports_check_mode=True
+    )
+
+    def _index(self, project_id):
+        """List all groups and rules of the project once."""
+        query = {}
+        if project_id:
+            query['project_id'] = project_id
+        groups = {}
+        by_name = {}
+        for group in self.conn.network.security_groups(**query):
+            groups[group.id] = group
+            by_name.setdefault(group.name, []).append(group)
+        rules = dict((group_id, []) for group_id in groups)
+        for rule in self.conn.network.security_group_rules(**query):
+            rules.setdefault(rule.security_group_id, []).append(
+                rule.to_dict(computed=False))
+        return groups, by_name, rules
+
+    def _find(self, groups, by_name, name_or_id):
+        if name_or_id in groups:
+            return groups[name_or_id]
+        matches = by_name.get(name_or_id) or []
+        if len(matches) > 1:
+            self.fail_json(
+                msg='Multiple security groups named %s found' % name_or_id)
+        return matches[0] if matches else None
+
+    def _desired_rules(self, policy, group_ids):
+        """Requested rules with remote groups resolved from the index."""
+        rules = {}
+        for rule in policy['rules'] or []:
+            rule = dict(rule)
+            remote = rule.pop('remote_group', None)
+            if remote:
+                if remote not in group_ids:
+                    self.fail_json(
+                        msg='Remote group %s of security group %s not found'
+                            % (remote, policy['name']))
+                rule['remote_group_id'] = group_ids[remote]
+            rules.setdefault(canonical_rule(rule), rule)
+        return rules
+
+    def run(self):
+        project = self.params['project']
+        policies = self.params['security_groups']
+
+        if project is not None:
+            proj = self.conn.get_project(project)
+            if proj is None:
+                self.fail_json(msg='Project %s could not be found' % project)
+            project_id = proj['id']
+        else:
+            project_id = self.conn.current_project_id
+
+        names = [policy['name'] for policy in policies]
+        duplicates = sorted(set(n for n in names if names.count(n) > 1))
+        if duplicates:
+            self.fail_json(msg='Security groups %s are given more than once'
+                               % ', '.join(duplicates))
+
+        groups, by_name, rules = self._index(project_id)
+        results = dict((policy['name'], dict(
+            name=policy['name'], id=None, changed=False, created=False,
+            deleted=False, rules_created=0, rules_deleted=0))
+            for policy in policies)
+        found = {}
+        for policy in policies:
+            group = self._find(groups, by_name, policy['name'])
+            found[policy['name']] = group
+            if group is not None:
+                results[policy['name']]['id'] = group.id
+
+        present = [p for p in policies if p['state'] == 'present']
+        absent = [p for p in policies
+                  if p['state'] == 'absent' and found[p['name']]]
+
+        # Create missing groups first, so that rules can reference them
+        missing = [p for p in present if found[p['name']] is None]
+        if not self.ansible.check_mode:
+            for outcome in self._apply(results, missing,
+                                       self._create_group(project_id)):
+                group = outcome.result
+                found[group.name] = group
+                # New groups come with default rules
+                rules[group.id] = list(group.security_group_rules or [])
+                results[group.name].update(id=group.id, created=True)
+
+        # Remote groups are resolved by name and by ID of listed groups
+        group_ids = dict((group.id, group.id) for group in groups.values())
+        for name, matches in by_name.items():
+            if len(matches) == 1:
+                group_ids[name] = matches[0].id
+        for name, group in found.items():
+            # Placeholder of groups which would be created in check mode
+            group_ids[name] = group.id if group else 'new:%s' % name
+
+        deltas = {}
+        for policy in present:
+            group = found[policy['name']]
+            desired = self._desired_rules(policy, group_ids)
+            existing = rules.get(group.id, []) if group else []
+            existing_keys = set(canonical_rule(rule) for rule in existing)
+            to_create = [rule for key, rule in desired.items()
+                         if key not in existing_keys]
+            to_delete = []
+            if self.params['exclusive'] and policy['rules'] is not None:
+                to_delete = [rule for rule in existing
+                             if canonical_rule(rule) not in desired]
+            update = (group is not None
+                      and policy['description'] is not None
+                      and group.description != policy['description'])
+            deltas[policy['name']] = (to_create, to_delete, update)
+            result = results[policy['name']]
+            result['rules_created'] = len(to_create)
+            result['rules_deleted'] = len(to_delete)
+            result['changed'] = bool(group is None or result['created']
+                                     or to_create or to_delete or update)
+        for policy in absent:
+            results[policy['name']].update(changed=True, deleted=True)
+
+        changed = any(result['changed'] for result in results.values())
+        if self.ansible.check_mode:
+            self.exit_json(changed=changed,
+                           security_groups=list(results.values()))
+
+        def apply_rules(policy):
+            group = found[policy['name']]
+            to_create, to_delete, update = deltas[policy['name']]
+            if update:
+                self.conn.network.update_security_group(
+                    group, description=policy['description'])
+            for rule in to_delete:
+                self.conn.network.delete_security_group_rule(rule['id'])
+            if to_create:
+                list(self.conn.network.create_security_group_rules([
+                    rule_definition(rule, group.id, project_id)
+                    for rule in to_create]))
+
+        self._apply(results, [p for p in present if any(deltas[p['name']])],
+                    apply_rules)
+        self._apply(results, absent,
+                    lambda policy: self.conn.network.delete_security_group(
+                        found[policy['name']]))
+
+        self.exit_json(changed=changed,
+                       security_groups=list(results.values()))
+
+    def _create_group(self, project_id):
+        def create(policy):
+            attrs = dict(name=policy['name'],
+                         description=policy['description'] or '')
+            if project_id:
+                attrs['project_id'] = project_id
+            return self.conn.network.create_security_group(**attrs)
+        return create
+
+    def _apply(self, results, policies, func):
+        """Run func for all policies concurrently, fail on errors."""
+        outcomes = run_all(func, policies, workers=self.params['parallelism'])
+        errors = ['%s: %s' % (outcome.item['name'], outcome.error)
+                  for outcome in outcomes if outcome.error is not None]
+        if errors:
+            self.fail_json(
+                msg='Failed to apply the policy to %d security groups: %s'
+                    % (len(errors), '; '.join(errors)),
+                changed=True, security_groups=list(results.values()))
+        return outcomes
+
+
+def main():
+    module = SecurityGroupPolicyModule()
+    module()
+
+
+if __name__ == '__main__':
+    main()
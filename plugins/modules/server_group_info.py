@@ -14,7 +14,9 @@
 DOCUMENTATION = '''
 module: server_group_info
 short_description: Lists server groups
-extends_documentation_fragment: opentelekomcloud.cloud.otc
+extends_documentation_fragment:
+  - opentelekomcloud.cloud.otc
+  - opentelekomcloud.cloud.otc.info
 version_added: "0.5.0"
 author: "Tino Schreiber (@tischrei)"
 description:
@@ -74,6 +76,8 @@ from ansible_collections.opentelekomcloud.cloud.plugins.module_utils.otc import
 
 
 class ServerGroupInfoModule(OTCModule):
+    info_module = True
+
     argument_spec = {}
     module_kwargs = dict(
         supports_check_mode=True
@@ -81,11 +85,10 @@ class ServerGroupInfoModule(OTCModule):
 
     def run(self):
 
-        data = []
+        data = self.result_list()
 
-        for raw in self.conn.compute.server_groups():
-            dt = raw.to_dict()
-            dt.pop('location')
+        for raw in self.paged(self.conn.compute.server_groups):
+            dt = self.project(raw)
             data.append(dt)
 
         self.exit(
@@ -249,11 +249,8 @@ class SubnetModule(OTCModule):
 
         if state == 'present':
             if subnet is None:
-                self.sdk.resource.wait_for_status(
-                    self.conn.vpc,
-                    vpc, 'OK',
-                    None, 1, 5
-                )
+                self.waiter(service='vpc', timeout=5, interval=1).wait_for_status(
+                    self.conn.vpc, vpc, 'OK')
                 subnet = self.conn.vpc.create_subnet(**data)
             elif has_changes:
                 err_fields = {}
@@ -274,16 +271,14 @@ class SubnetModule(OTCModule):
                     name=subnet.name,
                     **update_data,
                 )
-            subnet = self.sdk.resource.wait_for_status(
-                self.conn.vpc,
-                subnet, 'ACTIVE',
-                None, 2, 20
-            )
+            subnet = self.waiter(service='vpc', timeout=20).wait_for_status(
+                self.conn.vpc, subnet, 'ACTIVE')
             self.exit(changed=has_changes, subnet=subnet)
         elif state == 'absent':
             if subnet:
                 self.conn.vpc.delete_subnet(subnet, ignore_missing=True)
-                self.sdk.resource.wait_for_delete(self.conn.vpc, subnet, 2, 60)
+                self.waiter(service='vpc', timeout=60).wait_for_delete(
+                    self.conn.vpc, subnet)
             self.exit(changed=has_changes)
 
     def _changed(self, state, expected):
@@ -15,7 +15,9 @@ DOCUMENTATION = '''
 ---
 module: subnet_info
 short_description: Get subnet info from OpenTelekomCloud
-extends_documentation_fragment: opentelekomcloud.cloud.otc
+extends_documentation_fragment:
+  - opentelekomcloud.cloud.otc
+  - opentelekomcloud.cloud.otc.info
 version_added: "0.11.1"
 author: "Polina Gubina(@polina-gubina)"
 description:
@@ -103,6 +105,9 @@ from ansible_collections.opentelekomcloud.cloud.plugins.module_utils.otc import
 
 
 class SubnetInfoModule(OTCModule):
+    info_module = True
+    marker_paging = True
+
     argument_spec = dict(
         name_or_id=dict(required=False),
         vpc=dict(required=False)
@@ -113,21 +118,19 @@ class SubnetInfoModule(OTCModule):
     )
 
     def run(self):
-        data = []
+        data = self.result_list()
 
         if self.params['name_or_id']:
             raw = self.conn.vpc.find_subnet(name_or_id=self.params['name_or_id'])
-            dt = raw.to_dict()
-            dt.pop('location')
+            dt = self.project(raw)
             data.append(dt)
         else:
             query = {}
             if self.params['vpc']:
                 vpc = self.conn.vpc.find_vpc(name_or_id=self.params['vpc'])
                 query['vpc_id'] = vpc.id
-            for raw in self.conn.vpc.subnets(**query):
-                dt = raw.to_dict()
-                dt.pop('location')
+            for raw in self.paged(self.conn.vpc.subnets, **query):
+                dt = self.project(raw)
                 data.append(dt)
 
         self.exit_json(
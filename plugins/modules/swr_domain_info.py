@@ -15,7 +15,9 @@ DOCUMENTATION = '''
 ---
 module: swr_domain_info
 short_description: Get SWR domain info
-extends_documentation_fragment: opentelekomcloud.cloud.otc
+extends_documentation_fragment:
+  - opentelekomcloud.cloud.otc
+  - opentelekomcloud.cloud.otc.info
 version_added: "0.14.2"
 author: "Ziukina Valeriia (@RusselSand)"
 description:
@@ -107,6 +109,8 @@ from ansible_collections.opentelekomcloud.cloud.plugins.module_utils.otc import
 
 
 class SwrOrganisationInfoModule(OTCModule):
+    info_module = True
+
     argument_spec = dict(
         namespace=dict(required=True),
         repository=dict(required=True),
@@ -118,13 +122,16 @@ class SwrOrganisationInfoModule(OTCModule):
 
     def run(self):
         if self.params['domain']:
-            domains = self.conn.swr.get_domain(self.params['namespace'],
-                                               self.params['repository'],
-                                               self.params['domain'])
+            domains = self.project(
+                self.conn.swr.get_domain(self.params['namespace'],
+                                         self.params['repository'],
+                                         self.params['domain']))
         else:
             query = {'namespace': self.params['namespace'],
                      'repository': self.params['repository']}
-            domains = list(self.conn.swr.domains(**query))
+            domains = self.result_list()
+            domains.extend(self.project(raw)
+                           for raw in self.paged(self.conn.swr.domains, **query))
         self.exit_json(
             changed=False,
             domains=domains
@@ -15,7 +15,9 @@ DOCUMENTATION = '''
 ---
 module: swr_organization_info
 short_description: Get SWR organisations info
-extends_documentation_fragment: opentelekomcloud.cloud.otc
+extends_documentation_fragment:
+  - opentelekomcloud.cloud.otc
+  - opentelekomcloud.cloud.otc.info
 version_added: "0.14.2"
 author: "Ziukina Valeriia (@RusselSand)"
 description:
@@ -63,6 +65,8 @@ from ansible_collections.opentelekomcloud.cloud.plugins.module_utils.otc import
 
 
 class SwrOrganisationInfoModule(OTCModule):
+    info_module = True
+
     argument_spec = dict(
         namespace=dict(required=False)
     )
@@ -72,9 +76,12 @@ class SwrOrganisationInfoModule(OTCModule):
 
     def run(self):
         if self.params['namespace']:
-            orgs = self.conn.swr.get_organization(self.params['namespace'])
+            orgs = self.project(
+                self.conn.swr.get_organization(self.params['namespace']))
         else:
-            orgs = list(self.conn.swr.organizations())
+            orgs = self.result_list()
+            orgs.extend(self.project(raw)
+                        for raw in self.paged(self.conn.swr.organizations))
         self.exit_json(
             changed=False,
             organizations=orgs
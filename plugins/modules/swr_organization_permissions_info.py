@@ -15,7 +15,10 @@ DOCUMENTATION = '''
 ---
 module: swr_organization_permissions_info
 short_description: Get SWR organization permissions info
-extends_documentation_fragment: opentelekomcloud.cloud.otc
+extends_documentation_fragment:
+  - opentelekomcloud.cloud.otc
+  - opentelekomcloud.cloud.otc.projection
+  - opentelekomcloud.cloud.otc.output
 version_added: "0.14.2"
 author: "Ziukina Valeriia (@RusselSand)"
 description:
@@ -67,6 +70,9 @@ from ansible_collections.opentelekomcloud.cloud.plugins.module_utils.otc import
 
 
 class SwrOrgPermissionInfoModule(OTCModule):
+    info_module = True
+    info_paging = False
+
     argument_spec = dict(
         namespace=dict(required=True),
         user_name=dict(required=False)
@@ -94,9 +100,11 @@ class SwrOrgPermissionInfoModule(OTCModule):
                 all_auth.append(permission_dict)
         if self.params['user_name']:
             all_auth = list(filter(lambda x: x['user_name'] == self.params['user_name'], all_auth))
+        permissions = self.result_list()
+        permissions.extend(self.project(auth) for auth in all_auth)
         self.exit_json(
             changed=False,
-            permissions=all_auth
+            permissions=permissions
         )
 
 
@@ -15,7 +15,9 @@ DOCUMENTATION = '''
 ---
 module: swr_repository_info
 short_description: Get SWR repositories info
-extends_documentation_fragment: opentelekomcloud.cloud.otc
+extends_documentation_fragment:
+  - opentelekomcloud.cloud.otc
+  - opentelekomcloud.cloud.otc.info
 version_added: "0.14.2"
 author: "Ziukina Valeriia (@RusselSand)"
 description:
@@ -164,6 +166,8 @@ from ansible_collections.opentelekomcloud.cloud.plugins.module_utils.otc import
 
 
 class SwrRepositoryInfoModule(OTCModule):
+    info_module = True
+
     argument_spec = dict(
         namespace=dict(required=False),
         repository=dict(required=False),
@@ -181,10 +185,10 @@ class SwrRepositoryInfoModule(OTCModule):
 
     def run(self):
         if self.params['namespace'] and self.params['repository']:
-            repos = self.conn.swr.get_repository(
+            repos = self.project(self.conn.swr.get_repository(
                 namespace=self.params['namespace'],
                 repository=self.params['repository']
-            )
+            ))
         else:
             query = {}
 
@@ -212,7 +216,9 @@ class SwrRepositoryInfoModule(OTCModule):
                 query['order_column'] = order_column
                 query['order_type'] = order_type
 
-            repos = list(self.conn.swr.repositories(**query))
+            repos = self.result_list()
+            repos.extend(self.project(raw)
+                         for raw in self.paged(self.conn.swr.repositories, **query))
         self.exit_json(
             changed=False,
             repositories=repos
@@ -15,7 +15,10 @@ DOCUMENTATION = '''
 ---
 module: swr_repository_permissions_info
 short_description: Get SWR repository permissions info
-extends_documentation_fragment: opentelekomcloud.cloud.otc
+extends_documentation_fragment:
+  - opentelekomcloud.cloud.otc
+  - opentelekomcloud.cloud.otc.projection
+  - opentelekomcloud.cloud.otc.output
 version_added: "0.14.2"
 author: "Ziukina Valeriia (@RusselSand)"
 description:
@@ -76,6 +79,9 @@ from ansible_collections.opentelekomcloud.cloud.plugins.module_utils.otc import
 
 
 class SwrRepoPermissionInfoModule(OTCModule):
+    info_module = True
+    info_paging = False
+
     argument_spec = dict(
         namespace=dict(required=True),
         repository=dict(required=True),
@@ -107,9 +113,11 @@ class SwrRepoPermissionInfoModule(OTCModule):
                 all_auth.append(permission_dict)
         if self.params['user_name']:
             all_auth = list(filter(lambda x: x['user_name'] == self.params['user_name'], all_auth))
+        permissions = self.result_list()
+        permissions.extend(self.project(auth) for auth in all_auth)
         self.exit_json(
             changed=False,
-            permissions=all_auth
+            permissions=permissions
         )
 
 
@@ -57,6 +57,32 @@ options:
       description:
         - Name or id of the Neutron Trunk resource.
       type: str
+   resource_type:
+      description:
+        - Type of the resources to tag many resources at once.
+        - The resources are listed with a single call and are selected by
+          I(resources), or all listed resources matching I(filters) are
+          tagged.
+        - One of I(resources) and I(filters) is required. An empty
+          I(filters) dictionary selects all resources of the type.
+      choices: [server, floating_ip, network, port, router, security_group,
+                security_group_rule, subnet, trunk]
+      type: str
+   resources:
+      description:
+        - Names or ids of the resources of I(resource_type).
+      type: list
+      elements: str
+   filters:
+      description:
+        - Query filters of the listing of I(resource_type), i.e.
+          C(network_id) to select all ports of a network.
+      type: dict
+   parallelism:
+      description:
+        - Number of resources tagged at the same time.
+      default: 4
+      type: int
    state:
      description:
        - Should the resource be present or absent.
@@ -78,9 +104,12 @@ options:
      default: replace
      type: str
 notes:
+    - Tags are updated with a single request replacing all tags of the
+      resource, tags are added or removed one by one only if the service
+      does not support it.
     - One and only one of C(server), C(floating_ip), C(network), C(port),
       C(router), C(security_group), C(security_group_rule), C(subnet),
-      C(trunk) should be set.
+      C(trunk), C(resource_type) should be set.
 requirements:
     - "python >= 2.7"
     - "openstacksdk"
@@ -125,6 +154,25 @@ EXAMPLES = '''
     state: present
     tags:
       - new_tag1
+
+- name: add a tag to several servers
+  opentelekomcloud.cloud.tag:
+    resource_type: server
+    resources:
+      - "{{ server_name }}"
+      - "{{ other_server_name }}"
+    mode: set
+    tags:
+      - new_tag
+
+- name: add a tag to all ports of a network
+  opentelekomcloud.cloud.tag:
+    resource_type: port
+    filters:
+      network_id: "{{ network_id }}"
+    mode: set
+    tags:
+      - new_tag
 '''
 
 RETURN = '''
@@ -133,10 +181,63 @@ tags:
     returned: success
     type: list
     sample: ["tag1", "tag2"]
+api_calls:
+    description: Number of API calls, listing resources, fetching and
+      updating the tags.
+    returned: success
+    type: int
+    sample: 2
+resources:
+    description: Tags per resource when I(resource_type) is set.
+    returned: success when I(resource_type) is set
+    type: complex
+    contains:
+      id:
+        description: ID of the resource.
+        type: str
+      name:
+        description: Name of the resource.
+        type: str
+      changed:
+        description: Whether the tags of the resource were changed.
+        type: bool
+      tags:
+        description: Present tags on the resource.
+        type: list
+        sample: ["tag1", "tag2"]
+      error:
+        description: Error of a failed resource.
+        type: str
 '''
 
+import threading
+
+from ansible_collections.opentelekomcloud.cloud.plugins.module_utils.concurrency import run_all
 from ansible_collections.opentelekomcloud.cloud.plugins.module_utils.otc import OTCModule
 
+# Proxy, list method, URL prefix and microversion per resource type
+RESOURCE_TYPES = {
+    'server': ('compute', 'servers', '/servers', '2.26'),
+    'floating_ip': ('network', 'ips', '/floatingips', None),
+    'network': ('network', 'networks', '/networks', None),
+    'port': ('network', 'ports', '/ports', None),
+    'router': ('network', 'routers', '/routers', None),
+    'security_group': ('network', 'security_groups', '/security-groups',
+                       None),
+    'security_group_rule': ('network', 'security_group_rules',
+                            '/security-group-rules', None),
+    'subnet': ('network', 'subnets', '/subnets', None),
+    'trunk': ('network', 'trunks', '/trunks', None),
+}
+
+
+class TagError(Exception):
+    """A tag request was rejected.
+
+    Raised instead of failing the module, since tags of many resources are
+    changed in worker threads.
+    """
+
 
 class TagModule(OTCModule):
 
@@ -152,10 +253,25 @@ class TagModule(OTCModule):
         trunk=dict(default=None),
         state=dict(default='present', choices=['absent', 'present']),
         tags=dict(default=[], elements='str', type='list'),
-        mode=dict(default='replace', choices=['replace', 'set'])
+        mode=dict(default='replace', choices=['replace', 'set']),
+        resource_type=dict(default=None, choices=[
+            'server', 'floating_ip', 'network', 'port', 'router',
+            'security_group', 'security_group_rule', 'subnet', 'trunk']),
+        resources=dict(default=None, elements='str', type='list'),
+        filters=dict(default=None, type='dict'),
+        parallelism=dict(default=4, type='int')
     )
     module_kwargs = dict(
-        supports_check_mode=True
+        supports_check_mode=True,
+        mutually_exclusive=[
+            ['resource_type', 'server', 'floating_ip', 'network', 'port',
+             'router', 'security_group', 'security_group_rule', 'subnet',
+             'trunk'],
+        ],
+        required_by=dict(
+            resources=('resource_type',),
+            filters=('resource_type',),
+        )
     )
 
     @staticmethod
@@ -178,75 +294,171 @@ class TagModule(OTCModule):
             }
         )
 
-    def fetch_tags(self, url_prefix, microver, instance):
+    def _request(self, endpoint, method, url, microver, **kwargs):
+        """Send a request to the service and count it"""
+        with self._lock:
+            self.api_calls += 1
+        return endpoint.request(
+            url, method, microversion=microver, raise_exc=False, **kwargs)
+
+    def fetch_tags(self, endpoint, url_prefix, microver, instance):
         """Get current tags"""
-        result = None
-        try:
-            inst = instance.fetch_tags(self.conn)
-            result = inst.tags
-        except AttributeError:
-            # Try a low-level access if SDK version is old
-            response = self.conn.get(
-                self._get_tags_url(url_prefix, instance),
-                microversion=microver)
-
-            if response.content and response.status_code < 400:
-                result = response.json()['tags']
+        response = self._request(
+            endpoint, 'GET', self._get_tags_url(url_prefix, instance),
+            microver)
+        if response.status_code >= 400:
+            raise TagError('Request failed: %s' % response.reason)
+        return response.json()['tags']
+
+    def replace_tags(self, endpoint, url_prefix, microver, instance, tags,
+                     current_tags):
+        """Replace all tags at once
+
+        Falls back to adding and removing tags one by one if the service
+        does not support replacing the tags.
+        """
+        response = self._request(
+            endpoint, 'PUT', self._get_tags_url(url_prefix, instance),
+            microver, json={'tags': tags})
+        if response.status_code < 400:
+            return response.json()['tags'] if response.content else tags
+        if response.status_code not in [404, 405, 501]:
+            raise TagError(
+                'API returned something bad %s' % response.reason)
+
+        for tag in tags:
+            if tag in current_tags:
+                continue
+            response = self._request(
+                endpoint, 'PUT', self._get_tag_url(url_prefix, instance, tag),
+                microver)
+            if response.status_code not in [201, 204]:
+                raise TagError(
+                    'API returned something bad %s' % response.reason)
+        for tag in current_tags:
+            if tag in tags:
+                continue
+            response = self._request(
+                endpoint, 'DELETE',
+                self._get_tag_url(url_prefix, instance, tag), microver)
+            if response.status_code not in [204, 404]:
+                raise TagError(
+                    'API returned something bad %s' % response.reason)
+        return list(tags)
+
+    def _target_tags(self, current_tags):
+        """Tags the resource should have, None if nothing changes"""
+        state = self.params['state']
+        mode = self.params['mode']
+        new_tags = self.params['tags'] or []
+        if state == 'present':
+            if mode == 'replace':
+                if set(current_tags) != set(new_tags):
+                    # Any of the tags mismatch
+                    return list(new_tags)
+            elif any(x not in current_tags for x in new_tags):
+                # At least one tag should be set
+                return current_tags + [
+                    tag for tag in new_tags if tag not in current_tags]
+        elif any(x in current_tags for x in new_tags):
+            # At least one tag should be removed
+            return [tag for tag in current_tags if tag not in new_tags]
+        return None
+
+    def _tag_resource(self, endpoint, url_prefix, microver, instance,
+                      current_tags=None):
+        """Bring the tags of a resource into the requested state
+
+        Returns:
+            (changed, tags)
+        """
+        if current_tags is None:
+            current_tags = self.fetch_tags(
+                endpoint, url_prefix, microver, instance)
+        target = self._target_tags(current_tags)
+        if target is None:
+            return False, current_tags
+        if self.ansible.check_mode:
+            return True, target
+        return True, self.replace_tags(
+            endpoint, url_prefix, microver, instance, target, current_tags)
+
+    def _list_resources(self, resource_type):
+        """Resolve the resources of a type with a single list call"""
+        proxy, list_method, url_prefix, microver = RESOURCE_TYPES[
+            resource_type]
+        endpoint = getattr(self.conn, proxy)
+        filters = self.params['filters'] or {}
+        with self._lock:
+            self.api_calls += 1
+        listed = list(getattr(endpoint, list_method)(**filters))
+        names = self.params['resources']
+        if names is None:
+            return endpoint, url_prefix, microver, listed, []
+
+        by_id = dict((res.id, res) for res in listed)
+        by_name = {}
+        for res in listed:
+            if getattr(res, 'name', None):
+                by_name.setdefault(res.name, []).append(res)
+        instances = []
+        missing = []
+        for name in names:
+            if name in by_id:
+                instances.append(by_id[name])
+            elif len(by_name.get(name) or []) == 1:
+                instances.append(by_name[name][0])
             else:
-                self.fail_json(msg='Request failed: %s' % response.reason)
-
-        return result
-
-    def replace_tags(self, url_prefix, microver, instance, tags):
-        """Replace all tags at once"""
-        result = None
-        try:
-            inst = instance.set_tags(self.conn, tags)
-            result = inst.tags
-        except AttributeError:
-            # Try a low-level access if SDK version is old
-            data = {'tags': tags}
-            response = self.conn.put(
-                self._get_tags_url(url_prefix, instance),
-                json=data, microversion=microver)
-            if response.content and response.status_code < 400:
-                result = response.json()['tags']
+                missing.append(name)
+        return endpoint, url_prefix, microver, instances, missing
+
+    def run_many(self):
+        """Tag all resources of a type given by name or filters"""
+        resource_type = self.params['resource_type']
+        if self.params['resources'] is None and self.params['filters'] is None:
+            # Replacing the tags of every resource must be asked for
+            self.fail_json(
+                msg='resources or filters is required with resource_type, '
+                    'use empty filters to tag all resources of the type')
+        endpoint, url_prefix, microver, instances, missing = \
+            self._list_resources(resource_type)
+        if missing:
+            self.fail_json(
+                msg='Resources %s can not be found or are not unique'
+                    % ', '.join(missing))
+
+        def tag(instance):
+            # Listed neutron resources come with their tags
+            current_tags = None
+            if endpoint is self.conn.network:
+                current_tags = list(instance.tags or [])
+            return self._tag_resource(
+                endpoint, url_prefix, microver, instance, current_tags)
+
+        results = []
+        errors = []
+        for outcome in run_all(tag, instances,
+                               workers=self.params['parallelism']):
+            instance = outcome.item
+            result = dict(id=instance.id,
+                          name=getattr(instance, 'name', None),
+                          changed=False)
+            if outcome.error is not None:
+                result['error'] = str(outcome.error)
+                errors.append('%s: %s' % (instance.id, outcome.error))
             else:
-                self.fail_json(
-                    msg='API returned something bad %s' % response.reason)
-        return result
-
-    def set_tags(self, url_prefix, microver, instance, tags):
-        """Set tag on a server one by one"""
-        try:
-            for tag in tags:
-                instance.add_tag(self.conn, tag)
-        except AttributeError:
-            # Try a low-level access if SDK version is old
-            for tag in tags:
-                response = self.conn.put(
-                    self._get_tag_url(url_prefix, instance, tag),
-                    microversion=microver)
-                if response.status_code not in [201, 204]:
-                    self.fail_json(
-                        msg='API returned something bad %s' % response.reason)
-        return self.fetch_tags(url_prefix, microver, instance)
-
-    def delete_tags(self, url_prefix, microver, instance, tags):
-        """Set tag on a resource one by one"""
-        try:
-            for tag in tags:
-                instance.remove_tag(self.conn, tag)
-        except AttributeError:
-            # Try a low-level access if SDK version is old
-            for tag in tags:
-                response = self.conn.delete(
-                    self._get_tag_url(url_prefix, instance, tag),
-                    microversion=microver)
-                if response.status_code not in [204, 404]:
-                    self.fail_json(
-                        msg='API returned something bad %s' % response.reason)
-        return self.fetch_tags(url_prefix, microver, instance)
+                result['changed'], result['tags'] = outcome.result
+            results.append(result)
+
+        changed = any(result['changed'] for result in results)
+        if errors:
+            self.fail_json(
+                msg='Failed to tag %d of %d resources: %s' % (
+                    len(errors), len(results), '; '.join(errors)),
+                changed=changed, resources=results,
+                api_calls=self.api_calls)
+        self.exit_json(changed=changed, resources=results,
+                       api_calls=self.api_calls)
 
     def run(self):
         server = self.params['server']
@@ -258,12 +470,13 @@ class TagModule(OTCModule):
         security_group = self.params['security_group']
         subnet = self.params['subnet']
         trunk = self.params['trunk']
-        state = self.params['state']
-        new_tags = self.params['tags'] or []
-        mode = self.params['mode']
-        changed = False
         resource = None
         microver = None
+        self.api_calls = 0
+        self._lock = threading.Lock()
+
+        if self.params['resource_type']:
+            self.run_many()
 
         if server:
             instance = self.conn.get_server(server)
@@ -314,46 +527,16 @@ class TagModule(OTCModule):
         else:
             self.fail_json(msg='Any of the supported should be given')
 
-        tags = []
-
         if instance:
-            current_tags = self.fetch_tags(
-                self, endpoint, url_prefix, microver, instance)
-            if state == 'present':
-                if mode == 'replace' and set(current_tags) != set(new_tags):
-                    # Any of the tags mismatch
-                    changed = True
-                elif mode == 'set' and any(
-                        x not in current_tags for x in new_tags):
-                    # At least one tag should be set
-                    changed = True
-            elif state == 'absent' and any(
-                    x in current_tags for x in new_tags):
-                # At least one tag should be removed
-                changed = True
-
-            if self.ansible.check_mode or not changed:
-                self.exit_json(
-                    changed=changed,
-                    tags=new_tags)
-
-            if state == 'present':
-                if mode == 'replace':
-                    tags = self.replace_tags(
-                        self, endpoint, url_prefix, microver,
-                        instance, new_tags)
-                elif mode == 'set':
-                    tags = self.set_tags(
-                        self, endpoint, url_prefix, microver,
-                        instance, new_tags)
-            elif state == 'absent':
-                tags = self.delete_tags(
-                    self, endpoint, url_prefix, microver,
-                    instance, new_tags)
-
+            try:
+                changed, tags = self._tag_resource(
+                    endpoint, url_prefix, microver, instance)
+            except TagError as e:
+                self.fail_json(msg=str(e), api_calls=self.api_calls)
             self.exit_json(
                 changed=changed,
-                tags=tags)
+                tags=tags,
+                api_calls=self.api_calls)
         else:
             self.fail_json(msg='Instance %s can not be found' % resource)
 
@@ -15,7 +15,9 @@ DOCUMENTATION = '''
 ---
 module: volume_backup_info
 short_description: Get Backups
-extends_documentation_fragment: opentelekomcloud.cloud.otc
+extends_documentation_fragment:
+  - opentelekomcloud.cloud.otc
+  - opentelekomcloud.cloud.otc.info
 version_added: "0.0.3"
 author: "Vladimir Hasko (@vladimirhasko)"
 description:
@@ -61,6 +63,9 @@ from ansible_collections.opentelekomcloud.cloud.plugins.module_utils.otc import
 
 
 class VolumeBackupInfoModule(OTCModule):
+    info_module = True
+    marker_paging = True
+
     argument_spec = dict(
         name=dict(required=False),
         volume=dict(required=False)
@@ -73,7 +78,7 @@ class VolumeBackupInfoModule(OTCModule):
         name_filter = self.params['name']
         volume = self.params['volume']
 
-        data = []
+        data = self.result_list()
         attrs = {}
 
         if name_filter:
@@ -81,9 +86,8 @@ class VolumeBackupInfoModule(OTCModule):
         if volume:
             attrs['volume_id'] = self.conn.block_storage.find_volume(volume)
 
-        for raw in self.conn.block_storage.backups(**attrs):
-            dt = raw.to_dict()
-            dt.pop('location')
+        for raw in self.paged(self.conn.block_storage.backups, **attrs):
+            dt = self.project(raw)
             data.append(dt)
 
         self.exit_json(
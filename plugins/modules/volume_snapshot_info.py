@@ -15,7 +15,9 @@ DOCUMENTATION = '''
 ---
 module: volume_snapshot_info
 short_description: Get information about volume snapshots
-extends_documentation_fragment: opentelekomcloud.cloud.otc
+extends_documentation_fragment:
+  - opentelekomcloud.cloud.otc
+  - opentelekomcloud.cloud.otc.info
 version_added: "0.0.3"
 author: "Anton Sidelnikov (@anton-sidelnikov)"
 description:
@@ -93,6 +95,9 @@ from ansible_collections.opentelekomcloud.cloud.plugins.module_utils.otc import
 
 
 class VolumeSnapshotInfoModule(OTCModule):
+    info_module = True
+    marker_paging = True
+
     argument_spec = dict(
         details=dict(default=True, type='bool'),
         name=dict(required=False),
@@ -112,7 +117,7 @@ class VolumeSnapshotInfoModule(OTCModule):
         volume_filter = self.params['volume']
         status_filter = self.params['status']
 
-        data = []
+        data = self.result_list()
         query = {}
         if details_filter:
             query['details'] = details_filter
@@ -123,9 +128,8 @@ class VolumeSnapshotInfoModule(OTCModule):
         if status_filter:
             query['status'] = status_filter.lower()
 
-        for raw in self.conn.block_storage.snapshots(**query):
-            dt = raw.to_dict()
-            dt.pop('location')
+        for raw in self.paged(self.conn.block_storage.snapshots, **query):
+            dt = self.project(raw)
             data.append(dt)
 
         self.exit_json(
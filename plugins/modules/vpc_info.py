@@ -15,7 +15,9 @@ DOCUMENTATION = '''
 ---
 module: vpc_info
 short_description: Get vpc info from OpenTelekomCloud
-extends_documentation_fragment: opentelekomcloud.cloud.otc
+extends_documentation_fragment:
+  - opentelekomcloud.cloud.otc
+  - opentelekomcloud.cloud.otc.info
 version_added: "0.11.1"
 author: "Polina Gubina(@polina-gubina)"
 description:
@@ -73,6 +75,9 @@ from ansible_collections.opentelekomcloud.cloud.plugins.module_utils.otc import
 
 
 class VpcInfoModule(OTCModule):
+    info_module = True
+    marker_paging = True
+
     argument_spec = dict(
         name_or_id=dict(required=False)
     )
@@ -82,17 +87,15 @@ class VpcInfoModule(OTCModule):
     )
 
     def run(self):
-        data = []
+        data = self.result_list()
 
         if self.params['name_or_id']:
             raw = self.conn.vpc.find_vpc(name_or_id=self.params['name_or_id'])
-            dt = raw.to_dict()
-            dt.pop('location')
+            dt = self.project(raw)
             data.append(dt)
         else:
-            for raw in self.conn.vpc.vpcs():
-                dt = raw.to_dict()
-                dt.pop('location')
+            for raw in self.paged(self.conn.vpc.vpcs):
+                dt = self.project(raw)
                 data.append(dt)
 
         self.exit_json(
@@ -15,7 +15,9 @@ DOCUMENTATION = '''
 ---
 module: vpc_peering_info
 short_description: Get information about vpc peerings
-extends_documentation_fragment: opentelekomcloud.cloud.otc
+extends_documentation_fragment:
+  - opentelekomcloud.cloud.otc
+  - opentelekomcloud.cloud.otc.info
 version_added: "0.0.4"
 author: "Polina Gubina (@polina-gubina)"
 description:
@@ -95,6 +97,9 @@ from ansible_collections.opentelekomcloud.cloud.plugins.module_utils.otc import
 
 
 class VPCPeeringInfoModule(OTCModule):
+    info_module = True
+    marker_paging = True
+
     argument_spec = dict(
         name=dict(required=False),
         status=dict(required=False, choices=['pending_acceptance', 'rejected', 'expired', 'deleted', 'active']),
@@ -112,7 +117,7 @@ class VPCPeeringInfoModule(OTCModule):
         project_id_filter = self.params['project_id']
         router = self.params['router']
 
-        data = []
+        data = self.result_list()
         query = {}
         if name_filter:
             query['name'] = name_filter
@@ -124,9 +129,8 @@ class VPCPeeringInfoModule(OTCModule):
             router_obj = self.conn.network.find_router(router)
             query['vpc_id'] = router_obj['id']
 
-        for raw in self.conn.vpc.peerings(**query):
-            dt = raw.to_dict()
-            dt.pop('location')
+        for raw in self.paged(self.conn.vpc.peerings, **query):
+            dt = self.project(raw)
             data.append(dt)
 
         self.exit_json(
@@ -15,7 +15,9 @@ DOCUMENTATION = '''
 ---
 module: vpc_route_info
 short_description: Get information about vpc routes info
-extends_documentation_fragment: opentelekomcloud.cloud.otc
+extends_documentation_fragment:
+  - opentelekomcloud.cloud.otc
+  - opentelekomcloud.cloud.otc.info
 version_added: "0.2.0"
 author: "Polina Gubina (@polina-gubina)"
 description:
@@ -89,6 +91,9 @@ from ansible_collections.opentelekomcloud.cloud.plugins.module_utils.otc import
 
 
 class VPCRouteInfoModule(OTCModule):
+    info_module = True
+    marker_paging = True
+
     argument_spec = dict(
         id=dict(required=False),
         project_id=dict(required=False),
@@ -108,7 +113,7 @@ class VPCRouteInfoModule(OTCModule):
         destination_filter = self.params['destination']
         type_filter = self.params['type']
 
-        data = []
+        data = self.result_list()
         query = {}
         if id_filter:
             query['id'] = id_filter
@@ -123,9 +128,8 @@ class VPCRouteInfoModule(OTCModule):
         if type_filter:
             query['type'] = type_filter
 
-        for raw in self.conn.vpc.routes(**query):
-            dt = raw.to_dict()
-            dt.pop('location')
+        for raw in self.paged(self.conn.vpc.routes, **query):
+            dt = self.project(raw)
             data.append(dt)
 
         self.exit_json(
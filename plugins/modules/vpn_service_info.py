@@ -15,7 +15,9 @@ DOCUMENTATION = '''
 ---
 module: vpn_service_info
 short_description: Query VPN services.
-extends_documentation_fragment: opentelekomcloud.cloud.otc
+extends_documentation_fragment:
+  - opentelekomcloud.cloud.otc
+  - opentelekomcloud.cloud.otc.info
 version_added: "0.5.0"
 author: "Irina Pereiaslavskaia (@irina-pereiaslavskaia)"
 description:
@@ -120,6 +122,9 @@ from ansible_collections.opentelekomcloud.cloud.plugins.module_utils.otc import
 
 
 class VpnServicesInfoModule(OTCModule):
+    info_module = True
+    marker_paging = True
+
     argument_spec = dict(
         admin_state_up=dict(type='bool', required=False),
         description=dict(type='str', required=False),
@@ -150,7 +155,7 @@ class VpnServicesInfoModule(OTCModule):
         project_id = self.params['project_id']
         vpn_service = self.params['vpn_service']
 
-        data = []
+        data = self.result_list()
         query = {}
         if vpn_service:
             vpn = self.conn.network.find_vpn_service(name_or_id=vpn_service)
@@ -189,9 +194,8 @@ class VpnServicesInfoModule(OTCModule):
         if status:
             query['status'] = status.upper()
 
-        for raw in self.conn.network.vpn_services(**query):
-            dt = raw.to_dict()
-            dt.pop('location')
+        for raw in self.paged(self.conn.network.vpn_services, **query):
+            dt = self.project(raw)
             data.append(dt)
 
         self.exit(
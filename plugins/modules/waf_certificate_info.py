@@ -15,7 +15,9 @@ DOCUMENTATION = '''
 ---
 module: waf_certificate_info
 short_description: Get WAF certificate info
-extends_documentation_fragment: opentelekomcloud.cloud.otc
+extends_documentation_fragment:
+  - opentelekomcloud.cloud.otc
+  - opentelekomcloud.cloud.otc.info
 version_added: "0.0.3"
 author: "Artem Goncharov (@gtema)"
 description:
@@ -60,6 +62,8 @@ from ansible_collections.opentelekomcloud.cloud.plugins.module_utils.otc import
 
 
 class WafCertificateInfoModule(OTCModule):
+    info_module = True
+
     argument_spec = dict(
         name=dict(required=False),
     )
@@ -71,19 +75,17 @@ class WafCertificateInfoModule(OTCModule):
 
     def run(self):
 
-        data = []
+        data = self.result_list()
 
         if self.params['name']:
             raw = self.conn.waf.find_certificate(
                 self.params['name'], ignore_missing=True)
             if raw:
-                dt = raw.to_dict()
-                dt.pop('location')
+                dt = self.project(raw)
                 data.append(dt)
         else:
-            for raw in self.conn.waf.certificates():
-                dt = raw.to_dict()
-                dt.pop('location')
+            for raw in self.paged(self.conn.waf.certificates):
+                dt = self.project(raw)
                 data.append(dt)
 
         self.exit(
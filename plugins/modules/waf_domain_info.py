@@ -15,7 +15,9 @@ DOCUMENTATION = '''
 ---
 module: waf_domain_info
 short_description: Get WAF domain info
-extends_documentation_fragment: opentelekomcloud.cloud.otc
+extends_documentation_fragment:
+  - opentelekomcloud.cloud.otc
+  - opentelekomcloud.cloud.otc.info
 version_added: "0.0.3"
 author: "Anton Sidelnikov (@anton-sidelnikov)"
 description:
@@ -80,6 +82,8 @@ from ansible_collections.opentelekomcloud.cloud.plugins.module_utils.otc import
 
 
 class WafDomainInfoModule(OTCModule):
+    info_module = True
+
     argument_spec = dict(
         name=dict(required=False)
     )
@@ -90,20 +94,18 @@ class WafDomainInfoModule(OTCModule):
     otce_min_version = '0.9.0'
 
     def run(self):
-        data = []
+        data = self.result_list()
 
         if self.params['name']:
             raw = self.conn.waf.find_domain(name_or_id=self.params['name'], ignore_missing=True)
             if raw:
                 if not raw.server:
                     raw = self.conn.waf.get_domain(raw.id)
-                dt = raw.to_dict()
-                dt.pop('location')
+                dt = self.project(raw)
                 data.append(dt)
         else:
-            for raw in self.conn.waf.domains():
-                dt = raw.to_dict()
-                dt.pop('location')
+            for raw in self.paged(self.conn.waf.domains):
+                dt = self.project(raw)
                 data.append(dt)
 
         self.exit(
@@ -0,0 +1,138 @@
+import json
+import os
+import shutil
+import tempfile
+import threading
+import time
+
+from types import SimpleNamespace
+from unittest import TestCase
+
+from ansible_collections.opentelekomcloud.cloud.plugins.module_utils import auth_cache
+
+
+class FakeAuthRef:
+
+    def __init__(self, expires):
+        self.expires = expires
+
+    def will_expire_soon(self, margin):
+        return time.time() + margin >= self.expires
+
+
+class FakeAuth:
+    """keystoneauth plugin keeping the token as JSON auth state."""
+
+    def __init__(self):
+        self.auth_ref = None
+        self.token = None
+
+    def get_cache_id(self):
+        return 'user@project'
+
+    def get_auth_state(self):
+        if self.auth_ref is None:
+            return None
+        return json.dumps(dict(token=self.token, expires=self.auth_ref.expires))
+
+    def set_auth_state(self, state):
+        if state is None:
+            self.auth_ref = self.token = None
+            return
+        state = json.loads(state)
+        self.token = state['token']
+        self.auth_ref = FakeAuthRef(state['expires'])
+
+
+class FakeConnection:
+
+    def __init__(self, lifetime=3600):
+        self.lifetime = lifetime
+        self.authorized = 0
+        self.config = SimpleNamespace(name='otc', region_name='eu-de',
+                                      config=dict(interface='public'))
+        self.session = SimpleNamespace(auth=FakeAuth())
+
+    def authorize(self):
+        self.authorized += 1
+        auth = self.session.auth
+        auth.token = 'token-%d' % id(self)
+        auth.auth_ref = FakeAuthRef(time.time() + self.lifetime)
+
+
+class AuthCacheTest(TestCase):
+
+    def setUp(self):
+        self.path = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.path)
+        self.key_file = os.path.join(self.path, 'config', 'key')
+
+    def _cache(self, **kwargs):
+        return auth_cache.AuthCache(
+            path=os.path.join(self.path, 'cache'), key_file=self.key_file,
+            **kwargs)
+
+    def test_round_trip(self):
+        first = FakeConnection()
+        self.assertEqual('miss', self._cache().load(first))
+        self.assertEqual(1, first.authorized)
+
+        second = FakeConnection()
+        self.assertEqual('hit', self._cache().load(second))
+        self.assertEqual(0, second.authorized)
+        self.assertEqual(first.session.auth.token, second.session.auth.token)
+        # The generated key is not stored with the entries
+        self.assertTrue(os.path.exists(self.key_file))
+        self.assertNotIn('.key', os.listdir(os.path.join(self.path, 'cache')))
+
+    def test_passphrase(self):
+        self._cache(key='secret').load(FakeConnection())
+        self.assertEqual('hit', self._cache(key='secret').load(
+            FakeConnection()))
+        self.assertEqual('miss', self._cache(key='other').load(
+            FakeConnection()))
+
+    def test_expiring_token_is_not_reused(self):
+        self._cache().load(FakeConnection(lifetime=100))
+        conn = FakeConnection()
+        self.assertEqual('miss', self._cache().load(conn))
+        self.assertEqual(1, conn.authorized)
+
+    def test_corrupt_entry_is_a_miss(self):
+        cache = self._cache()
+        cache.load(FakeConnection())
+        with open(cache._entry, 'wb') as f:
+            f.write(b'garbage')
+        conn = FakeConnection()
+        self.assertEqual('miss', self._cache().load(conn))
+        self.assertEqual(1, conn.authorized)
+
+    def test_corrupt_key_file_raises_value_error(self):
+        os.makedirs(os.path.dirname(self.key_file))
+        with open(self.key_file, 'wb') as f:
+            f.write(b'short')
+        self.assertRaises(ValueError, self._cache().load, FakeConnection())
+
+    def test_invalidate(self):
+        cache = self._cache()
+        cache.load(FakeConnection())
+        cache.invalidate()
+        self.assertEqual('miss', self._cache().load(FakeConnection()))
+
+    def test_concurrent_key_creation(self):
+        keys = []
+        barrier = threading.Barrier(8)
+
+        def create():
+            barrier.wait()
+            keys.append(self._cache()._generated_key())
+
+        threads = [threading.Thread(target=create) for i in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.assertEqual(8, len(keys))
+        self.assertEqual(1, len(set(keys)))
+        self.assertEqual(auth_cache.KEY_SIZE, len(keys[0]))
+        self.assertEqual(['key'], os.listdir(os.path.dirname(self.key_file)))
@@ -0,0 +1,241 @@
+import json
+import os
+import shutil
+import socket
+import tempfile
+import threading
+import time
+
+from http.server import BaseHTTPRequestHandler, HTTPServer
+from socketserver import ThreadingMixIn
+from unittest import TestCase
+from unittest import mock
+
+import requests
+
+from ansible_collections.opentelekomcloud.cloud.plugins.module_utils import (
+    broker
+)
+
+
+class FakeOTCHandler(BaseHTTPRequestHandler):
+    """Fake OTC endpoint echoing the request as JSON"""
+
+    protocol_version = 'HTTP/1.1'
+
+    def setup(self):
+        BaseHTTPRequestHandler.setup(self)
+        self.server.connections += 1
+
+    def _answer(self):
+        length = int(self.headers.get('Content-Length') or 0)
+        body = json.dumps({
+            'method': self.command,
+            'path': self.path,
+            'body': self.rfile.read(length).decode('utf-8'),
+            'token': self.headers.get('X-Auth-Token'),
+            'cookie': self.headers.get('Cookie'),
+        }).encode('utf-8')
+        self.send_response(401 if self.path == '/unauthorized' else 200)
+        if self.path == '/login':
+            self.send_header('Set-Cookie', 'session=tenant-a; Path=/')
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    do_GET = do_POST = do_PUT = do_DELETE = _answer
+
+    def log_message(self, *args):
+        pass
+
+
+class FakeOTCServer(ThreadingMixIn, HTTPServer):
+    daemon_threads = True
+    connections = 0
+
+
+class DyingBroker:
+    """Broker reading every message and closing without an answer"""
+
+    def __init__(self, path):
+        self.messages = []
+        self.sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        self.sock.bind(path)
+        self.sock.listen(8)
+        threading.Thread(target=self._serve, daemon=True).start()
+
+    def _serve(self):
+        while True:
+            try:
+                conn, _ = self.sock.accept()
+            except OSError:
+                return
+            with conn:
+                self.messages.append(broker._recv(conn))
+
+    def close(self):
+        self.sock.close()
+
+
+class BrokerTest(TestCase):
+
+    def setUp(self):
+        self.endpoint = FakeOTCServer(('127.0.0.1', 0), FakeOTCHandler)
+        threading.Thread(target=self.endpoint.serve_forever,
+                         daemon=True).start()
+        self.addCleanup(self.endpoint.server_close)
+        self.addCleanup(self.endpoint.shutdown)
+        self.url = 'http://127.0.0.1:%d' % self.endpoint.server_address[1]
+
+        self.tmp = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.tmp)
+        self.path = os.path.join(self.tmp, 'broker.sock')
+
+    def start_broker(self, idle_timeout=60):
+        server = broker.BrokerServer(self.path, idle_timeout)
+        thread = threading.Thread(target=server.serve, daemon=True)
+        thread.start()
+        self.addCleanup(server.shutdown)
+        return server, thread
+
+    def session(self):
+        client = broker.BrokerClient(self.path)
+        session = requests.Session()
+        adapter = broker.BrokerAdapter(client)
+        session.mount('http://', adapter)
+        self.addCleanup(adapter.close)
+        return session
+
+    def test_requests_are_forwarded(self):
+        self.start_broker()
+        response = self.session().post(
+            self.url + '/v1/servers', json={'name': 'test'},
+            headers={'X-Auth-Token': 'token'})
+        self.assertEqual(200, response.status_code)
+        self.assertEqual({
+            'method': 'POST',
+            'path': '/v1/servers',
+            'body': '{"name": "test"}',
+            'token': 'token',
+            'cookie': None,
+        }, response.json())
+
+    def test_connections_are_shared_between_tasks(self):
+        self.start_broker()
+        for _ in range(3):
+            # Every task has its own client and session
+            session = self.session()
+            for _ in range(5):
+                self.assertEqual(
+                    200, session.get(self.url + '/v1/vpcs').status_code)
+        self.assertEqual(1, self.endpoint.connections)
+
+    def test_cookies_are_not_shared(self):
+        self.start_broker()
+        self.assertEqual(200, self.session().get(self.url + '/login')
+                         .status_code)
+        response = self.session().get(self.url + '/v1/vpcs')
+        self.assertIsNone(response.json()['cookie'])
+
+    def test_unexpected_error_is_answered(self):
+        self.start_broker()
+        client = broker.BrokerClient(self.path)
+        answer = client.call('request', method='GET')
+        self.assertEqual('BrokerError', answer['error'])
+        self.assertIn('KeyError', answer['msg'])
+        # The connection is still usable
+        self.assertEqual(os.getpid(), client.call('ping')['pid'])
+        client.close()
+
+    def test_error_status_is_returned(self):
+        self.start_broker()
+        response = self.session().get(self.url + '/unauthorized')
+        self.assertEqual(401, response.status_code)
+
+    def test_connection_errors_are_raised(self):
+        self.start_broker()
+        with self.assertRaises(requests.exceptions.ConnectionError):
+            self.session().get('http://127.0.0.1:1/')
+
+    def dying_broker(self):
+        dying = DyingBroker(self.path)
+        self.addCleanup(dying.close)
+        return dying
+
+    def test_sent_request_is_not_repeated(self):
+        dying = self.dying_broker()
+        with self.assertRaises(requests.exceptions.ConnectionError):
+            self.session().post(self.url + '/v1/servers', json={})
+        self.assertEqual(['POST'], [m['method'] for m in dying.messages])
+        self.assertEqual(0, self.endpoint.connections)
+
+    def test_idempotent_request_is_repeated(self):
+        dying = self.dying_broker()
+        response = self.session().get(self.url + '/v1/vpcs')
+        self.assertEqual(200, response.status_code)
+        self.assertEqual(['GET', 'GET'],
+                         [m['method'] for m in dying.messages])
+
+    def test_streamed_request_is_sent_directly(self):
+        dying = self.dying_broker()
+        response = self.session().get(self.url + '/v1/vpcs', stream=True)
+        self.assertEqual('GET', response.json()['method'])
+        response = self.session().put(self.url + '/v1/objects',
+                                      data=memoryview(b'data'))
+        self.assertEqual('data', response.json()['body'])
+        self.assertEqual([], dying.messages)
+
+    def test_direct_request_without_broker(self):
+        response = self.session().get(self.url + '/v1/vpcs')
+        self.assertEqual(200, response.status_code)
+
+    def test_auth_state_is_shared(self):
+        self.start_broker()
+        first = broker.BrokerClient(self.path)
+        second = broker.BrokerClient(self.path)
+        first.call('acquire', id='cloud')
+        first.call('put_auth', id='cloud', state='state')
+        first.call('release', id='cloud')
+        self.assertEqual(
+            'state', second.call('get_auth', id='cloud')['state'])
+        second.call('put_auth', id='cloud', state=None)
+        self.assertIsNone(first.call('get_auth', id='cloud')['state'])
+
+    def test_lock_released_when_client_disconnects(self):
+        self.start_broker()
+        first = broker.BrokerClient(self.path)
+        first.call('acquire', id='cloud')
+        first.close()
+        second = broker.BrokerClient(self.path)
+        second.call('acquire', id='cloud')
+        second.call('release', id='cloud')
+
+    @mock.patch.object(broker, 'LOCK_TIMEOUT', 0.1)
+    def test_lock_acquire_times_out(self):
+        self.start_broker()
+        first = broker.BrokerClient(self.path)
+        first.call('acquire', id='cloud')
+        cache = broker.BrokerAuthCache(broker.BrokerClient(self.path))
+        cache._entry = 'cloud'
+        with self.assertRaises(broker.BrokerError):
+            with cache._locked():
+                pass
+        first.call('release', id='cloud')
+
+    def test_stops_when_idle(self):
+        server, thread = self.start_broker(idle_timeout=0.2)
+        thread.join(5)
+        self.assertFalse(thread.is_alive())
+        self.assertFalse(os.path.exists(self.path))
+
+    def test_ensure_running_spawns_broker(self):
+        client = broker.BrokerClient(self.path, idle_timeout=1)
+        client.ensure_running()
+        pid = client.call('ping')['pid']
+        self.assertNotEqual(os.getpid(), pid)
+        client.close()
+        deadline = time.monotonic() + 10
+        while os.path.exists(self.path) and time.monotonic() < deadline:
+            time.sleep(0.1)
+        self.assertFalse(os.path.exists(self.path))
@@ -0,0 +1,135 @@
+import shutil
+import tempfile
+
+from unittest import TestCase
+
+from ansible_collections.opentelekomcloud.cloud.plugins.module_utils import ces
+
+DAY = 86400 * 1000
+
+
+class SplitRangeTest(TestCase):
+
+    def test_windows_cover_range(self):
+        windows = ces.split_range(0, 30 * DAY, 300)
+        # 3000 points of 5 minutes are a little more than 10 days
+        self.assertEqual(3, len(windows))
+        self.assertEqual(0, windows[0][0])
+        self.assertEqual(30 * DAY, windows[-1][1])
+        for previous, window in zip(windows, windows[1:]):
+            self.assertEqual(previous[1], window[0])
+
+    def test_short_range_is_one_window(self):
+        self.assertEqual([(5, 10)], ces.split_range(5, 10, 1))
+
+    def test_window(self):
+        self.assertEqual(30, len(ces.split_range(0, 30 * DAY, 300,
+                                                 window=86400)))
+
+
+class MergeTest(TestCase):
+
+    def test_merge_dedupes_in_time_order(self):
+        first = [{'timestamp': 1, 'average': 1}, {'timestamp': 2, 'average': 2}]
+        second = [{'timestamp': 2, 'average': 2}, {'timestamp': 3, 'average': 3}]
+        self.assertEqual(
+            [1, 2, 3],
+            [p['timestamp'] for p in ces.merge_datapoints(second, first)])
+
+
+class RollupTest(TestCase):
+
+    def test_whole_range(self):
+        points = [{'timestamp': i, 'average': float(i)} for i in range(1, 101)]
+        self.assertEqual(
+            [dict(timestamp=1, count=100, min=1.0, max=100.0, avg=50.5,
+                  p95=95.0)],
+            ces.rollup(points, 'average', ces.ROLLUPS))
+
+    def test_intervals(self):
+        points = [{'timestamp': i * 1000, 'max': i} for i in range(10)]
+        result = ces.rollup(points, 'max', ['max'], interval=5, time_from=0)
+        self.assertEqual([dict(timestamp=0, count=5, max=4),
+                          dict(timestamp=5000, count=5, max=9)], result)
+
+    def test_sdk_value_names(self):
+        points = [{'timestamp': 0, 'maximum': 3, 'max': None}]
+        self.assertEqual(3, ces.rollup(points, 'max', ['min'])[0]['min'])
+
+
+class MetricCacheTest(TestCase):
+
+    def setUp(self):
+        self.path = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.path)
+        self.now = 10 * DAY
+        self.cache = ces.MetricCache(self.path, ttl=86400,
+                                     now=lambda: self.now)
+
+    def _points(self, timestamps):
+        return [{'timestamp': ts, 'average': ts / 1000.0, 'unit': '%'}
+                for ts in timestamps]
+
+    def test_round_trip(self):
+        series = self.cache.load('key')
+        self.assertEqual([(9 * DAY, 10 * DAY)],
+                         series.missing(9 * DAY, 10 * DAY))
+        series.update({'metric_name': 'cpu_util'},
+                      self._points([9 * DAY, 9 * DAY + 60000]),
+                      'average', 9 * DAY, 10 * DAY)
+        self.cache.save('key', series)
+
+        loaded = self.cache.load('key')
+        self.assertEqual({'metric_name': 'cpu_util'}, loaded.metric)
+        self.assertEqual(self._points([9 * DAY, 9 * DAY + 60000]),
+                         loaded.datapoints(9 * DAY, 10 * DAY))
+        self.assertEqual(0, len(self.cache.load('other')))
+
+    def test_missing_starts_at_high_water_mark(self):
+        series = ces.CachedSeries()
+        series.update(None, self._points([5000, 6000]), 'average', 1000,
+                      6000)
+        self.assertEqual([(6000, 9000)], series.missing(2000, 9000))
+        self.assertEqual([(0, 1000), (6000, 9000)], series.missing(0, 9000))
+        self.assertEqual([], series.missing(2000, 5000))
+
+    def test_disjoint_range_replaces_cached_range(self):
+        series = ces.CachedSeries()
+        series.update(None, self._points([1000, 1500, 2000]), 'average',
+                      1000, 2000)
+        self.assertEqual([(5000, 6000)], series.missing(5000, 6000))
+        series.update(None, self._points([5000, 5500, 6000]), 'average',
+                      5000, 6000)
+        # The gap from 2000 to 5000 has never been fetched
+        self.assertEqual([(1000, 5000)], series.missing(1000, 6000))
+        self.assertEqual([5000, 5500, 6000], list(series.timestamps))
+
+        series.update(None, self._points([1000, 2000, 3000, 4000, 5000]),
+                      'average', 1000, 5000)
+        self.assertEqual([], series.missing(1000, 6000))
+        self.assertEqual([1000, 2000, 3000, 4000, 5000, 5500, 6000],
+                         list(series.timestamps))
+
+    def test_range_before_cached_range_replaces_it(self):
+        series = ces.CachedSeries()
+        series.update(None, self._points([5000, 6000]), 'average', 5000,
+                      6000)
+        series.update(None, self._points([1000, 2000]), 'average', 1000,
+                      2000)
+        self.assertEqual([(2000, 6000)], series.missing(1000, 6000))
+
+    def test_update_replaces_newest_point(self):
+        series = ces.CachedSeries()
+        series.update(None, self._points([1000, 2000]), 'average', 0, 2000)
+        series.update(None, [{'timestamp': 2000, 'average': 7}], 'average',
+                      2000, 3000)
+        self.assertEqual([1.0, 7.0], list(series.values))
+
+    def test_ttl_evicts_old_points(self):
+        series = ces.CachedSeries()
+        series.update(None, self._points([8 * DAY, 9 * DAY + 1000]),
+                      'average', 8 * DAY, 9 * DAY + 1000)
+        self.cache.save('key', series)
+        loaded = self.cache.load('key')
+        self.assertEqual([9 * DAY + 1000], list(loaded.timestamps))
+        self.assertEqual(9 * DAY, loaded.start)
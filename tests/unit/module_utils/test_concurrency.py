@@ -0,0 +1,75 @@
+import threading
+import time
+
+from unittest import TestCase
+
+from ansible_collections.opentelekomcloud.cloud.plugins.module_utils import (
+    concurrency
+)
+
+
+class RunAllTest(TestCase):
+
+    def test_outcomes_keep_order_and_errors(self):
+        def func(item):
+            if item == 2:
+                raise ValueError('broken')
+            return item * 10
+
+        outcomes = concurrency.run_all(func, [1, 2, 3], workers=3)
+        self.assertEqual([1, 2, 3], [o.item for o in outcomes])
+        self.assertEqual([10, None, 30], [o.result for o in outcomes])
+        self.assertIsInstance(outcomes[1].error, ValueError)
+
+    def test_workers_are_bounded(self):
+        lock = threading.Lock()
+        running = []
+        peak = []
+
+        def func(item):
+            with lock:
+                running.append(item)
+                peak.append(len(running))
+            threading.Event().wait(0.01)
+            with lock:
+                running.remove(item)
+
+        concurrency.run_all(func, range(10), workers=2)
+        self.assertEqual(2, max(peak))
+
+    def test_rate_is_limited(self):
+        start = time.monotonic()
+        concurrency.run_all(lambda item: item, range(5), workers=5, rate=50)
+        # 5 calls at 50 per second need at least 4 intervals of 20 ms
+        self.assertGreaterEqual(time.monotonic() - start, 0.08)
+
+
+class Conflict(Exception):
+    status_code = 409
+
+
+class RetryTest(TestCase):
+
+    def test_retries_conflicts_with_backoff(self):
+        calls = []
+        sleeps = []
+
+        def func():
+            calls.append(1)
+            if len(calls) < 3:
+                raise Conflict()
+            return 'done'
+
+        self.assertEqual('done', concurrency.retry(
+            func, concurrency.is_conflict, delay=1, backoff=2,
+            sleep=sleeps.append))
+        self.assertEqual(2, len(sleeps))
+        self.assertLess(sleeps[0], sleeps[1])
+
+    def test_other_errors_are_raised(self):
+        def func():
+            raise ValueError()
+
+        with self.assertRaises(ValueError):
+            concurrency.retry(func, concurrency.is_conflict,
+                              sleep=lambda s: None)
@@ -0,0 +1,59 @@
+import gzip
+import hashlib
+import json
+import os
+import shutil
+import tempfile
+
+from unittest import TestCase
+
+from ansible_collections.opentelekomcloud.cloud.plugins.module_utils.jsonlines import JsonLinesWriter
+
+
+class JsonLinesWriterTest(TestCase):
+
+    def setUp(self):
+        self.dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.dir)
+
+    def test_lines_and_checksum(self):
+        path = os.path.join(self.dir, 'out.jsonl')
+        writer = JsonLinesWriter(path)
+        writer.extend([{'id': 'a'}, {'id': 'b', 'size': 1}])
+        self.assertEqual(2, len(writer))
+        self.assertFalse(os.path.exists(path))
+        result = writer.close()
+
+        with open(path, 'rb') as fh:
+            content = fh.read()
+        self.assertEqual(
+            [{'id': 'a'}, {'id': 'b', 'size': 1}],
+            [json.loads(line) for line in content.splitlines()])
+        self.assertEqual(
+            dict(path=path, count=2,
+                 checksum='sha256:' + hashlib.sha256(content).hexdigest()),
+            result)
+
+    def test_gzip(self):
+        path = os.path.join(self.dir, 'out.jsonl.gz')
+        writer = JsonLinesWriter(path)
+        writer.append({'id': 'a'})
+        result = writer.close()
+
+        with open(path, 'rb') as fh:
+            content = fh.read()
+        self.assertEqual(b'{"id": "a"}\n', gzip.decompress(content))
+        self.assertEqual('sha256:' + hashlib.sha256(content).hexdigest(),
+                         result['checksum'])
+
+    def test_abort_keeps_existing_file(self):
+        path = os.path.join(self.dir, 'out.jsonl')
+        with open(path, 'w') as fh:
+            fh.write('old\n')
+        writer = JsonLinesWriter(path)
+        writer.append({'id': 'a'})
+        writer.abort()
+
+        self.assertEqual(['out.jsonl'], os.listdir(self.dir))
+        with open(path) as fh:
+            self.assertEqual('old\n', fh.read())
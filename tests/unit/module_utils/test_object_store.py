@@ -0,0 +1,242 @@
+import hashlib
+import json
+import os
+import shutil
+import tempfile
+
+from unittest import TestCase
+from urllib.parse import unquote
+
+from ansible_collections.opentelekomcloud.cloud.plugins.module_utils import object_store
+
+
+class FakeResponse:
+
+    def __init__(self, status_code, body=b'', headers=None):
+        self.status_code = status_code
+        self.content = body
+        self.text = body.decode('utf-8', 'replace')
+        self.headers = headers or {}
+
+    def json(self):
+        return json.loads(self.content)
+
+    def iter_content(self, chunk_size):
+        for i in range(0, len(self.content), chunk_size):
+            yield self.content[i:i + chunk_size]
+
+
+class FakeSwift:
+    """Swift stand-in keeping containers, objects and SLO manifests."""
+
+    def __init__(self):
+        self.containers = {}
+        self.manifests = {}
+        self.calls = []
+        self.fail = set()
+
+    def _parse(self, path):
+        container, _, name = path.lstrip('/').partition('/')
+        return unquote(container), unquote(name)
+
+    def _content(self, container, name):
+        if (container, name) in self.manifests:
+            return b''.join(
+                self.containers[c][n]
+                for c, n in self.manifests[(container, name)])
+        return self.containers[container][name]
+
+    def _etag(self, container, name):
+        if (container, name) in self.manifests:
+            return object_store.slo_etag([
+                hashlib.md5(self.containers[c][n]).hexdigest()
+                for c, n in self.manifests[(container, name)]])
+        return hashlib.md5(self.containers[container][name]).hexdigest()
+
+    def _exists(self, container, name):
+        return name in self.containers.get(container, {})
+
+    def head(self, path, raise_exc=True):
+        container, name = self._parse(path)
+        self.calls.append(('HEAD', name))
+        if not self._exists(container, name):
+            return FakeResponse(404)
+        headers = {
+            'Content-Length': str(len(self._content(container, name))),
+            'Etag': '"%s"' % self._etag(container, name)}
+        if (container, name) in self.manifests:
+            headers['X-Static-Large-Object'] = 'True'
+        return FakeResponse(200, headers=headers)
+
+    def get(self, path, raise_exc=True, params=None, headers=None,
+            stream=False):
+        container, name = self._parse(path)
+        params = params or {}
+        self.calls.append(('GET', name))
+        if container not in self.containers:
+            return FakeResponse(404)
+        if not name:
+            names = sorted(n for n in self.containers[container]
+                           if n.startswith(params.get('prefix', ''))
+                           and n > params.get('marker', ''))[:2]
+            return FakeResponse(200, json.dumps([
+                dict(name=n, hash=self._etag(container, n)) for n in names
+            ]).encode())
+        if not self._exists(container, name):
+            return FakeResponse(404)
+        if params.get('multipart-manifest') == 'get':
+            return FakeResponse(200, json.dumps([
+                dict(name='/%s/%s' % (c, n),
+                     hash=hashlib.md5(self.containers[c][n]).hexdigest(),
+                     bytes=len(self.containers[c][n]))
+                for c, n in self.manifests[(container, name)]]).encode())
+        content = self._content(container, name)
+        if headers and 'Range' in headers:
+            first, last = headers['Range'][len('bytes='):].split('-')
+            return FakeResponse(206, content[int(first):int(last) + 1])
+        return FakeResponse(200, content)
+
+    def put(self, path, raise_exc=True, params=None, data=None,
+            headers=None):
+        container, name = self._parse(path)
+        self.calls.append(('PUT', name))
+        if not name:
+            self.containers.setdefault(container, {})
+            return FakeResponse(201)
+        if container not in self.containers:
+            return FakeResponse(404)
+        if name in self.fail:
+            self.fail.discard(name)
+            return FakeResponse(503, b'Service Unavailable')
+        if (params or {}).get('multipart-manifest') == 'put':
+            segments = []
+            for segment in json.loads(data):
+                c, n = self._parse(segment['path'])
+                if self._etag(c, n) != segment['etag']:
+                    return FakeResponse(409)
+                segments.append((c, n))
+            self.containers[container][name] = b''
+            self.manifests[(container, name)] = segments
+            return FakeResponse(201)
+        data = bytes(data)
+        if hashlib.md5(data).hexdigest() != headers.get('ETag'):
+            return FakeResponse(422)
+        self.containers[container][name] = data
+        self.manifests.pop((container, name), None)
+        return FakeResponse(201)
+
+    def delete(self, path, raise_exc=True, params=None):
+        container, name = self._parse(path)
+        self.calls.append(('DELETE', name))
+        if not self._exists(container, name):
+            return FakeResponse(404)
+        if (params or {}).get('multipart-manifest') == 'delete':
+            for c, n in self.manifests.pop((container, name)):
+                del self.containers[c][n]
+        del self.containers[container][name]
+        return FakeResponse(204)
+
+
+class ObjectTransferTest(TestCase):
+
+    def setUp(self):
+        self.path = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.path)
+        self.swift = FakeSwift()
+
+    def _file(self, name, content):
+        path = os.path.join(self.path, name)
+        with open(path, 'wb') as f:
+            f.write(content)
+        return path
+
+    def _transfer(self):
+        return object_store.ObjectTransfer(
+            self.swift, 'bucket', 'dir/file.bin', segment_size=4, workers=2)
+
+    def test_segment_ranges(self):
+        self.assertEqual([(0, 0)], object_store.segment_ranges(0, 4))
+        self.assertEqual([(0, 4), (4, 4), (8, 2)],
+                         object_store.segment_ranges(10, 4))
+
+    def test_small_upload_is_skipped_when_equal(self):
+        src = self._file('src', b'abc')
+        self.assertTrue(self._transfer().upload(src))
+        self.assertEqual(b'abc', self.swift.containers['bucket']['dir/file.bin'])
+
+        transfer = self._transfer()
+        self.assertFalse(transfer.upload(src))
+        self.assertEqual(1, transfer.requests)
+
+    def test_empty_file(self):
+        src = self._file('src', b'')
+        self.assertTrue(self._transfer().upload(src))
+        self.assertFalse(self._transfer().upload(src))
+
+    def test_segmented_upload(self):
+        src = self._file('src', b'0123456789')
+        transfer = self._transfer()
+        self.assertTrue(transfer.upload(src))
+        self.assertEqual(3, transfer.segments)
+        self.assertEqual(10, transfer.transferred)
+        self.assertEqual(
+            b'0123456789', self.swift._content('bucket', 'dir/file.bin'))
+        self.assertFalse(self._transfer().upload(src))
+
+    def test_upload_compares_remote_segments(self):
+        src = self._file('src', b'0123456789')
+        self._transfer().upload(src)
+        transfer = object_store.ObjectTransfer(
+            self.swift, 'bucket', 'dir/file.bin', segment_size=3)
+        self.assertFalse(transfer.upload(src))
+        # HEAD and the manifest
+        self.assertEqual(2, transfer.requests)
+
+        self._file('src', b'0123456780')
+        self.assertTrue(transfer.upload(src))
+        self.assertEqual(
+            b'0123456780', self.swift._content('bucket', 'dir/file.bin'))
+
+    def test_upload_resumes_with_missing_segments(self):
+        src = self._file('src', b'0123456789')
+        self.swift.fail.add('dir/file.bin/slo/10/4/00000001')
+        self.assertRaises(object_store.TransferError,
+                          self._transfer().upload, src)
+
+        transfer = self._transfer()
+        self.assertTrue(transfer.upload(src))
+        self.assertEqual(2, transfer.reused)
+        self.assertEqual(4, transfer.transferred)
+
+    def test_upload_removes_segments_of_earlier_version(self):
+        self._transfer().upload(self._file('old', b'0123456789'))
+        self._transfer().upload(self._file('new', b'0123456789ab'))
+        self.assertEqual(
+            ['dir/file.bin/slo/12/4/%08d' % i for i in range(3)],
+            sorted(self.swift.containers['bucket_segments']))
+
+    def test_download(self):
+        self._transfer().upload(self._file('src', b'0123456789'))
+        dest = os.path.join(self.path, 'dest')
+        transfer = self._transfer()
+        self.assertTrue(transfer.download(dest))
+        self.assertEqual(10, transfer.transferred)
+        with open(dest, 'rb') as f:
+            self.assertEqual(b'0123456789', f.read())
+
+        self.assertFalse(self._transfer().download(dest))
+        self._file('dest', b'0123456780')
+        self.assertTrue(self._transfer().download(dest))
+        self.assertEqual([], [name for name in os.listdir(self.path)
+                              if name.endswith('.tmp')])
+
+    def test_download_missing_object(self):
+        self.assertRaises(object_store.TransferError,
+                          self._transfer().download,
+                          os.path.join(self.path, 'dest'))
+
+    def test_delete_removes_segments(self):
+        self._transfer().upload(self._file('src', b'0123456789'))
+        self.assertTrue(self._transfer().delete())
+        self.assertEqual({}, self.swift.containers['bucket_segments'])
+        self.assertFalse(self._transfer().delete())
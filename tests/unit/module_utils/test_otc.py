@@ -0,0 +1,132 @@
+import json
+import os
+
+from unittest import TestCase
+
+from openstack.image.v2 import image
+
+from ansible_collections.opentelekomcloud.cloud.plugins.module_utils.otc import OTCModule
+from ansible_collections.opentelekomcloud.cloud.plugins.module_utils.otc import project_resource
+
+FIXTURES = os.path.join(os.path.dirname(__file__), 'fixtures')
+
+
+def _images():
+    with open(os.path.join(FIXTURES, 'images.json')) as fh:
+        body = json.load(fh)
+    return [image.Image.existing(**raw) for raw in body['images']]
+
+
+class ProjectResourceTest(TestCase):
+
+    def test_default_is_to_dict_without_location(self):
+        img = _images()[0]
+        expected = img.to_dict()
+        expected.pop('location')
+        self.assertEqual(expected, project_resource(img))
+
+    def test_fields(self):
+        data = [project_resource(img, fields=['id', 'name', 'tags'])
+                for img in _images()]
+        self.assertEqual(
+            {'id': '0b1a9f7e-2f5d-4c61-8a0e-6f0f5b7f2a64',
+             'name': 'Standard_Debian_12_latest', 'tags': ['debian']},
+            data[1])
+
+    def test_exclude_fields(self):
+        img = _images()[0]
+        data = project_resource(img, exclude_fields=['properties', 'size'])
+        self.assertNotIn('size', data)
+        self.assertNotIn('location', data)
+        self.assertEqual('Standard_Ubuntu_22.04_latest', data['name'])
+
+    def test_unknown_field(self):
+        with self.assertRaises(AttributeError):
+            project_resource(_images()[0], fields=['bogus'])
+
+    def test_plain_dict(self):
+        raw = {'namespace': 'ns', 'user_name': 'u', 'self_auth': True}
+        self.assertEqual({'user_name': 'u'},
+                         project_resource(raw, fields=['user_name']))
+        self.assertEqual({'namespace': 'ns', 'user_name': 'u'},
+                         project_resource(raw, exclude_fields=['self_auth']))
+
+    def test_result_is_smaller(self):
+        images = _images()
+        full = json.dumps([project_resource(img) for img in images])
+        compact = json.dumps([project_resource(img, fields=['id', 'name'])
+                              for img in images])
+        self.assertLess(len(compact) * 10, len(full))
+
+
+class FakeModule(OTCModule):
+    info_module = True
+
+    def __init__(self, **params):
+        self.params = dict(limit=None, marker=None, max_items=None)
+        self.params.update(params)
+        self.next_marker = None
+
+    def fail_json(self, **kwargs):
+        raise AssertionError(kwargs['msg'])
+
+    def run(self):
+        pass
+
+
+class PagedTest(TestCase):
+
+    def test_max_items_stops_listing(self):
+        fetched = []
+
+        def resources(**query):
+            for i in range(10):
+                fetched.append(i)
+                yield {'id': 'id%d' % i}
+
+        module = FakeModule(max_items=3)
+        data = list(module.paged(resources))
+        self.assertEqual(['id0', 'id1', 'id2'], [r['id'] for r in data])
+        self.assertEqual([0, 1, 2], fetched)
+        self.assertEqual('id2', module.next_marker)
+
+    def test_query_gets_limit_and_marker(self):
+        queries = []
+
+        def resources(**query):
+            queries.append(query)
+            return []
+
+        module = FakeModule(limit=50, marker='m')
+        module.marker_paging = True
+        list(module.paged(resources, name='x'))
+        self.assertEqual([{'name': 'x', 'limit': 50, 'marker': 'm'}],
+                         queries)
+
+    def test_marker_looked_up_without_marker_paging(self):
+        queries = []
+
+        def resources(**query):
+            queries.append(query)
+            return [{'id': 'a'}, {'id': 'b'}, {'id': 'c'}]
+
+        module = FakeModule(limit=50, marker='b')
+        data = list(module.paged(resources, name='x'))
+        self.assertEqual(['c'], [r['id'] for r in data])
+        self.assertEqual([{'name': 'x'}], queries)
+
+    def test_unknown_marker_fails(self):
+        def resources():
+            return [{'id': 'a'}, {'id': 'b'}]
+
+        with self.assertRaisesRegex(AssertionError, 'Marker x not found'):
+            list(FakeModule(marker='x').paged(resources))
+
+    def test_marker_without_query(self):
+        def resources(parent):
+            return [{'id': 'a'}, {'id': 'b'}, {'id': 'c'}]
+
+        module = FakeModule(marker='a')
+        data = list(module.paged(resources, 'parent'))
+        self.assertEqual(['b', 'c'], [r['id'] for r in data])
+        self.assertIsNone(module.next_marker)
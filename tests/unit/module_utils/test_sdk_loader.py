@@ -0,0 +1,57 @@
+from types import SimpleNamespace
+from unittest import TestCase
+from unittest import mock
+
+from otcextensions import sdk as otc_sdk
+
+from ansible_collections.opentelekomcloud.cloud.plugins.module_utils import sdk_loader
+
+
+class FakeConnection:
+
+    def __init__(self):
+        self.authorized = False
+
+    def authorize(self):
+        self.authorized = True
+
+    def _get_project_info(self):
+        return SimpleNamespace(id='project')
+
+
+class LoadTest(TestCase):
+
+    def setUp(self):
+        self.registered = []
+
+        def register(conn, name, project_id):
+            self.registered.append(name)
+            setattr(conn, name, 'proxy-%s' % name)
+
+        patches = [
+            mock.patch.object(otc_sdk, 'register_single_service', register),
+            mock.patch.object(otc_sdk, 'patch_openstack_resources'),
+        ]
+        for patch in patches:
+            patch.start()
+            self.addCleanup(patch.stop)
+        self.conn = FakeConnection()
+        sdk_loader.load(self.conn)
+
+    def test_only_replacing_services_are_registered_right_away(self):
+        replacing = sorted(
+            name for name, service in otc_sdk.OTC_SERVICES.items()
+            if service.get('replace_system', False))
+        self.assertTrue(self.conn.authorized)
+        self.assertEqual(replacing, self.registered)
+
+    def test_service_is_registered_on_first_access(self):
+        del self.registered[:]
+        self.assertEqual('proxy-cbr', self.conn.cbr)
+        self.assertEqual('proxy-cbr', self.conn.cbr)
+        self.assertEqual(['cbr'], self.registered)
+
+    def test_unknown_attribute(self):
+        del self.registered[:]
+        self.assertRaises(AttributeError, getattr, self.conn, 'no_service')
+        self.assertEqual([], self.registered)
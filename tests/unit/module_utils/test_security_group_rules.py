@@ -0,0 +1,96 @@
+from unittest import TestCase
+
+from ansible_collections.opentelekomcloud.cloud.plugins.module_utils import (
+    security_group_rules
+)
+
+canonical_rule = security_group_rules.canonical_rule
+
+
+class CanonicalRuleTest(TestCase):
+
+    def assertSameRule(self, first, second):
+        self.assertEqual(canonical_rule(first), canonical_rule(second))
+
+    def assertDifferentRule(self, first, second):
+        self.assertNotEqual(canonical_rule(first), canonical_rule(second))
+
+    def test_defaults(self):
+        self.assertEqual(
+            ('ingress', 'IPv4', None, None, None, None, None, None),
+            canonical_rule({}))
+
+    def test_protocol(self):
+        self.assertSameRule({'protocol': 'any'}, {'protocol': None})
+        self.assertSameRule({'protocol': 'ANY'}, {})
+        self.assertSameRule({'protocol': 'TCP'}, {'protocol': 'tcp'})
+        self.assertSameRule({'protocol': 6}, {'protocol': '6'})
+        self.assertDifferentRule({'protocol': 'tcp'}, {'protocol': 'udp'})
+        self.assertDifferentRule({'protocol': 'tcp'}, {})
+
+    def test_ports(self):
+        for port in (-1, '-1', '', None):
+            self.assertSameRule(
+                {'protocol': 'icmp', 'port_range_min': port,
+                 'port_range_max': port},
+                {'protocol': 'icmp'})
+        self.assertSameRule(
+            {'protocol': 'tcp', 'port_range_min': '22',
+             'port_range_max': '22'},
+            {'protocol': 'tcp', 'port_range_min': 22, 'port_range_max': 22})
+        self.assertDifferentRule(
+            {'protocol': 'tcp', 'port_range_min': 22, 'port_range_max': 22},
+            {'protocol': 'tcp', 'port_range_min': 22, 'port_range_max': 23})
+
+    def test_ethertype(self):
+        self.assertSameRule({'ethertype': 'IPv4'}, {})
+        self.assertSameRule({'ether_type': 'IPv6'}, {'ethertype': 'IPv6'})
+        self.assertSameRule({'ethertype': 'ipv6'}, {'ethertype': 'IPv6'})
+        self.assertDifferentRule({'ethertype': 'IPv6'}, {})
+
+    def test_ipv4_prefix(self):
+        self.assertSameRule({'remote_ip_prefix': '10.0.0.1/8'},
+                            {'remote_ip_prefix': '10.0.0.0/8'})
+        self.assertSameRule({'remote_ip_prefix': '10.0.0.1'},
+                            {'remote_ip_prefix': '10.0.0.1/32'})
+        self.assertSameRule({'remote_ip_prefix': ''}, {})
+        self.assertDifferentRule({'remote_ip_prefix': '0.0.0.0/0'}, {})
+
+    def test_ipv6_prefix(self):
+        self.assertSameRule({'remote_ip_prefix': '2001:DB8::1/64'},
+                            {'remote_ip_prefix': '2001:db8::/64',
+                             'ethertype': 'IPv6'})
+        self.assertEqual(
+            ('ingress', 'IPv6', None, None, None, '::/0', None, None),
+            canonical_rule({'remote_ip_prefix': '::/0'}))
+
+    def test_remote_group_and_prefix_differ(self):
+        self.assertDifferentRule({'remote_group_id': 'sg'},
+                                 {'remote_ip_prefix': '10.0.0.0/8'})
+        self.assertDifferentRule({'remote_group_id': 'sg'}, {})
+        self.assertSameRule({'remote_group_id': ''},
+                            {'remote_group_id': None})
+
+    def test_api_and_user_rules_match(self):
+        user = {'protocol': 'tcp', 'port_range_min': 443,
+                'port_range_max': 443, 'remote_ip_prefix': '0.0.0.0/0'}
+        api = {'id': 'rule', 'security_group_id': 'sg',
+               'direction': 'ingress', 'ethertype': 'IPv4',
+               'protocol': 'tcp', 'port_range_min': 443,
+               'port_range_max': 443, 'remote_ip_prefix': '0.0.0.0/0',
+               'remote_group_id': None, 'remote_address_group_id': None,
+               'description': 'https'}
+        self.assertSameRule(user, api)
+        self.assertDifferentRule(user, dict(api, direction='egress'))
+
+    def test_rule_definition(self):
+        self.assertEqual(
+            {'direction': 'ingress', 'ethertype': 'IPv6', 'protocol': 'tcp',
+             'port_range_min': 22, 'port_range_max': 22,
+             'remote_ip_prefix': '2001:db8::/64',
+             'security_group_id': 'sg', 'description': 'ssh',
+             'tenant_id': 'project'},
+            security_group_rules.rule_definition(
+                {'protocol': 'tcp', 'port_range_min': 22,
+                 'port_range_max': 22, 'remote_ip_prefix': '2001:db8::/64',
+                 'description': 'ssh'}, 'sg', 'project'))
@@ -0,0 +1,134 @@
+import json
+import os
+import shutil
+import tempfile
+
+from unittest import TestCase
+
+from openstack import exceptions
+from openstack import resource
+from openstack import utils
+
+from ansible_collections.opentelekomcloud.cloud.plugins.module_utils import (
+    tracing
+)
+
+
+class FakeResource:
+    """Resource returning the next of `statuses` on every fetch"""
+
+    def __init__(self, statuses):
+        self.id = 'id'
+        self.status = statuses[0]
+        self.statuses = list(statuses[1:])
+        self.fetches = 0
+
+    def fetch(self, session, skip_cache=False):
+        self.fetches += 1
+        if not self.statuses:
+            raise exceptions.NotFoundException()
+        self.status = self.statuses.pop(0)
+        return self
+
+
+class TracerTest(TestCase):
+
+    def setUp(self):
+        self.tmp = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.tmp)
+        self.trace_file = os.path.join(self.tmp, 'trace.jsonl')
+        self.originals = (resource.wait_for_status, resource.wait_for_delete,
+                          utils.iterate_timeout)
+
+    def tracer(self):
+        tracer = tracing.Tracer(module_name='test',
+                                trace_file=self.trace_file)
+        self.addCleanup(tracer.close)
+        return tracer
+
+    def current(self):
+        return (resource.wait_for_status, resource.wait_for_delete,
+                utils.iterate_timeout)
+
+    def records(self):
+        with open(self.trace_file) as f:
+            return [json.loads(line) for line in f]
+
+    def test_url_template(self):
+        self.assertEqual(
+            '/v1/{id}/vpcs/{id}',
+            tracing.url_template(
+                'https://vpc.example.com/v1/0123456789abcdef0123456789abcdef'
+                '/vpcs/3f1b2c4d-5e6f-4a7b-8c9d-0e1f2a3b4c5d?limit=10'))
+
+    def test_helpers_are_patched_once(self):
+        tracer = self.tracer()
+        tracer.instrument_sdk()
+        patched = self.current()
+        tracer.instrument_sdk()
+        self.assertEqual(patched, self.current())
+        for original, wrapper in zip(self.originals, patched):
+            self.assertIsNot(original, wrapper)
+            self.assertIs(original, wrapper.__wrapped__)
+        tracer.close()
+        self.assertEqual(self.originals, self.current())
+
+    def test_wait_for_status_is_recorded(self):
+        tracer = self.tracer()
+        tracer.instrument_sdk()
+        res = FakeResource(['BUILD', 'BUILD', 'ACTIVE'])
+        result = resource.wait_for_status(None, res, 'ACTIVE', interval=0,
+                                          wait=10)
+        self.assertIs(res, result)
+        self.assertEqual('ACTIVE', result.status)
+        self.assertEqual(2, res.fetches)
+        tracer.close()
+
+        # The nested iterate_timeout is not counted separately
+        self.assertEqual(1, tracer.summary()['wait']['count'])
+        self.assertEqual(
+            [('wait', 'wait_for_status')],
+            [(r['type'], r['name']) for r in self.records()])
+
+    def test_wait_for_status_failure_is_recorded(self):
+        tracer = self.tracer()
+        tracer.instrument_sdk()
+        res = FakeResource(['BUILD', 'ERROR'])
+        with self.assertRaises(exceptions.ResourceFailure):
+            resource.wait_for_status(None, res, 'ACTIVE', interval=0,
+                                     wait=10)
+        self.assertEqual(1, tracer.summary()['wait']['count'])
+
+    def test_wait_for_delete_is_recorded(self):
+        tracer = self.tracer()
+        tracer.instrument_sdk()
+        res = FakeResource(['ACTIVE', 'DELETING'])
+        self.assertIs(res, resource.wait_for_delete(None, res, interval=0,
+                                                    wait=10))
+        self.assertEqual(2, res.fetches)
+        self.assertEqual(1, tracer.summary()['wait']['count'])
+        self.assertEqual('wait_for_delete', self.records()[0]['name'])
+
+    def test_iterate_timeout_is_recorded(self):
+        tracer = self.tracer()
+        tracer.instrument_sdk()
+        counts = []
+        for count in utils.iterate_timeout(10, 'timeout', wait=0):
+            counts.append(count)
+            if len(counts) == 3:
+                break
+        self.assertEqual([1, 2, 3], counts)
+        self.assertEqual(1, tracer.summary()['wait']['count'])
+        self.assertEqual('iterate_timeout', self.records()[0]['name'])
+
+    def test_record_call(self):
+        tracer = self.tracer()
+        tracer.record_call('GET', 'vpc', '/v1/{id}/vpcs', 200, 10, 0.5)
+        tracer.record_call('POST', 'vpc', '/v1/{id}/vpcs', 409, 0, 0.1)
+        summary = tracer.summary()
+        self.assertEqual(dict(calls=2, errors=1, time=0.6, bytes=10),
+                         summary['api'])
+        self.assertEqual(dict(calls=2, errors=1, time=0.6),
+                         summary['services']['vpc'])
+        self.assertEqual([0.5, 0.1],
+                         [r['latency'] for r in summary['slowest']])
@@ -0,0 +1,137 @@
+from unittest import TestCase
+
+from openstack import exceptions
+
+from ansible_collections.opentelekomcloud.cloud.plugins.module_utils import (
+    waiters
+)
+
+
+class FakeResource:
+
+    def __init__(self, id, status):
+        self.id = id
+        self.status = status
+
+
+class FakeClockWaiter(waiters.Waiter):
+    """Waiter sleeping on a fake clock"""
+
+    def __init__(self, *args, **kwargs):
+        kwargs.setdefault('jitter', 0)
+        super(FakeClockWaiter, self).__init__(*args, **kwargs)
+        self.now = 0.0
+        self.sleeps = []
+        self.clock = lambda: self.now
+
+        def sleep(seconds):
+            self.sleeps.append(seconds)
+            self.now += seconds
+        self.sleep = sleep
+
+
+class WaiterTest(TestCase):
+
+    def test_backoff_resets_on_progress(self):
+        states = iter(['BUILD', 'BUILD', 'BUILD', 'RESIZE', 'RESIZE',
+                       'ACTIVE'])
+        waiter = FakeClockWaiter(60, interval=2, backoff=2)
+        self.assertEqual('ACTIVE', waiter.poll(
+            fetch=lambda: next(states),
+            done=lambda state: state == 'ACTIVE',
+            progress=lambda state: state))
+        self.assertEqual([2, 4, 8, 2, 4], waiter.sleeps)
+
+    def test_backoff_is_bounded(self):
+        waiter = FakeClockWaiter(100, interval=2, backoff=10, max_interval=5)
+        with self.assertRaises(exceptions.ResourceTimeout):
+            waiter.poll(fetch=lambda: None, done=lambda state: False)
+        self.assertEqual(5, max(waiter.sleeps))
+        self.assertEqual(100, waiter.now)
+
+    def test_service_interval(self):
+        self.assertEqual(10, waiters.Waiter(1, service='rds').interval)
+        self.assertEqual(waiters.DEFAULT_INTERVAL,
+                         waiters.Waiter(1, service='unknown').interval)
+
+    def test_failure(self):
+        waiter = FakeClockWaiter(60)
+        with self.assertRaises(exceptions.ResourceFailure):
+            waiter.poll(fetch=lambda: 'ERROR', done=lambda state: False,
+                        failed=lambda state: state == 'ERROR' and 'failed')
+
+    def test_wait_for_many_lists_once_per_poll(self):
+        polls = [
+            [FakeResource('a', 'BUILD'), FakeResource('b', 'BUILD'),
+             FakeResource('c', 'ACTIVE')],
+            [FakeResource('a', 'ACTIVE'), FakeResource('b', 'BUILD'),
+             FakeResource('c', 'ACTIVE')],
+            [FakeResource('a', 'ACTIVE'), FakeResource('b', 'ACTIVE'),
+             FakeResource('c', 'ACTIVE')],
+        ]
+        calls = []
+
+        def list_resources():
+            calls.append(1)
+            return polls[len(calls) - 1]
+
+        waiter = FakeClockWaiter(60)
+        found = waiter.wait_for_many(
+            list_resources, ['a', 'b'],
+            ready=lambda res: res.status == 'ACTIVE')
+        self.assertEqual(['a', 'b'], sorted(found))
+        self.assertEqual(3, len(calls))
+
+    def test_wait_for_many_deleted(self):
+        polls = iter([[FakeResource('a', 'ACTIVE')], []])
+        waiter = FakeClockWaiter(60)
+        waiter.wait_for_many_deleted(lambda: next(polls), ['a'])
+        self.assertEqual(2, waiter.polls)
+
+    def test_converge_reports_partial_failures(self):
+        polls = iter([
+            [FakeResource(None, 'BUILD'), FakeResource(None, 'BUILD')],
+            [FakeResource('a', 'BUILD'), FakeResource('b', 'BUILD'),
+             FakeResource(None, 'BUILD')],
+            [FakeResource('a', 'ACTIVE'), FakeResource('b', 'ERROR'),
+             FakeResource('c', 'ACTIVE')],
+        ])
+        progress = []
+        waiter = FakeClockWaiter(60)
+        result = waiter.converge(
+            lambda: next(polls),
+            ready=lambda res: res.status == 'ACTIVE',
+            failed=lambda res: res.status == 'ERROR',
+            count=3,
+            report=lambda *args: progress.append(args))
+        self.assertEqual(['a', 'c'], result['ready'])
+        self.assertEqual(['b'], result['failed'])
+        self.assertEqual(3, result['polls'])
+        self.assertEqual([(0, 0, 3), (2, 1, 3)], progress)
+
+    def test_converge_waits_for_exact_count(self):
+        # Removed instances are still listed while a group scales in
+        polls = iter([
+            [FakeResource('a', 'ACTIVE'), FakeResource('b', 'ACTIVE'),
+             FakeResource('c', 'ACTIVE')],
+            [FakeResource('a', 'ACTIVE'), FakeResource('b', 'ACTIVE'),
+             FakeResource('c', 'ACTIVE')],
+            [FakeResource('a', 'ACTIVE'), FakeResource('b', 'ACTIVE')],
+        ])
+        waiter = FakeClockWaiter(60)
+        result = waiter.converge(
+            lambda: next(polls),
+            ready=lambda res: res.status == 'ACTIVE',
+            count=2)
+        self.assertEqual(['a', 'b'], result['ready'])
+        self.assertEqual(3, result['polls'])
+
+    def test_converge_timeout_reports_progress(self):
+        waiter = FakeClockWaiter(10)
+        with self.assertRaisesRegex(exceptions.ResourceTimeout,
+                                    '1 of 2 ready, 0 failed'):
+            waiter.converge(
+                lambda: [FakeResource('a', 'ACTIVE'),
+                         FakeResource('b', 'BUILD')],
+                ready=lambda res: res.status == 'ACTIVE',
+                ids=['a', 'b'])
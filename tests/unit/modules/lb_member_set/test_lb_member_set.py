@@ -0,0 +1,222 @@
+import json
+
+from unittest import TestCase, mock
+
+from ansible.module_utils import basic
+from ansible.module_utils._text import to_bytes
+import openstack
+from openstack import exceptions
+from openstack.network.v2.pool_member import PoolMember
+
+from ansible_collections.opentelekomcloud.cloud.plugins.modules import (
+    lb_member_set
+)
+
+# Try to import the new testing module for Ansible 2.19+
+try:
+    from ansible.module_utils.testing import patch_module_args
+    HAS_PATCH_MODULE_ARGS = True
+except ImportError:
+    HAS_PATCH_MODULE_ARGS = False
+
+# Global to track the current module args context manager
+_current_patch_context = None
+
+
+def exit_json(*args, **kwargs):
+    """function to patch over exit_json; package return data into an exception"""
+    if 'changed' not in kwargs:
+        kwargs['changed'] = False
+    raise AnsibleExitJson(kwargs)
+
+
+def fail_json(*args, **kwargs):
+    """function to patch over fail_json; package return data into an exception"""
+    kwargs['failed'] = True
+    raise AnsibleFailJson(kwargs)
+
+
+class AnsibleExitJson(Exception):
+    """Exception class to be raised by module.exit_json and caught by the test case"""
+    pass
+
+
+class AnsibleFailJson(Exception):
+    """Exception class to be raised by module.fail_json and caught by the test case"""
+    pass
+
+
+def set_module_args(args):
+    """prepare arguments so that they will be picked up during module creation
+
+    This function supports both old-style Ansible (pre-2.19) and new-style
+    Ansible 2.19+ with serialization profiles.
+    """
+    global _current_patch_context
+
+    # Close any previous context
+    if _current_patch_context is not None:
+        try:
+            _current_patch_context.__exit__(None, None, None)
+        except Exception:
+            pass
+        _current_patch_context = None
+
+    if HAS_PATCH_MODULE_ARGS:
+        # Ansible 2.19+ - use the official testing helper
+        args['_ansible_remote_tmp'] = '/tmp'
+        args['_ansible_keep_remote_files'] = False
+        _current_patch_context = patch_module_args(args)
+        _current_patch_context.__enter__()
+    else:
+        # Legacy Ansible (pre-2.19)
+        args = json.dumps({'ANSIBLE_MODULE_ARGS': args})
+        basic._ANSIBLE_ARGS = to_bytes(args)
+
+
+def cleanup_module_args():
+    """Clean up the module args context after a test"""
+    global _current_patch_context
+    if _current_patch_context is not None:
+        try:
+            _current_patch_context.__exit__(None, None, None)
+        except Exception:
+            pass
+        _current_patch_context = None
+
+
+class FakeNetwork:
+    """Network proxy keeping the members of one pool"""
+
+    def __init__(self, members):
+        self.members = dict((m.id, m) for m in members)
+        self.calls = []
+        self.fail = set()
+
+    def find_pool(self, name_or_id):
+        return mock.Mock(id='pool')
+
+    def find_subnet(self, name_or_id):
+        return mock.Mock(id='subnet-id')
+
+    def pool_members(self, pool):
+        return list(self.members.values())
+
+    def _check(self, address):
+        if address in self.fail:
+            raise exceptions.BadRequestException('Invalid address')
+
+    def create_pool_member(self, pool, **attrs):
+        self.calls.append(('create', attrs['address']))
+        self._check(attrs['address'])
+        member = PoolMember.existing(id=attrs['address'], **attrs)
+        self.members[member.id] = member
+        return member
+
+    def update_pool_member(self, member, pool, **attrs):
+        self.calls.append(('update', member.address))
+        self._check(member.address)
+        member = PoolMember.existing(**dict(member.to_dict(), **attrs))
+        self.members[member.id] = member
+        return member
+
+    def delete_pool_member(self, member, pool):
+        self.calls.append(('delete', member.address))
+        self._check(member.address)
+        del self.members[member.id]
+
+
+def _member(address, **attrs):
+    return PoolMember.existing(id=address, address=address,
+                               protocol_port=80, weight=1, **attrs)
+
+
+class LoadBalancerMemberSetTest(TestCase):
+
+    def setUp(self):
+        self.mock_module_helper = mock.patch.multiple(
+            basic.AnsibleModule,
+            exit_json=exit_json,
+            fail_json=fail_json)
+        self.mock_module_helper.start()
+        self.addCleanup(self.mock_module_helper.stop)
+        self.addCleanup(cleanup_module_args)
+
+        self.network = FakeNetwork([_member('10.0.0.1'),
+                                    _member('10.0.0.2')])
+        conn = mock.Mock(network=self.network)
+        patcher = mock.patch.object(
+            lb_member_set.LoadBalancerMemberSetModule,
+            'openstack_cloud_from_module',
+            return_value=(openstack, conn))
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def _run(self, members, **params):
+        params.update(pool='pool', members=[
+            dict(protocol_port=80, **member) for member in members])
+        set_module_args(params)
+        lb_member_set.LoadBalancerMemberSetModule()()
+
+    def test_add_update_remove(self):
+        with self.assertRaises(AnsibleExitJson) as result:
+            self._run([dict(address='10.0.0.1', weight=5),
+                       dict(address='10.0.0.3', subnet='subnet')])
+        result = result.exception.args[0]
+        self.assertTrue(result['changed'])
+        self.assertEqual(['10.0.0.3:80'], result['added'])
+        self.assertEqual(['10.0.0.1:80'], result['updated'])
+        self.assertEqual(['10.0.0.2:80'], result['removed'])
+        self.assertEqual([('create', '10.0.0.3'), ('delete', '10.0.0.2'),
+                          ('update', '10.0.0.1')],
+                         sorted(self.network.calls))
+        self.assertEqual('subnet-id',
+                         self.network.members['10.0.0.3'].subnet_id)
+        self.assertEqual(
+            [('10.0.0.1', 5), ('10.0.0.3', None)],
+            sorted((m['address'], m['weight']) for m in result['members']))
+        self.assertNotIn('location', result['members'][0])
+
+    def test_unchanged(self):
+        with self.assertRaises(AnsibleExitJson) as result:
+            self._run([dict(address='10.0.0.1', weight=1),
+                       dict(address='10.0.0.2')])
+        result = result.exception.args[0]
+        self.assertFalse(result['changed'])
+        self.assertEqual([], self.network.calls)
+        self.assertEqual(2, len(result['members']))
+        self.assertNotIn('location', result['members'][0])
+
+    def test_without_purge(self):
+        with self.assertRaises(AnsibleExitJson) as result:
+            self._run([dict(address='10.0.0.3')], purge=False)
+        result = result.exception.args[0]
+        self.assertEqual([], result['removed'])
+        self.assertEqual([('create', '10.0.0.3')], self.network.calls)
+
+    def test_check_mode(self):
+        with self.assertRaises(AnsibleExitJson) as result:
+            self._run([dict(address='10.0.0.3')], _ansible_check_mode=True)
+        result = result.exception.args[0]
+        self.assertTrue(result['changed'])
+        self.assertEqual(['10.0.0.3:80'], result['added'])
+        self.assertEqual([], self.network.calls)
+
+    def test_partial_failure(self):
+        self.network.fail.add('10.0.0.3')
+        with self.assertRaises(AnsibleFailJson) as result:
+            self._run([dict(address='10.0.0.1'),
+                       dict(address='10.0.0.3'),
+                       dict(address='10.0.0.4')])
+        result = result.exception.args[0]
+        self.assertIn('Failed to apply 1 of 3 member changes', result['msg'])
+        self.assertIn('10.0.0.3:80', result['msg'])
+        # Applied changes are returned
+        self.assertEqual(
+            ['10.0.0.1', '10.0.0.4'],
+            sorted(m['address'] for m in result['members']))
+
+    def test_duplicate_member(self):
+        with self.assertRaises(AnsibleFailJson) as result:
+            self._run([dict(address='10.0.0.1'), dict(address='10.0.0.1')])
+        self.assertIn('more than once', result.exception.args[0]['msg'])
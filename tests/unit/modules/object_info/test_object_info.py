@@ -0,0 +1,245 @@
+import json
+
+from unittest import TestCase, mock
+from urllib.parse import unquote
+
+from ansible.module_utils import basic
+from ansible.module_utils._text import to_bytes
+import openstack
+
+from ansible_collections.opentelekomcloud.cloud.plugins.modules import object_info
+
+# Try to import the new testing module for Ansible 2.19+
+try:
+    from ansible.module_utils.testing import patch_module_args
+    HAS_PATCH_MODULE_ARGS = True
+except ImportError:
+    HAS_PATCH_MODULE_ARGS = False
+
+# Global to track the current module args context manager
+_current_patch_context = None
+
+
+def exit_json(*args, **kwargs):
+    """function to patch over exit_json; package return data into an exception"""
+    if 'changed' not in kwargs:
+        kwargs['changed'] = False
+    raise AnsibleExitJson(kwargs)
+
+
+def fail_json(*args, **kwargs):
+    """function to patch over fail_json; package return data into an exception"""
+    kwargs['failed'] = True
+    raise AnsibleFailJson(kwargs)
+
+
+class AnsibleExitJson(Exception):
+    """Exception class to be raised by module.exit_json and caught by the test case"""
+    pass
+
+
+class AnsibleFailJson(Exception):
+    """Exception class to be raised by module.fail_json and caught by the test case"""
+    pass
+
+
+def set_module_args(args):
+    """prepare arguments so that they will be picked up during module creation
+
+    This function supports both old-style Ansible (pre-2.19) and new-style
+    Ansible 2.19+ with serialization profiles.
+    """
+    global _current_patch_context
+
+    # Close any previous context
+    if _current_patch_context is not None:
+        try:
+            _current_patch_context.__exit__(None, None, None)
+        except Exception:
+            pass
+        _current_patch_context = None
+
+    if HAS_PATCH_MODULE_ARGS:
+        # Ansible 2.19+ - use the official testing helper
+        args['_ansible_remote_tmp'] = '/tmp'
+        args['_ansible_keep_remote_files'] = False
+        _current_patch_context = patch_module_args(args)
+        _current_patch_context.__enter__()
+    else:
+        # Legacy Ansible (pre-2.19)
+        args = json.dumps({'ANSIBLE_MODULE_ARGS': args})
+        basic._ANSIBLE_ARGS = to_bytes(args)
+
+
+def cleanup_module_args():
+    """Clean up the module args context after a test"""
+    global _current_patch_context
+    if _current_patch_context is not None:
+        try:
+            _current_patch_context.__exit__(None, None, None)
+        except Exception:
+            pass
+        _current_patch_context = None
+
+
+class FakeResponse:
+
+    def __init__(self, status_code, body=None):
+        self.status_code = status_code
+        self.reason = 'Status %d' % status_code
+        self.content = json.dumps(body).encode() if body is not None else b''
+
+    def json(self):
+        return json.loads(self.content)
+
+
+class FakeObjectStore:
+    """Swift container listing objects sorted by name.
+
+    Pages hold at most `page_size` entries whatever `limit` is requested,
+    like the listing limit of Swift.
+    """
+
+    def __init__(self, objects, page_size=3):
+        self.objects = sorted(objects.items())
+        self.page_size = page_size
+        self.requests = []
+
+    def get(self, path, params=None, raise_exc=True):
+        self.requests.append(dict(params))
+        self.container = unquote(path.strip('/'))
+        prefix = params.get('prefix', '')
+        delimiter = params.get('delimiter')
+        marker = params.get('marker')
+        end_marker = params.get('end_marker')
+        entries = []
+        for name, size in self.objects:
+            if not name.startswith(prefix):
+                continue
+            if marker and (name <= marker or (
+                    delimiter and marker.endswith(delimiter)
+                    and name.startswith(marker))):
+                continue
+            if end_marker and name >= end_marker:
+                continue
+            head, found, _ = name[len(prefix):].partition(delimiter or '/')
+            if delimiter and found:
+                subdir = prefix + head + delimiter
+                if not entries or entries[-1].get('subdir') != subdir:
+                    entries.append(dict(subdir=subdir))
+            else:
+                entries.append(dict(name=name, bytes=size, hash='hash',
+                                    content_type='application/octet-stream'))
+        limit = min(params.get('limit', self.page_size), self.page_size)
+        return FakeResponse(200, entries[:limit])
+
+
+class ObjectStatsTest(TestCase):
+
+    def test_grouped_by_first_level(self):
+        stats = object_info.ObjectStats()
+        stats.add('a/1', 1)
+        stats.add('a/b/2', 2)
+        stats.add('c/3', 4)
+        stats.add('top', 8)
+        self.assertEqual(dict(
+            count=4, bytes=15,
+            prefixes={'a/': dict(count=2, bytes=3),
+                      'c/': dict(count=1, bytes=4),
+                      '': dict(count=1, bytes=8)}), stats.to_dict())
+
+    def test_grouped_after_prefix(self):
+        stats = object_info.ObjectStats('2024/')
+        stats.add('2024/05/a', 1)
+        stats.add('2024/05/b', 2)
+        stats.add('2024/06/c', 4)
+        stats.add('2024/d', 8)
+        self.assertEqual({'2024/05/': dict(count=2, bytes=3),
+                          '2024/06/': dict(count=1, bytes=4),
+                          '2024/': dict(count=1, bytes=8)},
+                         stats.prefixes)
+
+    def test_grouped_by_delimiter(self):
+        stats = object_info.ObjectStats('logs-', delimiter='-')
+        stats.add('logs-web-1', 1)
+        stats.add('logs-web-2', 2)
+        stats.add('logs-db/1', 4)
+        self.assertEqual({'logs-web-': dict(count=2, bytes=3),
+                          'logs-': dict(count=1, bytes=4)},
+                         stats.prefixes)
+
+
+class ObjectInfoTest(TestCase):
+
+    def setUp(self):
+        self.mock_module_helper = mock.patch.multiple(
+            basic.AnsibleModule,
+            exit_json=exit_json,
+            fail_json=fail_json)
+        self.mock_module_helper.start()
+        self.addCleanup(self.mock_module_helper.stop)
+        self.addCleanup(cleanup_module_args)
+
+        self.conn = mock.Mock()
+        patcher = mock.patch.object(
+            object_info.SwiftInfoModule, 'openstack_cloud_from_module',
+            return_value=(openstack, self.conn))
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def _list(self, objects, **params):
+        self.conn.object_store = FakeObjectStore(objects)
+        set_module_args(dict(container='bucket', **params))
+        with self.assertRaises(AnsibleExitJson) as result:
+            object_info.SwiftInfoModule()()
+        return result.exception.args[0]['swift']
+
+    def _names(self, swift):
+        return [obj['name'] for obj in swift['objects']]
+
+    def test_short_pages_are_followed(self):
+        objects = dict(('obj-%02d' % i, i) for i in range(8))
+        swift = self._list(objects, limit=5)
+        self.assertEqual(sorted(objects), self._names(swift))
+        requests = self.conn.object_store.requests
+        self.assertEqual([None, 'obj-02', 'obj-05', 'obj-07'],
+                         [request.get('marker') for request in requests])
+        self.assertEqual({5}, set(request['limit'] for request in requests))
+
+    def test_subdirs_and_end_marker(self):
+        objects = {'a/1': 1, 'a/2': 1, 'b/1': 1, 'c': 1, 'd/1': 1,
+                   'e': 1, 'f/1': 1, 'g': 1}
+        swift = self._list(objects, delimiter='/', end_marker='f')
+        self.assertEqual(['c', 'e'], self._names(swift))
+        self.assertEqual(['a/', 'b/', 'd/'], swift['prefixes'])
+        requests = self.conn.object_store.requests
+        self.assertEqual([None, 'c', 'e'],
+                         [request.get('marker') for request in requests])
+        for request in requests:
+            self.assertEqual('/', request['delimiter'])
+            self.assertEqual('f', request['end_marker'])
+
+    def test_prefix_and_marker(self):
+        objects = {'2024/05/a': 1, '2024/05/b': 1, '2024/06/a': 1,
+                   '2024/06/b': 1, '2024/07/a': 1, '2025/01/a': 1}
+        swift = self._list(objects, prefix='2024/', delimiter='/',
+                           marker='2024/05/')
+        self.assertEqual([], self._names(swift))
+        self.assertEqual(['2024/06/', '2024/07/'], swift['prefixes'])
+
+    def test_stats_use_delimiter(self):
+        objects = {'logs-web-1': 1, 'logs-web-2': 2, 'logs-db': 4,
+                   'other': 8}
+        swift = self._list(objects, prefix='logs-', stats=True,
+                           return_objects=False)
+        self.assertNotIn('objects', swift)
+        self.assertEqual(dict(count=3, bytes=7,
+                              prefixes={'logs-': dict(count=3, bytes=7)}),
+                         swift['stats'])
+        swift = self._list(objects, prefix='logs-', delimiter='-',
+                           stats=True)
+        self.assertEqual(['logs-db'], self._names(swift))
+        self.assertEqual(['logs-web-'], swift['prefixes'])
+        self.assertEqual(dict(count=1, bytes=4,
+                              prefixes={'logs-': dict(count=1, bytes=4)}),
+                         swift['stats'])
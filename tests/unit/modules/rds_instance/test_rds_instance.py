@@ -165,6 +165,14 @@ class RdsInstanceTest(TestCase):
             client_key=None,
             api_timeout=None,
             sdk_log_path=None,
+            auth_cache=False,
+            auth_cache_path=None,
+            auth_cache_key=None,
+            broker=False,
+            broker_socket=None,
+            broker_idle_timeout=300,
+            api_trace=False,
+            api_trace_file=None,
             availability_zone=None,
             backup_keepdays=None,
             backup_timeframe=None,
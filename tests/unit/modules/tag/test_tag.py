@@ -0,0 +1,318 @@
+import json
+
+from types import SimpleNamespace
+from unittest import TestCase, mock
+
+from ansible.module_utils import basic
+from ansible.module_utils._text import to_bytes
+import openstack
+
+from ansible_collections.opentelekomcloud.cloud.plugins.modules import tag
+
+# Try to import the new testing module for Ansible 2.19+
+try:
+    from ansible.module_utils.testing import patch_module_args
+    HAS_PATCH_MODULE_ARGS = True
+except ImportError:
+    HAS_PATCH_MODULE_ARGS = False
+
+# Global to track the current module args context manager
+_current_patch_context = None
+
+
+def exit_json(*args, **kwargs):
+    """function to patch over exit_json; package return data into an exception"""
+    if 'changed' not in kwargs:
+        kwargs['changed'] = False
+    raise AnsibleExitJson(kwargs)
+
+
+def fail_json(*args, **kwargs):
+    """function to patch over fail_json; package return data into an exception"""
+    kwargs['failed'] = True
+    raise AnsibleFailJson(kwargs)
+
+
+class AnsibleExitJson(Exception):
+    """Exception class to be raised by module.exit_json and caught by the test case"""
+    pass
+
+
+class AnsibleFailJson(Exception):
+    """Exception class to be raised by module.fail_json and caught by the test case"""
+    pass
+
+
+def set_module_args(args):
+    """prepare arguments so that they will be picked up during module creation
+
+    This function supports both old-style Ansible (pre-2.19) and new-style
+    Ansible 2.19+ with serialization profiles.
+    """
+    global _current_patch_context
+
+    # Close any previous context
+    if _current_patch_context is not None:
+        try:
+            _current_patch_context.__exit__(None, None, None)
+        except Exception:
+            pass
+        _current_patch_context = None
+
+    if HAS_PATCH_MODULE_ARGS:
+        # Ansible 2.19+ - use the official testing helper
+        args['_ansible_remote_tmp'] = '/tmp'
+        args['_ansible_keep_remote_files'] = False
+        _current_patch_context = patch_module_args(args)
+        _current_patch_context.__enter__()
+    else:
+        # Legacy Ansible (pre-2.19)
+        args = json.dumps({'ANSIBLE_MODULE_ARGS': args})
+        basic._ANSIBLE_ARGS = to_bytes(args)
+
+
+def cleanup_module_args():
+    """Clean up the module args context after a test"""
+    global _current_patch_context
+    if _current_patch_context is not None:
+        try:
+            _current_patch_context.__exit__(None, None, None)
+        except Exception:
+            pass
+        _current_patch_context = None
+
+
+class FakeResponse:
+
+    def __init__(self, status_code, body=None):
+        self.status_code = status_code
+        self.reason = 'Status %d' % status_code
+        self.content = json.dumps(body).encode() if body is not None else b''
+
+    def json(self):
+        return json.loads(self.content)
+
+
+class FakeEndpoint:
+    """Service endpoint keeping the tags of resources.
+
+    `replace_status` is returned for replacing all tags at once, if set.
+    """
+
+    def __init__(self, tags, replace_status=None):
+        self.tags = tags
+        self.replace_status = replace_status
+        self.calls = []
+        self.fail = set()
+
+    def request(self, url, method, microversion=None, raise_exc=True,
+                json=None):
+        parts = url.strip('/').split('/')
+        resource_id = parts[1]
+        self.calls.append((method, '/'.join(parts[2:])))
+        tags = self.tags[resource_id]
+        if method != 'GET' and resource_id in self.fail:
+            return FakeResponse(500)
+        if len(parts) == 3:
+            if method == 'GET':
+                return FakeResponse(200, {'tags': tags})
+            if self.replace_status:
+                return FakeResponse(self.replace_status)
+            tags[:] = json['tags']
+            return FakeResponse(200, {'tags': tags})
+        name = parts[3]
+        if method == 'PUT':
+            if name not in tags:
+                tags.append(name)
+            return FakeResponse(201)
+        if name not in tags:
+            return FakeResponse(404)
+        tags.remove(name)
+        return FakeResponse(204)
+
+
+class FakeNetwork(FakeEndpoint):
+    """Network endpoint listing ports with their tags"""
+
+    def __init__(self, ports):
+        super(FakeNetwork, self).__init__(
+            dict((port['id'], list(port['tags'])) for port in ports))
+        self.ports_listed = []
+        self._ports = ports
+
+    def ports(self, **filters):
+        self.ports_listed.append(filters)
+        return [SimpleNamespace(**port) for port in self._ports]
+
+
+class TagTestCase(TestCase):
+
+    def setUp(self):
+        self.mock_module_helper = mock.patch.multiple(
+            basic.AnsibleModule,
+            exit_json=exit_json,
+            fail_json=fail_json)
+        self.mock_module_helper.start()
+        self.addCleanup(self.mock_module_helper.stop)
+        self.addCleanup(cleanup_module_args)
+
+        self.conn = mock.Mock()
+        patcher = mock.patch.object(
+            tag.TagModule, 'openstack_cloud_from_module',
+            return_value=(openstack, self.conn))
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def _run(self, **params):
+        set_module_args(params)
+        tag.TagModule()()
+
+
+class TagServerTest(TagTestCase):
+
+    def setUp(self):
+        super(TagServerTest, self).setUp()
+        self.conn.get_server.return_value = mock.Mock(id='srv')
+
+    def _tag(self, endpoint, **params):
+        self.conn.compute = endpoint
+        with self.assertRaises(AnsibleExitJson) as result:
+            self._run(server='srv', **params)
+        return result.exception.args[0]
+
+    def test_replace_with_one_request(self):
+        endpoint = FakeEndpoint({'srv': ['a', 'b']})
+        result = self._tag(endpoint, tags=['b', 'c'])
+        self.assertTrue(result['changed'])
+        self.assertEqual(['b', 'c'], result['tags'])
+        self.assertEqual(['b', 'c'], endpoint.tags['srv'])
+        self.assertEqual([('GET', 'tags'), ('PUT', 'tags')], endpoint.calls)
+        self.assertEqual(2, result['api_calls'])
+
+    def test_unchanged(self):
+        endpoint = FakeEndpoint({'srv': ['b', 'a']})
+        result = self._tag(endpoint, tags=['a', 'b'])
+        self.assertFalse(result['changed'])
+        self.assertEqual([('GET', 'tags')], endpoint.calls)
+        self.assertEqual(1, result['api_calls'])
+
+    def test_fallback_to_single_tags(self):
+        for status in (404, 405, 501):
+            endpoint = FakeEndpoint({'srv': ['a', 'b']},
+                                    replace_status=status)
+            result = self._tag(endpoint, tags=['b', 'c', 'd'])
+            self.assertTrue(result['changed'])
+            self.assertEqual(['b', 'c', 'd'], result['tags'])
+            self.assertEqual(['b', 'c', 'd'], endpoint.tags['srv'])
+            self.assertEqual(
+                [('GET', 'tags'), ('PUT', 'tags'), ('PUT', 'tags/c'),
+                 ('PUT', 'tags/d'), ('DELETE', 'tags/a')],
+                endpoint.calls)
+            self.assertEqual(5, result['api_calls'])
+
+    def test_replace_error_does_not_fall_back(self):
+        self.conn.compute = FakeEndpoint({'srv': ['a']}, replace_status=400)
+        with self.assertRaises(AnsibleFailJson) as result:
+            self._run(server='srv', tags=['b'])
+        result = result.exception.args[0]
+        self.assertIn('Status 400', result['msg'])
+        self.assertEqual([('GET', 'tags'), ('PUT', 'tags')],
+                         self.conn.compute.calls)
+
+    def test_set_mode_adds_tags(self):
+        endpoint = FakeEndpoint({'srv': ['a']})
+        result = self._tag(endpoint, tags=['b'], mode='set')
+        self.assertEqual(['a', 'b'], result['tags'])
+
+    def test_absent_removes_tags(self):
+        endpoint = FakeEndpoint({'srv': ['a', 'b']}, replace_status=405)
+        result = self._tag(endpoint, tags=['a'], state='absent')
+        self.assertEqual(['b'], result['tags'])
+        self.assertEqual(
+            [('GET', 'tags'), ('PUT', 'tags'), ('DELETE', 'tags/a')],
+            endpoint.calls)
+
+    def test_check_mode(self):
+        endpoint = FakeEndpoint({'srv': ['a']})
+        result = self._tag(endpoint, tags=['b'], _ansible_check_mode=True)
+        self.assertTrue(result['changed'])
+        self.assertEqual(['b'], result['tags'])
+        self.assertEqual(['a'], endpoint.tags['srv'])
+        self.assertEqual([('GET', 'tags')], endpoint.calls)
+
+
+class TagManyTest(TagTestCase):
+
+    def setUp(self):
+        super(TagManyTest, self).setUp()
+        self.conn.network = FakeNetwork([
+            dict(id='id-1', name='first', tags=[]),
+            dict(id='id-2', name='second', tags=['a']),
+            dict(id='id-3', name='dup', tags=[]),
+            dict(id='id-4', name='dup', tags=[]),
+        ])
+
+    def _tag(self, **params):
+        with self.assertRaises(AnsibleExitJson) as result:
+            self._run(resource_type='port', **params)
+        return result.exception.args[0]
+
+    def test_resources_by_name_and_id(self):
+        result = self._tag(resources=['first', 'id-2', 'id-3'], tags=['a'])
+        self.assertTrue(result['changed'])
+        self.assertEqual(
+            [('id-1', 'first', True, ['a']), ('id-2', 'second', False, ['a']),
+             ('id-3', 'dup', True, ['a'])],
+            [(r['id'], r['name'], r['changed'], r['tags'])
+             for r in result['resources']])
+        self.assertEqual([], self.conn.network.tags['id-4'])
+        # One listing and one request per changed resource, no GET of tags
+        self.assertEqual(1, len(self.conn.network.ports_listed))
+        self.assertEqual([('PUT', 'tags'), ('PUT', 'tags')],
+                         self.conn.network.calls)
+        self.assertEqual(3, result['api_calls'])
+
+    def test_missing_and_not_unique_resources(self):
+        with self.assertRaises(AnsibleFailJson) as result:
+            self._run(resource_type='port', resources=['first', 'dup', 'x'],
+                      tags=['a'])
+        self.assertIn('dup, x can not be found or are not unique',
+                      result.exception.args[0]['msg'])
+        self.assertEqual([], self.conn.network.calls)
+
+    def test_resources_or_filters_required(self):
+        with self.assertRaises(AnsibleFailJson) as result:
+            self._run(resource_type='port', tags=['a'])
+        self.assertIn('resources or filters is required',
+                      result.exception.args[0]['msg'])
+        self.assertEqual([], self.conn.network.ports_listed)
+
+    def test_filters(self):
+        result = self._tag(filters=dict(network_id='net'), tags=['b'],
+                           mode='set')
+        self.assertEqual([dict(network_id='net')],
+                         self.conn.network.ports_listed)
+        self.assertEqual(4, len(result['resources']))
+        self.assertEqual(['a', 'b'], self.conn.network.tags['id-2'])
+
+    def test_empty_filters_select_all(self):
+        result = self._tag(filters={}, tags=[])
+        self.assertEqual([{}], self.conn.network.ports_listed)
+        self.assertEqual(['id-2'], [r['id'] for r in result['resources']
+                                    if r['changed']])
+
+    def test_errors_are_reported_per_resource(self):
+        self.conn.network.fail.add('id-2')
+        with self.assertRaises(AnsibleFailJson) as result:
+            self._run(resource_type='port', filters={}, tags=['b'],
+                      parallelism=4)
+        result = result.exception.args[0]
+        self.assertIn('Failed to tag 1 of 4 resources: id-2: ',
+                      result['msg'])
+        self.assertTrue(result['changed'])
+        by_id = dict((r['id'], r) for r in result['resources'])
+        self.assertIn('Status 500', by_id['id-2']['error'])
+        self.assertFalse(by_id['id-2']['changed'])
+        for resource_id in ('id-1', 'id-3', 'id-4'):
+            self.assertEqual(['b'], by_id[resource_id]['tags'])
+            self.assertEqual(['b'], self.conn.network.tags[resource_id])
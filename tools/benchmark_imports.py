@@ -0,0 +1,102 @@
+#!/usr/bin/env python
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Measure the import time of every module of the collection.
+
+Each module is imported in a fresh interpreter. The collection must be
+importable, i.e. PYTHONPATH points to the directory containing
+`ansible_collections`:
+
+    python tools/benchmark_imports.py [--runs 3] [--max-ms 300] [module ...]
+
+Modules importing openstacksdk at import time are flagged, since the SDK
+should only be imported once a connection is required. The exit code is
+non-zero if a module exceeds `--max-ms` or imports the SDK, so the script
+can guard against import time regressions.
+"""
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+
+PACKAGE = 'ansible_collections.opentelekomcloud.cloud.plugins.modules'
+
+CHILD = r'''
+import json, sys, time
+start = time.perf_counter()
+__import__(sys.argv[1])
+elapsed = time.perf_counter() - start
+print(json.dumps(dict(
+    ms=elapsed * 1000,
+    sdk='openstack' in sys.modules,
+    modules=len(sys.modules))))
+'''
+
+
+def module_names():
+    path = os.path.join(
+        os.path.dirname(os.path.abspath(__file__)), '..', 'plugins',
+        'modules')
+    return sorted(
+        name[:-3] for name in os.listdir(path)
+        if name.endswith('.py') and name != '__init__.py')
+
+
+def measure(name, runs):
+    samples = []
+    for _ in range(runs):
+        proc = subprocess.run(
+            [sys.executable, '-c', CHILD, '.'.join([PACKAGE, name])],
+            stdout=subprocess.PIPE, stderr=subprocess.PIPE,
+            universal_newlines=True)
+        if proc.returncode:
+            return dict(error=proc.stderr.strip().splitlines()[-1])
+        samples.append(json.loads(proc.stdout))
+    return dict(
+        ms=statistics.median(s['ms'] for s in samples),
+        sdk=samples[-1]['sdk'],
+        modules=samples[-1]['modules'])
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--runs', type=int, default=3)
+    parser.add_argument('--max-ms', type=float, default=None,
+                        help='Fail if a module takes longer to import.')
+    parser.add_argument('modules', nargs='*',
+                        help='Modules to measure, all by default.')
+    args = parser.parse_args()
+
+    failed = False
+    for name in args.modules or module_names():
+        res = measure(name, args.runs)
+        if 'error' in res:
+            failed = True
+            print('{0:40} ERROR {1}'.format(name, res['error']))
+            continue
+        flags = []
+        if res['sdk']:
+            flags.append('imports openstacksdk')
+        if args.max_ms is not None and res['ms'] > args.max_ms:
+            flags.append('slower than %.0f ms' % args.max_ms)
+        failed = failed or bool(flags)
+        print('{0:40} {1:8.1f} ms {2:5d} modules {3}'.format(
+            name, res['ms'], res['modules'], ', '.join(flags)))
+    return 1 if failed else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,121 @@
+#!/usr/bin/env python
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Compare eager and lazy OTC service registration at module start.
+
+Every measurement runs in a fresh interpreter against a fake, pre-authenticated
+connection, so no cloud access is needed. The collection must be importable,
+i.e. PYTHONPATH points to the directory containing `ansible_collections`:
+
+    python tools/benchmark_sdk_load.py [--runs 5] [--services vpc cbr]
+
+Proxies are not instantiated since that costs the same in both modes (and
+would try endpoint version discovery); lazy mode registers the given
+services the way first attribute access does.
+"""
+
+import argparse
+import datetime
+import json
+import statistics
+import subprocess
+import sys
+
+CHILD = r'''
+import json, resource, sys, time
+mode, services = sys.argv[1], json.loads(sys.argv[2])
+start = time.perf_counter()
+import openstack
+from otcextensions import sdk as otc_sdk
+conn = openstack.connect(
+    auth_type='v3password', auth=dict(
+        auth_url='https://iam.example.com/v3', username='user',
+        password='password', project_name='project',
+        user_domain_name='domain', project_domain_name='domain'),
+    region_name='eu-de')
+conn.session.auth.set_auth_state(sys.stdin.read())
+if mode == 'eager':
+    otc_sdk.load(conn)
+else:
+    from ansible_collections.opentelekomcloud.cloud.plugins.module_utils \
+        import sdk_loader
+    sdk_loader.load(conn)
+    for name in services:
+        sdk_loader.register_service(conn, name)
+elapsed = time.perf_counter() - start
+print(json.dumps(dict(
+    seconds=elapsed,
+    maxrss_kb=resource.getrusage(resource.RUSAGE_SELF).ru_maxrss,
+    modules=len(sys.modules))))
+'''
+
+
+def fake_auth_state():
+    from otcextensions.sdk import OTC_SERVICES
+    expires = datetime.datetime.utcnow() + datetime.timedelta(hours=1)
+    catalog = []
+    for name, service in OTC_SERVICES.items():
+        service_type = service.get('endpoint_service_type', name)
+        catalog.append({
+            'type': service_type,
+            'name': service_type,
+            'endpoints': [{
+                'interface': 'public',
+                'region': 'eu-de',
+                'region_id': 'eu-de',
+                'url': 'https://%s.example.com/v1/project-id' % name}]})
+    body = {'token': {
+        'expires_at': expires.strftime('%Y-%m-%dT%H:%M:%S.000000Z'),
+        'methods': ['password'],
+        'user': {'id': 'user-id', 'name': 'user',
+                 'domain': {'id': 'domain-id', 'name': 'domain'}},
+        'project': {'id': 'project-id', 'name': 'project',
+                    'domain': {'id': 'domain-id', 'name': 'domain'}},
+        'catalog': catalog}}
+    return json.dumps({'auth_token': 'token', 'body': body})
+
+
+def measure(mode, services, state, runs):
+    samples = []
+    for _ in range(runs):
+        out = subprocess.run(
+            [sys.executable, '-c', CHILD, mode, json.dumps(services)],
+            input=state, stdout=subprocess.PIPE,
+            universal_newlines=True, check=True).stdout
+        samples.append(json.loads(out))
+    return dict(
+        seconds=statistics.median(s['seconds'] for s in samples),
+        maxrss_kb=statistics.median(s['maxrss_kb'] for s in samples),
+        modules=samples[-1]['modules'])
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--runs', type=int, default=5)
+    parser.add_argument('--services', nargs='*', default=['vpc'],
+                        help='Services accessed after the load.')
+    args = parser.parse_args()
+
+    state = fake_auth_state()
+    results = {mode: measure(mode, args.services, state, args.runs)
+               for mode in ('eager', 'lazy')}
+    for mode, res in results.items():
+        print('{0:6} {1:8.3f}s {2:9d} KiB {3:6d} modules'.format(
+            mode, res['seconds'], int(res['maxrss_kb']), res['modules']))
+    print('speedup x{0:.2f}, rss -{1} KiB'.format(
+        results['eager']['seconds'] / results['lazy']['seconds'],
+        int(results['eager']['maxrss_kb'] - results['lazy']['maxrss_kb'])))
+
+
+if __name__ == '__main__':
+    main()